@@ -1,16 +1,31 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pickle
 import warnings
 import os
+import sys
 warnings.filterwarnings('ignore')
 
+# Make the project-level src package importable when launched via `streamlit run app/app.py`
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.aggregates import AggregateCube
+from src.anomalies import detect_anomalies
+from src.chart_data import PayloadMeter, downsample_lines, histogram_frame
+from src.choropleth import ChoroplethFrames, window_figure
+from src.data_store import RAW_CSV_PATH, data_version
+from src.exports import FORMATS, MIME_TYPES, ExportCache, export_bytes, export_file_name
+from src.figure_cache import FigureCache, figure_key
+from src.imputation import STRATEGIES, impute
+from src.indicators import YOUTH_UNEMPLOYMENT, indicator_version, load_indicator_store
+from src.instrumentation import mark_miss, span, start_trace
+from src.query import DataIndex
+from src.regions import REGION_TABLE_VERSION, add_region_columns, countries_only
+from src.summaries import CountrySummaries
+from src.warmup import Warmup
+
 # Set page configuration
 st.set_page_config(
     page_title="Global Youth Unemployment Analysis",
@@ -53,32 +68,380 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load data
-@st.cache_data
-def load_data():
+# Current data version (content hash of the raw CSV); every loader below is keyed on it,
+# so a refreshed extract (python -m src.refresh) is picked up without clearing caches
+def current_data_version():
+    try:
+        return data_version(RAW_CSV_PATH)
+    except OSError:
+        return None
+
+# Under `run_app.py serve` the frame and aggregates are memory-mapped from the single copy
+# the launcher published (src/shared.py) instead of being built by every worker process
+def attach_shared(name, version):
+    if not os.environ.get('APP_SHARED_DIR'):
+        return None
+    from src.shared import attach
+    return attach(name, version, REGION_TABLE_VERSION)
+
+# Loaders below that take a ``view`` keep one entry per data version for the raw frame
+# (view=None) and for each imputation strategy the Data Explorer can switch to
+VIEW_CACHE_ENTRIES = 2 * (len(STRATEGIES) + 1)
+
+# Long (country, year, indicator, value) store over every registered indicator
+# (data/indicators.csv), memory-mapped and shared; pages pivot only what they use.
+# Keyed on the combined version of all sources, so a change to any of them is picked up
+@st.cache_resource(max_entries=2)
+def load_indicators(indicators_version):
+    return load_indicator_store()
+
+# Load data (one read-only frame shared by all sessions; pages never modify it)
+@st.cache_resource(max_entries=2)
+def load_data(version):
+    mark_miss('load_data')
+    shared = attach_shared('data', version)
+    if shared is not None:
+        return shared
     try:
-        # Get the project root directory (parent of the app directory)
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(app_dir)
-        data_path = os.path.join(project_root, 'data', 'youth_unemployment_global.csv')
-        df = pd.read_csv(data_path)
+        # Youth unemployment pivoted from the indicator store onto the full country x year grid
+        with span('indicator pivot', 'load'):
+            df = load_indicators(indicator_version()).wide([YOUTH_UNEMPLOYMENT], complete_grid=True)
+        # Region / income group / aggregate flag, resolved once per country code
+        with span('region lookup', 'load'):
+            df = add_region_columns(df)
         return df
     except Exception as e:
         st.error(f"Could not load data file: {str(e)}")
         return None
 
-# Load processed data if available
-@st.cache_data
-def load_processed_data():
-    try:
-        # Get the project root directory (parent of the app directory)
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(app_dir)
-        processed_path = os.path.join(project_root, 'data', 'youth_unemployment_processed.csv')
-        df_processed = pd.read_csv(processed_path)
-        return df_processed
-    except:
-        return None
+# Gap-filled frame for one imputation strategy (src/imputation.py) with its imputed-cell
+# bitmap, built once per strategy and data version
+@st.cache_resource(max_entries=VIEW_CACHE_ENTRIES)
+def load_imputation(_df, version, strategy):
+    mark_miss('load_imputation')
+    return impute(_df, strategy)
+
+# Aggregate cube (sum/count/sum of squares per Year x Country), built once per data version.
+# WDI aggregate rows (World, income groups, regions) are excluded from country-level stats.
+@st.cache_resource(max_entries=VIEW_CACHE_ENTRIES)
+def load_aggregate_cube(_df, version, region_version, view=None):
+    mark_miss('load_aggregate_cube')
+    shared = attach_shared('cube', version) if view is None else None
+    return shared or AggregateCube(countries_only(_df))
+
+# Sorted (Year, Country) / (Country, Year) layouts for range and country queries
+@st.cache_resource(max_entries=VIEW_CACHE_ENTRIES)
+def load_data_index(_df, version, view=None):
+    mark_miss('load_data_index')
+    shared = attach_shared('index', version) if view is None else None
+    return shared or DataIndex(_df)
+
+# Per-country moments and min/max per block of years, plus the sorted country option list,
+# built once per data version; any year range / country selection merges a few blocks
+@st.cache_resource(max_entries=VIEW_CACHE_ENTRIES)
+def load_country_summaries(_df, version, view=None):
+    mark_miss('load_country_summaries')
+    shared = attach_shared('summaries', version) if view is None else None
+    return shared or CountrySummaries(_df)
+
+# Spikes, level shifts and change points of every country series (src/anomalies.py); one
+# vectorized pass over the (country x year) grid, recomputed only when the data version changes
+@st.cache_resource(max_entries=2)
+def load_anomalies(_df, version, region_version):
+    mark_miss('load_anomalies')
+    return detect_anomalies(countries_only(_df))
+
+# Per-year (ISO3, value) grid of the World Map (src/choropleth.py), WDI aggregates excluded
+@st.cache_resource(max_entries=2)
+def load_choropleth_frames(_df, version, region_version):
+    mark_miss('load_choropleth_frames')
+    return ChoroplethFrames(_df)
+
+# Forecasting engine (trained once per data version, then loaded from models/).
+# Model libraries (scikit-learn, joblib) are imported here, on first use, to keep startup light.
+@st.cache_resource(max_entries=2, show_spinner="Training forecasting model...")
+def load_forecaster(_df, version):
+    mark_miss('load_forecaster')
+    from src.forecasting import load_or_train
+    return load_or_train(_df, version)
+
+# Model comparison written by `python -m src.training`, reloaded when the file changes
+@st.cache_data(max_entries=2)
+def load_training_results(modified):
+    mark_miss('load_training_results')
+    from src.training import load_results
+    return load_results()
+
+def training_results_modified():
+    from src.training import TRAINING_RESULTS_PATH
+    return os.path.getmtime(TRAINING_RESULTS_PATH) if os.path.exists(TRAINING_RESULTS_PATH) else None
+
+# Serialized figures shared by all sessions, keyed on chart id, filter state and data version
+@st.cache_resource
+def load_figure_cache():
+    return FigureCache()
+
+figure_cache = load_figure_cache()
+payload_meter = PayloadMeter()
+
+# Generated export files shared by all sessions, keyed like the figures plus the file format
+@st.cache_resource
+def load_export_cache():
+    return ExportCache()
+
+export_cache = load_export_cache()
+
+# Default filter state, shared by the sidebar widgets and the warm-up
+DEFAULT_YEAR_RANGE = (2000, 2024)
+DEFAULT_COUNTRY_COUNT = 5
+
+# Years on each side of the visible one shipped with the World Map as animation frames
+MAP_PREFETCH_YEARS = 2
+
+def chart_key(chart_id, year_range=None, countries=None, params=(), view=None):
+    data_key = (version, REGION_TABLE_VERSION) if view is None else (version, REGION_TABLE_VERSION, view)
+    return figure_key(chart_id, year_range, countries, data_key, params)
+
+# Charts are built through render_chart: ``build`` (aggregation + Plotly) only runs on a
+# cache miss, and the JSON payload (measured once per build) is shown in the debug panel
+def render_chart(chart_id, build, year_range=None, countries=None, params=(), view=None):
+    key = chart_key(chart_id, year_range, countries, params, view)
+    name = f'chart:{chart_id}'
+
+    def traced_build():
+        mark_miss(name)
+        with span(f'{chart_id} build', 'chart'):
+            return build()
+
+    fig = trace.cached_call(name, figure_cache.get_or_build, key, traced_build, category='chart')
+    if not fig.data:
+        # Nothing to draw for these filters (e.g. years before the series start)
+        st.info("No data to chart for the current selection.")
+        return
+    if st.session_state.get('debug_panel'):
+        payload_meter.record(chart_id, figure_cache.entry_bytes(key))
+    with trace.span(f'{chart_id} render', 'render'):
+        st.plotly_chart(fig, use_container_width=True)
+
+# Download buttons get a callable: the file is only written when the button is clicked
+# (on Streamlit's download thread, not in the rerun) and then kept in the export cache
+def export_button(label, table, build, fmt, year_range=None, countries=None, view=None):
+    key = chart_key(f'export:{table}', year_range, countries, (fmt,), view)
+    st.download_button(
+        label,
+        data=lambda: export_cache.get_or_build(key, lambda: export_bytes(build(), fmt, sheet_name=table)),
+        file_name=export_file_name(table, fmt, year_range, view),
+        mime=MIME_TYPES[fmt],
+        on_click='ignore',
+        key=f'export_{table}',
+    )
+
+# Figure builders of the Overview and Data Explorer charts, at module level so the warm-up
+# below can build their default states before anyone opens those pages
+def regional_overview_figure(cube):
+    regional_stats = cube.region_stats()['mean'].sort_values(ascending=False)
+    fig = px.bar(
+        regional_stats,
+        orientation='h',
+        title="Average Youth Unemployment by Region",
+        labels={'value': 'Unemployment Rate (%)', 'index': 'Region'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+def temporal_trends_figure(cube):
+    yearly_avg = cube.yearly_stats().rename(columns={'mean': 'YouthUnemployment'})
+    fig = px.line(
+        yearly_avg,
+        x='Year',
+        y='YouthUnemployment',
+        title="Global Youth Unemployment Trend",
+        labels={'YouthUnemployment': 'Unemployment Rate (%)'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+# Distribution plot (binned server-side: 50 bars instead of every data point)
+def distribution_figure(df_filtered):
+    bins = histogram_frame(df_filtered['YouthUnemployment'], nbins=50)
+    fig = px.bar(
+        bins,
+        x='bin_mid',
+        y='count',
+        hover_data={'bin_start': ':.2f', 'bin_end': ':.2f', 'bin_mid': False},
+        title="Distribution of Youth Unemployment Rates",
+        labels={'bin_mid': 'Unemployment Rate (%)', 'count': 'count'}
+    )
+    fig.update_traces(width=(bins['bin_end'] - bins['bin_start']).to_numpy())
+    fig.update_layout(bargap=0)
+    return fig
+
+def regional_comparison_figure(cube, year_range):
+    regional_stats = cube.region_stats(year_range).round(2)
+    return px.bar(
+        regional_stats.reset_index(),
+        x='region',
+        y='mean',
+        error_y='std',
+        title="Average Youth Unemployment by Region",
+        labels={'mean': 'Average Rate (%)', 'region': 'Region'}
+    )
+
+def regional_trends_figure(cube, year_range):
+    trends = cube.region_yearly_means(year_range)
+    return px.line(
+        downsample_lines(trends, 'Year', 'YouthUnemployment', color='region'),
+        x='Year',
+        y='YouthUnemployment',
+        color='region',
+        title="Youth Unemployment Trends by Region",
+        labels={'YouthUnemployment': 'Unemployment Rate (%)'}
+    )
+
+# Country comparison chart (LTTB-downsampled if over the point budget)
+def country_comparison_figure(data_index, year_range, selected_countries):
+    country_data = data_index.select(year_range=year_range, countries=selected_countries)
+    return px.line(
+        downsample_lines(country_data[['Country', 'Year', 'YouthUnemployment']], 'Year', 'YouthUnemployment', color='Country'),
+        x='Year',
+        y='YouthUnemployment',
+        color='Country',
+        title=f"Youth Unemployment Comparison: {', '.join(selected_countries[:3])}{'...' if len(selected_countries) > 3 else ''}",
+        labels={'YouthUnemployment': 'Unemployment Rate (%)'}
+    )
+
+def yearly_trend_figure(yearly_stats):
+    return px.line(
+        yearly_stats,
+        x='Year',
+        y='mean',
+        error_y='std',
+        title="Global Youth Unemployment Trend with Variability",
+        labels={'mean': 'Average Rate (%)'}
+    )
+
+# Observed vs imputed country-years per year (Temporal tab with an imputed view)
+def imputed_coverage_figure(imputation, year_range):
+    coverage = imputation.coverage()
+    coverage = coverage[(coverage['Year'] >= year_range[0]) & (coverage['Year'] <= year_range[1])]
+    return px.bar(
+        coverage.melt(id_vars='Year', var_name='cells', value_name='count'),
+        x='Year',
+        y='count',
+        color='cells',
+        title=f"Data Coverage Over Time ({imputation.label})",
+        labels={'count': 'Number of Countries'}
+    )
+
+def coverage_figure(yearly_stats):
+    return px.bar(
+        yearly_stats,
+        x='Year',
+        y='count',
+        title="Data Coverage Over Time",
+        labels={'count': 'Number of Countries'}
+    )
+
+# Detected events per year and kind, within the selected years
+def anomaly_timeline_figure(anomalies, year_range):
+    events = anomalies.in_range(year_range)
+    counts = events.groupby(['Year', 'kind']).size().rename('events').reset_index()
+    return px.bar(
+        counts,
+        x='Year',
+        y='events',
+        color='kind',
+        title="Detected Anomalies per Year",
+        labels={'events': 'Number of Events', 'kind': 'Type'}
+    )
+
+# One country's series with its events marked (change points as dashed lines)
+def anomaly_country_figure(data_index, anomalies, country):
+    series = data_index.select(countries=[country])[['Year', 'YouthUnemployment']].dropna()
+    events = anomalies.country_events(country)
+    fig = px.line(
+        series,
+        x='Year',
+        y='YouthUnemployment',
+        title=f"Youth Unemployment and Detected Anomalies: {country}",
+        labels={'YouthUnemployment': 'Unemployment Rate (%)'}
+    )
+    markers = events[events['kind'] != 'change point']
+    for kind, symbol in (('spike', 'x'), ('level shift', 'diamond')):
+        points = markers[markers['kind'] == kind]
+        fig.add_scatter(x=points['Year'], y=points['value'], mode='markers', name=kind,
+                        marker=dict(symbol=symbol, size=11), text=points['detail'])
+    for _, event in events[events['kind'] == 'change point'].iterrows():
+        fig.add_vline(x=event['Year'] - 0.5, line_dash='dash', line_color='firebrick',
+                      annotation_text=event['detail'])
+    return fig
+
+def default_countries(summaries):
+    countries = summaries.country_options
+    return countries[:DEFAULT_COUNTRY_COUNT] if len(countries) > DEFAULT_COUNTRY_COUNT else countries
+
+# Background warm-up (src/warmup.py), started by the first script run in a server process:
+# loaders first, then the default Overview / Data Explorer figures, on a thread pool.
+# Sessions never wait for it; whatever is not warm yet is computed on demand as before.
+def warmup_stages(version):
+    data = lambda: load_data(version)
+    cube = lambda: load_aggregate_cube(data(), version, REGION_TABLE_VERSION)
+    data_index = lambda: load_data_index(data(), version)
+    summaries = lambda: load_country_summaries(data(), version)
+    anomalies = lambda: load_anomalies(data(), version, REGION_TABLE_VERSION)
+    choropleth = lambda: load_choropleth_frames(data(), version, REGION_TABLE_VERSION)
+    year_range = DEFAULT_YEAR_RANGE
+
+    def warm_chart(chart_id, build, year_range=None, countries=None):
+        return chart_id, lambda: figure_cache.get_or_build(chart_key(chart_id, year_range, countries), build)
+
+    def warm_map():
+        frames = choropleth()
+        year = frames.latest_year(year_range)
+        if year is not None:
+            figure_cache.get_or_build(chart_key('world_map', year_range, params=(year,)),
+                                      lambda: window_figure(frames, year, MAP_PREFETCH_YEARS, year_range))
+
+    return [
+        [('load_data', data)],
+        [
+            ('load_aggregate_cube', cube),
+            ('load_data_index', data_index),
+            ('load_country_summaries', summaries),
+            ('load_anomalies', anomalies),
+            ('load_choropleth_frames', choropleth),
+            ('load_training_results', lambda: load_training_results(training_results_modified())),
+            ('load_forecaster', lambda: load_forecaster(data(), version)),
+        ],
+        [
+            warm_chart('overview_regions', lambda: regional_overview_figure(cube())),
+            warm_chart('overview_trend', lambda: temporal_trends_figure(cube())),
+            warm_chart('explorer_distribution', lambda: distribution_figure(data_index().select(year_range=year_range)), year_range),
+            warm_chart('explorer_region_bar', lambda: regional_comparison_figure(cube(), year_range), year_range),
+            warm_chart('explorer_region_trends', lambda: regional_trends_figure(cube(), year_range), year_range),
+            warm_chart('explorer_country_comparison',
+                       lambda: country_comparison_figure(data_index(), year_range, default_countries(summaries())),
+                       year_range, default_countries(summaries())),
+            warm_chart('explorer_yearly_trend', lambda: yearly_trend_figure(cube().yearly_stats(year_range)), year_range),
+            warm_chart('explorer_coverage', lambda: coverage_figure(cube().yearly_stats(year_range)), year_range),
+            warm_chart('explorer_anomaly_timeline', lambda: anomaly_timeline_figure(anomalies(), year_range), year_range),
+            ('world_map', warm_map),
+        ],
+    ]
+
+@st.cache_resource(max_entries=2)
+def start_warmup(version):
+    return Warmup(warmup_stages(version), name='app-warmup').start()
+
+def warmup_enabled():
+    # Off in Streamlit's bare mode (no server) and with APP_WARMUP=0 (cold-cache benchmarks)
+    from streamlit import runtime
+    return runtime.exists() and os.environ.get('APP_WARMUP', '1') != '0'
+
+def current_session_id():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
 
 # Main title
 st.markdown('<h1 class="main-header">🌍 Global Youth Unemployment Analysis & Prediction</h1>', unsafe_allow_html=True)
@@ -87,29 +450,47 @@ st.markdown('<h1 class="main-header">🌍 Global Youth Unemployment Analysis & P
 st.sidebar.title("📊 Navigation")
 page = st.sidebar.radio(
     "Choose a section:",
-    ["🏠 Overview", "📈 Data Explorer", "🔍 Model Insights", "🎯 Predictions", "📋 About"]
+    ["🏠 Overview", "📈 Data Explorer", "🗺️ World Map", "🔍 Model Insights", "🎯 Predictions", "📋 About"]
 )
 
+# Per-rerun timings, cache outcomes and frame sizes (debug panel + logs/metrics.jsonl)
+trace = start_trace(session_id=current_session_id(), page=page)
+
 # Load data
-df = load_data()
-df_processed = load_processed_data()
+with trace.span('data_version', 'load'):
+    version = current_data_version()
+warmup = start_warmup(version) if warmup_enabled() else None
+df = trace.cached_call('load_data', load_data, version)
 
 if df is not None:
+    cube = trace.cached_call('load_aggregate_cube', load_aggregate_cube, df, version, REGION_TABLE_VERSION)
+    data_index = trace.cached_call('load_data_index', load_data_index, df, version)
+
     # Sidebar filters (global)
     st.sidebar.markdown("---")
     st.sidebar.markdown("### Global Filters")
 
-    # Year range filter
-    years = sorted(df['Year'].unique())
+    # Year range filter (bounds from the index, no per-rerun scan of the frame)
     year_range = st.sidebar.slider(
         "Select Year Range",
-        min_value=int(min(years)),
-        max_value=int(max(years)),
-        value=(2000, 2024)
+        min_value=data_index.min_year,
+        max_value=data_index.max_year,
+        value=DEFAULT_YEAR_RANGE
     )
 
-    # Filter data based on year range
-    df_filtered = df[(df['Year'] >= year_range[0]) & (df['Year'] <= year_range[1])]
+    # Filter data based on year range (contiguous slice of the year-sorted layout)
+    with trace.span('year filter', 'filter'):
+        df_filtered = data_index.select(year_range=year_range)
+
+    # Readiness of the background warm-up
+    if warmup is not None and not warmup.ready:
+        done, total = warmup.progress
+        st.sidebar.caption(f"⏳ Warming up caches in the background ({done}/{total})")
+
+    st.sidebar.checkbox("Show debug panel", key='debug_panel')
+    if st.session_state.get('debug_panel'):
+        trace.record_size('df', df)
+        trace.record_size('df_filtered', df_filtered)
 
     if page == "🏠 Overview":
         st.markdown('<h2 class="sub-header">Project Overview</h2>', unsafe_allow_html=True)
@@ -117,16 +498,16 @@ if df is not None:
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("Total Countries", f"{df['Country'].nunique():,}")
+            st.metric("Total Countries", f"{len(cube.countries):,}")
 
         with col2:
-            st.metric("Years Covered", f"{len(years)}")
+            st.metric("Years Covered", f"{data_index.max_year - data_index.min_year + 1}")
 
         with col3:
             st.metric("Data Points", f"{len(df):,}")
 
         with col4:
-            avg_unemployment = df['YouthUnemployment'].mean()
+            avg_unemployment = cube.overall_mean()
             st.metric("Global Average", f"{avg_unemployment:.1f}%")
 
         st.markdown("""
@@ -141,35 +522,17 @@ if df is not None:
         # Key insights
         st.markdown('<h3 class="sub-header">Key Insights</h3>', unsafe_allow_html=True)
 
-        if df_processed is not None:
-            # Regional analysis
-            regional_stats = df_processed.groupby('region')['YouthUnemployment'].mean().sort_values(ascending=False)
+        col1, col2 = st.columns(2)
 
-            col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### 📊 Regional Overview")
 
-            with col1:
-                st.markdown("#### 📊 Regional Overview")
-                fig = px.bar(
-                    regional_stats,
-                    orientation='h',
-                    title="Average Youth Unemployment by Region",
-                    labels={'value': 'Unemployment Rate (%)', 'index': 'Region'}
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+            render_chart('overview_regions', lambda: regional_overview_figure(cube))
 
-            with col2:
-                st.markdown("#### 📈 Temporal Trends")
-                yearly_avg = df_processed.groupby('Year')['YouthUnemployment'].mean().reset_index()
-                fig = px.line(
-                    yearly_avg,
-                    x='Year',
-                    y='YouthUnemployment',
-                    title="Global Youth Unemployment Trend",
-                    labels={'YouthUnemployment': 'Unemployment Rate (%)'}
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            st.markdown("#### 📈 Temporal Trends")
+
+            render_chart('overview_trend', lambda: temporal_trends_figure(cube))
 
         # Methodology overview
         st.markdown('<h3 class="sub-header">Methodology</h3>', unsafe_allow_html=True)
@@ -195,246 +558,340 @@ if df is not None:
     elif page == "📈 Data Explorer":
         st.markdown('<h2 class="sub-header">Data Explorer</h2>', unsafe_allow_html=True)
 
-        tab1, tab2, tab3, tab4 = st.tabs(["🌍 Global View", "📊 Regional Analysis", "🇺🇸 Country Comparison", "📅 Temporal Analysis"])
+        # Raw values or an imputed view; each view has its own cached frame, cube, index and summaries
+        view_label = st.radio("Values:", ['Raw'] + list(STRATEGIES.values()), horizontal=True, key='explorer_view')
+        view = next((strategy for strategy, label in STRATEGIES.items() if label == view_label), None)
+        explorer_df, imputation = df, None
+        # Anomalies are detected on raw values, so their drill-down keeps the raw index
+        raw_index = data_index
+        if view is not None:
+            imputation = trace.cached_call('load_imputation', load_imputation, df, version, view)
+            explorer_df = imputation.frame
+            cube = trace.cached_call('load_aggregate_cube', load_aggregate_cube, explorer_df, version,
+                                     REGION_TABLE_VERSION, view)
+            data_index = trace.cached_call('load_data_index', load_data_index, explorer_df, version, view)
+            with trace.span('year filter', 'filter'):
+                df_filtered = data_index.select(year_range=year_range)
+            st.caption(
+                f"{imputation.label}: {imputation.n_imputed:,} of {imputation.n_missing:,} missing "
+                f"country-years filled ({imputation.seconds * 1000:.0f} ms, cached per strategy)"
+            )
+
+        # Streamlit runs every tab's body on each rerun; the tab spans show what each one costs
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(["🌍 Global View", "📊 Regional Analysis", "🇺🇸 Country Comparison", "📅 Temporal Analysis", "🚨 Anomalies"])
 
-        with tab1:
+        with tab1, trace.span('tab:global_view', 'tab'):
             st.markdown("### Global Youth Unemployment Overview")
 
             # Summary statistics
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Global Average", f"{df_filtered['YouthUnemployment'].mean():.2f}%")
+                st.metric("Global Average", f"{cube.overall_mean(year_range):.2f}%")
             with col2:
                 st.metric("Highest Rate", f"{df_filtered['YouthUnemployment'].max():.2f}%")
             with col3:
                 st.metric("Lowest Rate", f"{df_filtered['YouthUnemployment'].min():.2f}%")
 
-            # Distribution plot
-            fig = px.histogram(
-                df_filtered,
-                x='YouthUnemployment',
-                nbins=50,
-                title="Distribution of Youth Unemployment Rates",
-                labels={'YouthUnemployment': 'Unemployment Rate (%)'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            # Distribution plot (binned server-side: 50 bars instead of every data point)
+            render_chart('explorer_distribution', lambda: distribution_figure(df_filtered), year_range, view=view)
 
-        with tab2:
+        with tab2, trace.span('tab:regional_analysis', 'tab'):
             st.markdown("### Regional Analysis")
 
-            if df_processed is not None and 'region' in df_processed.columns:
-                # Regional statistics
-                regional_data = df_filtered.copy()
-                if 'region' not in regional_data.columns:
-                    # Simple region mapping for display
-                    region_map = {
-                        'Africa': ['Africa', 'Algeria', 'South Africa', 'Nigeria'],
-                        'Asia': ['Asia', 'China', 'India', 'Japan'],
-                        'Europe': ['Europe', 'Germany', 'France', 'United Kingdom'],
-                        'North America': ['North America', 'United States', 'Canada'],
-                        'South America': ['South America', 'Brazil', 'Argentina'],
-                        'Other': ['Other']
-                    }
-
-                    def get_region(country):
-                        for region, countries in region_map.items():
-                            if any(c in country for c in countries):
-                                return region
-                        return 'Other'
-
-                    regional_data['region'] = regional_data['Country'].apply(get_region)
-
-                regional_stats = regional_data.groupby('region')['YouthUnemployment'].agg(['mean', 'std', 'count']).round(2)
-
-                # Regional comparison
-                fig = px.bar(
-                    regional_stats.reset_index(),
-                    x='region',
-                    y='mean',
-                    error_y='std',
-                    title="Average Youth Unemployment by Region",
-                    labels={'mean': 'Average Rate (%)', 'region': 'Region'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Regional trends over time
-                regional_trends = regional_data.groupby(['Year', 'region'])['YouthUnemployment'].mean().reset_index()
-                fig = px.line(
-                    regional_trends,
-                    x='Year',
-                    y='YouthUnemployment',
-                    color='region',
-                    title="Youth Unemployment Trends by Region",
-                    labels={'YouthUnemployment': 'Unemployment Rate (%)'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-        with tab3:
+            # Regional comparison
+            render_chart('explorer_region_bar', lambda: regional_comparison_figure(cube, year_range), year_range, view=view)
+
+            # Regional trends over time
+            render_chart('explorer_region_trends', lambda: regional_trends_figure(cube, year_range), year_range, view=view)
+
+        with tab3, trace.span('tab:country_comparison', 'tab'):
             st.markdown("### Country Comparison")
 
-            # Country selection
-            countries = sorted(df_filtered['Country'].unique())
+            # Country selection (option list precomputed per data version)
+            summaries = trace.cached_call('load_country_summaries', load_country_summaries, explorer_df, version, view)
+            countries = summaries.country_options
             selected_countries = st.multiselect(
                 "Select countries to compare:",
                 countries,
-                default=countries[:5] if len(countries) > 5 else countries,
+                default=default_countries(summaries),
                 max_selections=10
             )
 
             if selected_countries:
-                country_data = df_filtered[df_filtered['Country'].isin(selected_countries)]
-
-                # Country comparison chart
-                fig = px.line(
-                    country_data,
-                    x='Year',
-                    y='YouthUnemployment',
-                    color='Country',
-                    title=f"Youth Unemployment Comparison: {', '.join(selected_countries[:3])}{'...' if len(selected_countries) > 3 else ''}",
-                    labels={'YouthUnemployment': 'Unemployment Rate (%)'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Summary table
-                country_summary = country_data.groupby('Country')['YouthUnemployment'].agg(['mean', 'std', 'min', 'max']).round(2)
+                # Country comparison chart (LTTB-downsampled if over the point budget)
+                render_chart('explorer_country_comparison',
+                             lambda: country_comparison_figure(data_index, year_range, selected_countries),
+                             year_range, selected_countries, view=view)
+
+                # Summary table, merged from the precomputed year blocks
+                with trace.span('country summary', 'aggregate'):
+                    country_summary = summaries.stats(selected_countries, year_range).round(2)
                 st.dataframe(country_summary)
 
-        with tab4:
+        with tab4, trace.span('tab:temporal_analysis', 'tab'):
             st.markdown("### Temporal Analysis")
 
             # Year-over-year analysis
-            yearly_stats = df_filtered.groupby('Year')['YouthUnemployment'].agg(['mean', 'std', 'count']).reset_index()
+            yearly_stats = cube.yearly_stats(year_range)
 
             col1, col2 = st.columns(2)
 
             with col1:
-                fig = px.line(
-                    yearly_stats,
-                    x='Year',
-                    y='mean',
-                    error_y='std',
-                    title="Global Youth Unemployment Trend with Variability",
-                    labels={'mean': 'Average Rate (%)'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                render_chart('explorer_yearly_trend', lambda: yearly_trend_figure(yearly_stats), year_range, view=view)
 
             with col2:
-                fig = px.bar(
-                    yearly_stats,
-                    x='Year',
-                    y='count',
-                    title="Data Coverage Over Time",
-                    labels={'count': 'Number of Countries'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                if imputation is None:
+                    render_chart('explorer_coverage', lambda: coverage_figure(yearly_stats), year_range)
+                else:
+                    render_chart('explorer_coverage', lambda: imputed_coverage_figure(imputation, year_range),
+                                 year_range, view=view)
+
+        with tab5, trace.span('tab:anomalies', 'tab'):
+            st.markdown("### Anomalies & Structural Breaks")
+
+            anomalies = trace.cached_call('load_anomalies', load_anomalies, df, version, REGION_TABLE_VERSION)
+            st.caption(
+                f"Spikes (rolling z-score), level shifts (CUSUM) and change points (penalized mean shift) "
+                f"over {len(anomalies.countries)} country series (raw values), "
+                f"detected in {anomalies.seconds * 1000:.0f} ms"
+            )
 
-    elif page == "🔍 Model Insights":
-        st.markdown('<h2 class="sub-header">Model Insights & Performance</h2>', unsafe_allow_html=True)
+            # Early-warning alert list: strongest events of the latest years of data
+            alerts = anomalies.alerts(recent_years=5)
+            st.markdown(f"#### 🔔 Alerts since {anomalies.last_year - 4}")
+            if alerts.empty:
+                st.info("No anomalies detected in the latest years of data.")
+            else:
+                st.dataframe(alerts.round(2), hide_index=True)
 
-        # Model performance section
-        st.markdown("### Model Performance Comparison")
-
-        # Sample model results (would be loaded from actual results)
-        model_results = pd.DataFrame({
-            'Model': ['Linear Regression', 'Random Forest', 'Gradient Boosting', 'XGBoost', 'Neural Network'],
-            'RMSE': [2.8, 2.1, 2.3, 2.0, 2.5],
-            'MAE': [2.2, 1.6, 1.8, 1.5, 2.0],
-            'R²': [0.72, 0.85, 0.82, 0.87, 0.78]
-        })
-
-        # Performance comparison
-        fig = px.bar(
-            model_results,
-            x='Model',
-            y=['RMSE', 'MAE'],
-            title="Model Performance Comparison",
-            barmode='group',
-            labels={'value': 'Error Metric', 'variable': 'Metric'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+            # Events within the selected years
+            counts = anomalies.in_range(year_range)['kind'].value_counts()
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Spikes", f"{counts.get('spike', 0):,}")
+            with col2:
+                st.metric("Level Shifts", f"{counts.get('level shift', 0):,}")
+            with col3:
+                st.metric("Change Points", f"{counts.get('change point', 0):,}")
+
+            if counts.empty:
+                st.info("No anomalies detected in this range.")
+            else:
+                render_chart('explorer_anomaly_timeline', lambda: anomaly_timeline_figure(anomalies, year_range), year_range)
+
+            # Drill-down into one country (those with alerts first)
+            flagged = list(dict.fromkeys(alerts['Country'])) + sorted(set(anomalies.events['Country']) - set(alerts['Country']))
+            if flagged:
+                country = st.selectbox("Inspect a country:", flagged)
+                render_chart('explorer_anomaly_country',
+                             lambda: anomaly_country_figure(raw_index, anomalies, country),
+                             countries=[country])
+                st.dataframe(anomalies.country_events(country).drop(columns='Country').round(2), hide_index=True)
+
+        # Files of the current filter state (and value view), written on click in chunks of the indexed rows
+        with st.expander("📥 Export data"):
+            export_format = st.radio("Format:", list(FORMATS), format_func=FORMATS.get, horizontal=True,
+                                     key='export_format')
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                export_button(f"Filtered rows ({len(df_filtered):,})", 'rows', lambda: df_filtered,
+                              export_format, year_range, view=view)
+            with col2:
+                export_button("Regional summary", 'regions', lambda: cube.region_stats(year_range).reset_index(),
+                              export_format, year_range, view=view)
+            with col3:
+                if selected_countries:
+                    export_button("Country summary", 'countries',
+                                  lambda: summaries.stats(selected_countries, year_range).reset_index(),
+                                  export_format, year_range, selected_countries, view=view)
+                else:
+                    st.caption("Select countries to export their summary.")
+            if export_format == 'xlsx':
+                st.caption("Excel files are written row by row and take a few seconds for long year ranges.")
+
+    elif page == "🗺️ World Map":
+        st.markdown('<h2 class="sub-header">World Map</h2>', unsafe_allow_html=True)
+
+        frames = trace.cached_call('load_choropleth_frames', load_choropleth_frames, df, version, REGION_TABLE_VERSION)
+        map_years = [int(y) for y in frames.years_with_data if year_range[0] <= y <= year_range[1]]
+
+        if not map_years:
+            st.info("No country data in the selected year range.")
+        else:
+            map_year = st.select_slider("Year", options=map_years, value=map_years[-1])
+
+            # Only this year and its neighbours are sent, as frames the map's own slider and
+            # play button step through in the browser; each window is built once (figure cache)
+            render_chart('world_map', lambda: window_figure(frames, map_year, MAP_PREFETCH_YEARS, year_range),
+                         year_range, params=(map_year,))
+            st.caption(
+                f"The map's slider and ▶ step through {', '.join(map(str, frames.window(map_year, MAP_PREFETCH_YEARS, year_range)))} "
+                "without reloading; move the Year slider above to load other years."
+            )
 
-        # R² comparison
-        fig = px.bar(
-            model_results,
-            x='Model',
-            y='R²',
-            title="Model R² Scores (Higher is Better)",
-            color='R²',
-            color_continuous_scale='viridis'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+            year_frame = frames.frame(map_year)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Countries with Data", f"{len(year_frame):,}")
+            with col2:
+                st.metric("Average Rate", f"{year_frame['value'].mean():.2f}%")
+            with col3:
+                highest = year_frame.loc[year_frame['value'].idxmax()]
+                st.metric("Highest Rate", f"{highest['value']:.2f}%", help=highest['Country'])
 
-        # Feature importance (sample)
-        st.markdown("### Feature Importance Analysis")
-
-        feature_importance = pd.DataFrame({
-            'Feature': ['Rolling Mean 5yr', 'Unemployment Lag1', 'Year from Start', 'Rolling Std 3yr', 'YOY Change'],
-            'Importance': [0.35, 0.28, 0.15, 0.12, 0.10]
-        })
-
-        fig = px.bar(
-            feature_importance,
-            x='Importance',
-            y='Feature',
-            orientation='h',
-            title="Top Predictive Features",
-            labels={'Importance': 'Relative Importance'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    elif page == "🔍 Model Insights":
+        st.markdown('<h2 class="sub-header">Model Insights & Performance</h2>', unsafe_allow_html=True)
 
-        # Model interpretation
-        st.markdown("### Key Model Insights")
-        st.markdown("""
-        **Best Performing Model:** XGBoost (R² = 0.87, RMSE = 2.0%)
-
-        **Key Findings:**
-        - Historical trends are the strongest predictors
-        - Rolling averages provide stability to predictions
-        - Year-over-year changes capture volatility
-        - Regional differences are significant but secondary to temporal patterns
-
-        **Business Implications:**
-        - Predictions are most reliable for short-term forecasting (1-2 years)
-        - Models perform better for countries with stable historical data
-        - Additional economic indicators would improve accuracy
-        """)
+        training = trace.cached_call('load_training_results', load_training_results, training_results_modified())
+
+        if training is None:
+            st.info("No model comparison results yet. Run `python -m src.training` to train and cross-validate the models.")
+        else:
+            from src.training import importance_frame, results_frame
+
+            if training['data_version'] != version:
+                st.warning("These results were trained on an earlier version of the dataset. "
+                           "Re-run `python -m src.training` to refresh them.")
+
+            # Model performance section
+            st.markdown("### Model Performance Comparison")
+            st.caption(f"One-year-ahead forecasts. Holdout: {training['validation_start_year']}+ "
+                       f"({training['n_test']:,} rows); {training['cv_folds']}-fold time-series CV on earlier years "
+                       f"({training['n_train']:,} rows); best of each model's hyperparameter grid.")
+
+            model_results = results_frame(training)
+            results_token = (training['data_version'], training_results_modified())
+
+            # Performance comparison
+            render_chart('model_performance', lambda: px.bar(
+                model_results,
+                x='Model',
+                y=['RMSE', 'MAE', 'CV RMSE'],
+                title="Model Performance Comparison",
+                barmode='group',
+                labels={'value': 'Error Metric', 'variable': 'Metric'}
+            ), params=results_token)
+
+            # R² comparison
+            render_chart('model_r2', lambda: px.bar(
+                model_results,
+                x='Model',
+                y='R²',
+                title="Model R² Scores (Higher is Better)",
+                color='R²',
+                color_continuous_scale='viridis'
+            ), params=results_token)
+
+            st.dataframe(model_results.set_index('Model').round(3))
+
+            # Feature importance of the best model
+            best = training['results'][0]
+            st.markdown("### Feature Importance Analysis")
+
+            render_chart('model_importance', lambda: px.bar(
+                importance_frame(training).head(10).iloc[::-1],
+                x='Importance',
+                y='Feature',
+                orientation='h',
+                title=f"Top Predictive Features ({best['Model']}, permutation importance)",
+                labels={'Importance': 'RMSE increase when shuffled'}
+            ), params=results_token)
+
+            # Model interpretation
+            st.markdown("### Key Model Insights")
+            st.markdown(f"""
+            **Best Performing Model:** {best['Model']} (R² = {best['R²']:.2f}, RMSE = {best['RMSE']:.1f}%, CV RMSE = {best['CV RMSE']:.1f}%)
+
+            **Key Findings:**
+            - Historical trends are the strongest predictors
+            - Rolling averages provide stability to predictions
+            - Year-over-year changes capture volatility
+            - Regional differences are significant but secondary to temporal patterns
+
+            **Business Implications:**
+            - Predictions are most reliable for short-term forecasting (1-2 years)
+            - Models perform better for countries with stable historical data
+            - Additional economic indicators would improve accuracy
+            """)
 
     elif page == "🎯 Predictions":
         st.markdown('<h2 class="sub-header">Youth Unemployment Predictions</h2>', unsafe_allow_html=True)
 
-        st.markdown("""
-        <div class="highlight-box">
-        <h3>🚧 Prediction Feature Coming Soon</h3>
-        <p>The prediction interface is currently under development. This will allow users to:</p>
-        <ul>
-        <li>Generate forecasts for specific countries</li>
-        <li>Explore different scenarios</li>
-        <li>Compare prediction confidence intervals</li>
-        <li>Analyze policy intervention impacts</li>
-        </ul>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Sample prediction interface preview
-        st.markdown("### Prediction Interface Preview")
+        forecaster = trace.cached_call('load_forecaster', load_forecaster, df, version)
+        forecast_countries = forecaster.countries
 
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("#### Select Parameters")
-            country = st.selectbox("Country", ["United States", "Germany", "Brazil", "India", "China"])
+            country = st.selectbox(
+                "Country",
+                forecast_countries,
+                index=forecast_countries.index("United States") if "United States" in forecast_countries else 0
+            )
             forecast_years = st.slider("Forecast Horizon (Years)", 1, 5, 3)
             confidence_level = st.selectbox("Confidence Level", ["80%", "90%", "95%"])
 
+        confidence = int(confidence_level.rstrip('%')) / 100
+        with trace.span('forecast', 'aggregate'):
+            forecast = forecaster.forecast(country, forecast_years, confidence)
+        origin = forecaster.origins.loc[country]
+        next_year = forecast.iloc[0]
+        final_year = forecast.iloc[-1]
+
         with col2:
-            st.markdown("#### Sample Forecast Results")
-            st.metric("Predicted 2025 Rate", "12.3%")
-            st.metric("Prediction Interval", "±2.1%")
-            st.metric("Trend Direction", "📈 Increasing")
+            st.markdown("#### Forecast Results")
+            st.metric(
+                f"Predicted {int(next_year['Year'])} Rate",
+                f"{next_year['forecast']:.1f}%",
+                f"{next_year['forecast'] - origin['value']:+.1f} pts vs {int(origin['origin_year'])}",
+                delta_color="inverse"
+            )
+            st.metric(
+                f"{confidence_level} Prediction Interval ({int(final_year['Year'])})",
+                f"±{(final_year['upper'] - final_year['lower']) / 2:.1f}%"
+            )
+            trend = "📈 Increasing" if final_year['forecast'] > origin['value'] else "📉 Decreasing"
+            st.metric("Trend Direction", trend)
+
+        # Forecast visualization
+        st.markdown("#### Forecast Visualization")
+
+        def forecast_chart():
+            import plotly.graph_objects as go
+
+            history = data_index.select(countries=[country]).dropna(subset=['YouthUnemployment'])
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=list(forecast['Year']) + list(forecast['Year'][::-1]),
+                y=list(forecast['upper']) + list(forecast['lower'][::-1]),
+                fill='toself',
+                fillcolor='rgba(255, 127, 14, 0.2)',
+                line=dict(color='rgba(255, 127, 14, 0)'),
+                name=f"{confidence_level} interval"
+            ))
+            fig.add_trace(go.Scatter(
+                x=history['Year'], y=history['YouthUnemployment'],
+                mode='lines', name='Observed', line=dict(color='#1f77b4')
+            ))
+            fig.add_trace(go.Scatter(
+                x=[origin['origin_year']] + list(forecast['Year']),
+                y=[origin['value']] + list(forecast['forecast']),
+                mode='lines+markers', name='Forecast', line=dict(color='#ff7f0e', dash='dash')
+            ))
+            fig.update_layout(
+                title=f"Youth Unemployment Forecast: {country}",
+                xaxis_title="Year",
+                yaxis_title="Unemployment Rate (%)"
+            )
+            return fig
+
+        render_chart('forecast', forecast_chart, countries=[country], params=(forecast_years, confidence))
 
-        # Placeholder for forecast visualization
-        st.markdown("#### Forecast Visualization (Coming Soon)")
-        st.info("Interactive forecast charts will be available in the full implementation.")
+        st.dataframe(
+            forecast.rename(columns={'forecast': 'Forecast (%)', 'lower': 'Lower (%)', 'upper': 'Upper (%)'})
+            .set_index('Year').drop(columns='horizon').round(2)
+        )
 
     elif page == "📋 About":
         st.markdown('<h2 class="sub-header">About This Project</h2>', unsafe_allow_html=True)
@@ -498,6 +955,41 @@ if df is not None:
         **🌍 Societal Impact:** The goal is to contribute to sustainable development and improved youth employment outcomes worldwide.
         """)
 
+    if st.session_state.get('debug_panel'):
+        st.sidebar.markdown("---")
+        st.sidebar.markdown("### Debug")
+        st.sidebar.markdown(f"**This rerun:** {trace.total_ms:,.0f} ms (session {trace.session_id or 'n/a'})")
+        st.sidebar.dataframe(trace.spans_frame(), hide_index=True)
+        if trace.cache:
+            st.sidebar.markdown("**Cache hits / misses:**")
+            st.sidebar.dataframe(
+                pd.DataFrame.from_dict(trace.cache, orient='index').rename_axis('cache').reset_index(),
+                hide_index=True
+            )
+        st.sidebar.markdown(
+            "**Memory:** " + ", ".join(f"{name} {size / 1024 ** 2:,.2f} MB" for name, size in trace.sizes.items())
+        )
+        if warmup is not None:
+            warmup_status = warmup.status()
+            st.sidebar.markdown(
+                f"**Warm-up:** {'ready' if warmup_status['ready'] else 'running'}, "
+                f"{warmup_status['done']}/{warmup_status['total']} tasks in {warmup_status['elapsed_s']:.1f}s"
+            )
+            st.sidebar.dataframe(warmup.status_frame(), hide_index=True)
+        cache_stats = figure_cache.stats()
+        st.sidebar.markdown(
+            f"**Figure cache:** {cache_stats['hits']:,} hits / {cache_stats['misses']:,} misses "
+            f"({cache_stats['hit_rate']:.0%}), {cache_stats['entries']} entries, {cache_stats['bytes'] / 1024:,.0f} KB"
+        )
+        export_stats = export_cache.stats()
+        st.sidebar.markdown(
+            f"**Export cache:** {export_stats['hits']:,} hits / {export_stats['misses']:,} misses, "
+            f"{export_stats['entries']} files, {export_stats['bytes'] / 1024:,.0f} KB"
+        )
+        if payload_meter.charts:
+            st.sidebar.markdown(f"**Chart payload:** {payload_meter.total_bytes / 1024:,.1f} KB")
+            st.sidebar.dataframe(payload_meter.to_frame().round(1), hide_index=True)
+
 else:
     st.error("Unable to load the dataset. Please check that the data file exists in the correct location.")
 
@@ -509,3 +1001,6 @@ st.markdown("""
     <p>Built with ❤️ using Streamlit, Pandas, and Plotly</p>
 </div>
 """, unsafe_allow_html=True)
+
+# One JSON line per rerun for cross-session latency percentiles (python -m src.instrumentation)
+trace.emit()
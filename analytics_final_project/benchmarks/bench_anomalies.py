@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark: anomaly detection, per-country pandas loop vs one vectorized pass.
+
+The reference computes the trailing rolling z-scores country by country with
+``groupby`` + ``rolling`` (only the spike detector); AnomalyReport runs all
+three detectors (spikes, CUSUM level shifts, change points) over the whole
+(country x year) grid at once. The spike sets of both must match. The target
+is well under a second for the full report at every scale.
+
+Usage:
+    python benchmarks/bench_anomalies.py [--scale 1 10 100] [--repeat 3]
+"""
+
+import argparse
+
+from common import print_table, synthetic_csv, timed
+
+from src.anomalies import DEFAULT_WINDOW, MIN_STD, SPIKE_Z, detect_anomalies
+from src.data_store import read_csv
+
+
+def legacy_spikes(df, window=DEFAULT_WINDOW):
+    """(Country, Year) pairs with |z| >= SPIKE_Z, one groupby-rolling per country"""
+    observed = df.dropna(subset=['YouthUnemployment']).sort_values(['Country', 'Year'])
+    previous = observed.groupby('Country', observed=True)['YouthUnemployment'].shift(1)
+    grouped = previous.groupby(observed['Country'], observed=True)
+    mean = grouped.transform(lambda s: s.rolling(window, min_periods=3).mean())
+    std = grouped.transform(lambda s: s.rolling(window, min_periods=3).std()).clip(lower=MIN_STD)
+    z = (observed['YouthUnemployment'] - mean) / std
+    flagged = observed[z.abs() >= SPIKE_Z]
+    return set(zip(flagged['Country'].astype(str), flagged['Year']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = read_csv(synthetic_csv(scale))
+        legacy_s, expected = timed(legacy_spikes, df, repeat=args.repeat)
+        report_s, report = timed(detect_anomalies, df, repeat=args.repeat)
+        spikes = report.events[report.events['kind'] == 'spike']
+        counts = report.counts()
+        rows.append({
+            'scale': f'x{scale}',
+            'rows': f'{len(df):,}',
+            'series': f'{len(report.countries):,}',
+            'loop_spikes_ms': f'{legacy_s * 1000:.0f}',
+            'report_ms': f'{report_s * 1000:.1f}',
+            'speedup': f'{legacy_s / report_s:.0f}x',
+            'spikes': f"{counts['spike']:,}",
+            'shifts': f"{counts['level shift']:,}",
+            'changes': f"{counts['change point']:,}",
+            'match': 'yes' if set(zip(spikes['Country'].astype(str), spikes['Year'])) == expected else 'NO',
+            'under_1s': 'yes' if report_s < 1 else 'NO',
+        })
+
+    print_table(rows, ['scale', 'rows', 'series', 'loop_spikes_ms', 'report_ms', 'speedup',
+                       'spikes', 'shifts', 'changes', 'match', 'under_1s'])
+
+
+if __name__ == '__main__':
+    main()
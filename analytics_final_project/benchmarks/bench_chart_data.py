@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Plotly payload size and build time, raw rows vs server-side reduction.
+
+For the Data Explorer's distribution chart, compares px.histogram over every
+filtered row (nbins=50) against bars pre-binned with np.histogram. For the
+line chart, compares shipping every point of every country in the filtered
+panel against LTTB downsampling under the point budget (at least 3 points are
+kept per series, so very many series can still exceed it).
+
+Usage:
+    python benchmarks/bench_chart_data.py [--scale 1 10 100] [--budget 2000]
+"""
+
+import argparse
+
+import plotly.express as px
+
+from common import print_table, synthetic_csv, timed
+
+from src.chart_data import downsample_lines, figure_payload_bytes, histogram_frame
+from src.data_store import read_csv
+
+
+def raw_histogram(df):
+    return px.histogram(df, x='YouthUnemployment', nbins=50)
+
+
+def binned_histogram(df):
+    bins = histogram_frame(df['YouthUnemployment'], nbins=50)
+    fig = px.bar(bins, x='bin_mid', y='count')
+    fig.update_traces(width=(bins['bin_end'] - bins['bin_start']).to_numpy())
+    return fig
+
+
+def raw_lines(df):
+    return px.line(df, x='Year', y='YouthUnemployment', color='Country')
+
+
+def downsampled_lines(df, budget):
+    return px.line(downsample_lines(df, 'Year', 'YouthUnemployment', color='Country', max_points=budget),
+                   x='Year', y='YouthUnemployment', color='Country')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--budget', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = read_csv(synthetic_csv(scale))
+        df = df[(df['Year'] >= 2000) & (df['Year'] <= 2024)]
+        df = df.assign(Country=df['Country'].astype(object))[['Country', 'Year', 'YouthUnemployment']]
+
+        charts = [
+            ('histogram', 'raw', lambda: raw_histogram(df)),
+            ('histogram', 'binned', lambda: binned_histogram(df)),
+            ('all-country lines', 'raw', lambda: raw_lines(df)),
+            ('all-country lines', 'lttb', lambda: downsampled_lines(df, args.budget)),
+        ]
+        for chart, mode, build in charts:
+            build_s, fig = timed(build, repeat=args.repeat)
+            serialize_s, size = timed(figure_payload_bytes, fig, repeat=args.repeat)
+            points = sum(len(trace.x) for trace in fig.data)
+            rows.append({
+                'scale': f'x{scale}',
+                'rows': f'{len(df):,}',
+                'chart': chart,
+                'mode': mode,
+                'points': f'{points:,}',
+                'build_ms': f'{build_s * 1000:.1f}',
+                'serialize_ms': f'{serialize_s * 1000:.1f}',
+                'payload_KB': f'{size / 1024:,.1f}',
+            })
+
+    print_table(rows, ['scale', 'rows', 'chart', 'mode', 'points', 'build_ms', 'serialize_ms', 'payload_KB'])
+
+
+if __name__ == '__main__':
+    main()
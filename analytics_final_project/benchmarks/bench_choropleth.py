@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: World Map payload, px.choropleth over every year vs a window of frames.
+
+The naive map is ``px.choropleth(animation_frame='Year')`` over all country
+rows, rebuilt and re-serialized on every rerun. The World Map page ships
+``window_figure`` instead: the visible year plus MAP_PREFETCH_YEARS neighbours
+on each side, built from ChoroplethFrames (one per data version) and cached
+per window by the figure cache.
+
+Replicated countries of the synthetic datasets get distinct ISO3 codes (the
+original code plus the copy number), so the map grows with the scale even
+though plotly has no shapes for them.
+
+Usage:
+    python benchmarks/bench_choropleth.py [--scale 1 10 100] [--radius 2] [--repeat 3]
+"""
+
+import argparse
+
+import plotly.express as px
+
+from common import print_table, synthetic_csv, timed
+
+from src.chart_data import figure_payload_bytes
+from src.choropleth import ChoroplethFrames, window_figure
+from src.data_store import read_csv
+from src.regions import add_region_columns, countries_only
+
+
+def map_frame(scale):
+    """Synthetic frame with region columns; copies keep their original's lookup row"""
+    df = read_csv(synthetic_csv(scale))
+    codes = df['CountryCode'].astype(str)
+    copy = codes.str[2:]
+    df = add_region_columns(df.assign(CountryCode=codes.str[:2]))
+    return df.assign(ISO3=(df['ISO3'].astype(object) + copy).astype('category'))
+
+
+def naive_map(df):
+    rows = countries_only(df).dropna(subset=['YouthUnemployment', 'ISO3'])
+    rows = rows.assign(ISO3=rows['ISO3'].astype(object), Country=rows['Country'].astype(object))
+    return px.choropleth(rows, locations='ISO3', color='YouthUnemployment', hover_name='Country',
+                         animation_frame='Year')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--radius', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = map_frame(scale)
+        build_frames_s, frames = timed(ChoroplethFrames, df)
+        year = frames.latest_year()
+
+        charts = [
+            ('all years', lambda: naive_map(df)),
+            (f'window of {len(frames.window(year, args.radius))}', lambda: window_figure(frames, year, args.radius)),
+        ]
+        for mode, build in charts:
+            build_s, fig = timed(build, repeat=args.repeat)
+            serialize_s, size = timed(figure_payload_bytes, fig, repeat=args.repeat)
+            rows.append({
+                'scale': f'x{scale}',
+                'countries': f'{len(frames.iso3):,}',
+                'map': mode,
+                'frames': len(fig.frames),
+                'build_ms': f'{build_s * 1000:.1f}',
+                'serialize_ms': f'{serialize_s * 1000:.1f}',
+                'payload_KB': f'{size / 1024:,.1f}',
+                'precompute_ms': f'{build_frames_s * 1000:.1f}',
+            })
+
+    print_table(rows, ['scale', 'countries', 'map', 'frames', 'build_ms', 'serialize_ms', 'payload_KB', 'precompute_ms'])
+
+
+if __name__ == '__main__':
+    main()
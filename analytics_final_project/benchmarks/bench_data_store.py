@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CSV parsing vs the memory-mapped columnar store.
+
+Each measurement runs in a fresh interpreter so that peak RSS and cold-start
+costs are not hidden by earlier runs:
+
+    csv          pd.read_csv of the source file (the old load_data path)
+    store-cold   first load: parse CSV, write Feather store, memory-map it
+    store-warm   later loads: memory-map the existing Feather store
+
+Usage:
+    python benchmarks/bench_data_store.py [--scale 1 10 100] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from common import peak_rss_mb, print_table, synthetic_csv, timed
+
+MODES = ['csv', 'store-cold', 'store-warm']
+
+
+def run_child(mode, csv_path):
+    """Measure a single load inside this (fresh) process and print JSON"""
+    import pandas as pd
+    from src import data_store
+
+    rss_before = peak_rss_mb()
+    if mode == 'csv':
+        seconds, df = timed(pd.read_csv, csv_path)
+    elif mode == 'store-cold':
+        feather_path, manifest_path = data_store.store_paths(csv_path)
+        for path in (feather_path, manifest_path):
+            if os.path.exists(path):
+                os.remove(path)
+        seconds, df = timed(data_store.load_store, csv_path)
+    else:
+        data_store.build_store(csv_path)
+        rss_before = peak_rss_mb()
+        seconds, df = timed(data_store.load_store, csv_path)
+
+    print(json.dumps({
+        'seconds': seconds,
+        'rss_mb': peak_rss_mb() - rss_before,
+        'frame_mb': df.memory_usage(deep=True).sum() / 1e6,
+        'rows': len(df),
+    }))
+
+
+def measure(mode, csv_path, repeat):
+    """Run ``mode`` in ``repeat`` fresh processes and keep the fastest run"""
+    results = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', mode, csv_path],
+            check=True, capture_output=True, text=True
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return min(results, key=lambda r: r['seconds'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'CSV'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    rows = []
+    for scale in args.scale:
+        # Work on a private copy so the real data/.store is never touched
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'youth_unemployment.csv')
+            shutil.copyfile(synthetic_csv(scale), csv_path)
+            baseline = None
+            for mode in MODES:
+                r = measure(mode, csv_path, args.repeat)
+                baseline = baseline or r['seconds']
+                rows.append({
+                    'scale': f'x{scale}',
+                    'rows': f"{r['rows']:,}",
+                    'mode': mode,
+                    'load_ms': f"{r['seconds'] * 1000:.1f}",
+                    'speedup': f"{baseline / r['seconds']:.1f}x",
+                    'peak_rss_delta_mb': f"{r['rss_mb']:.1f}",
+                    'frame_mb': f"{r['frame_mb']:.2f}",
+                })
+
+    print_table(rows, ['scale', 'rows', 'mode', 'load_ms', 'speedup', 'peak_rss_delta_mb', 'frame_mb'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: data exports, whole-frame conversion on every rerun vs chunked on click.
+
+The naive export is ``st.download_button(df.to_csv())`` (or ``to_parquet`` /
+``to_excel``): the whole file is rendered in one piece on every rerun of the
+page, downloaded or not. The app writes the file only when the button is
+clicked, ``EXPORT_CHUNK_ROWS`` rows at a time from the indexed rows
+(src/exports.py), and keeps it in the export cache for repeat downloads:
+
+    naive_ms     whole-frame conversion (paid by every rerun of the page)
+    chunked_ms   export_bytes (paid once per filter state, format and data version)
+    cached_ms    the same download again, from ExportCache
+    *_peak_mb    peak Python/NumPy allocation while writing (tracemalloc; Arrow
+                 buffers of the Parquet writer are not included)
+
+Excel goes through openpyxl at roughly 25k rows/s, so it only runs at the
+scales given with ``--excel-scale`` (1x by default).
+
+Usage:
+    python benchmarks/bench_exports.py [--scale 1 10 100] [--excel-scale 1] [--repeat 3]
+"""
+
+import argparse
+import gc
+import io
+import tracemalloc
+
+import pandas as pd
+
+from common import print_table, synthetic_csv, timed
+
+from src.data_store import read_csv
+from src.exports import FORMATS, ExportCache, export_bytes
+from src.query import DataIndex
+
+
+def naive_bytes(df, fmt):
+    if fmt == 'csv':
+        return df.to_csv(index=False).encode('utf-8')
+    out = io.BytesIO()
+    if fmt == 'parquet':
+        df.to_parquet(out, index=False)
+    else:
+        df.to_excel(out, index=False, engine='openpyxl')
+    return out.getvalue()
+
+
+def peak_mb(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def same_rows(fmt, expected, result):
+    if fmt == 'csv':
+        return expected == result
+    if fmt == 'parquet':
+        return pd.read_parquet(io.BytesIO(expected)).equals(pd.read_parquet(io.BytesIO(result)))
+    return '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--excel-scale', type=int, nargs='*', default=[1])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        # All years: the largest df_filtered, as a slice of the (Year, Country) layout
+        df = DataIndex(read_csv(synthetic_csv(scale))).select()
+        for fmt in FORMATS:
+            if fmt == 'xlsx' and scale not in args.excel_scale:
+                continue
+            repeat = 1 if fmt == 'xlsx' else args.repeat
+            naive_s, expected = timed(naive_bytes, df, fmt, repeat=repeat)
+            chunked_s, result = timed(export_bytes, df, fmt, repeat=repeat)
+            cache = ExportCache()
+            cache.get_or_build(fmt, lambda: result)
+            cached_s, _ = timed(cache.get_or_build, fmt, lambda: export_bytes(df, fmt), repeat=args.repeat)
+            rows.append({
+                'scale': f'x{scale}',
+                'rows': f'{len(df):,}',
+                'format': FORMATS[fmt],
+                'size_MB': f'{len(result) / 1e6:.1f}',
+                'naive_ms': f'{naive_s * 1000:.1f}',
+                'chunked_ms': f'{chunked_s * 1000:.1f}',
+                'cached_ms': f'{cached_s * 1000:.3f}',
+                'naive_peak_mb': f'{peak_mb(naive_bytes, df, fmt):.1f}',
+                'chunked_peak_mb': f'{peak_mb(export_bytes, df, fmt):.1f}',
+                'same_rows': {True: 'yes', False: 'NO'}.get(same_rows(fmt, expected, result), '-'),
+            })
+
+    print_table(rows, ['scale', 'rows', 'format', 'size_MB', 'naive_ms', 'chunked_ms', 'cached_ms',
+                       'naive_peak_mb', 'chunked_peak_mb', 'same_rows'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feature pipeline on the bundled extract and synthetic 10x / 100x panels.
+
+Compares the segmented NumPy pipeline in src/features.py against the previous
+pandas implementation (groupby ffill/shift plus groupby().rolling()) for the
+forecasting model's feature set, and times the full 25-feature processed build.
+
+Usage:
+    python benchmarks/bench_features.py [--scale 1 10 100] [--repeat 3]
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from common import print_table, synthetic_csv, timed
+
+from src.data_store import read_csv
+from src.features import FEATURE_COLUMNS, build_processed, sort_panel, time_series_features
+
+
+def groupby_features(panel, value_col='YouthUnemployment'):
+    """The pandas groupby implementation the NumPy pipeline replaced"""
+    start_year = int(panel['Year'].min())
+    country = panel['Country']
+    filled = panel.groupby('Country', observed=True, sort=False)[value_col].ffill().astype('float64')
+    grouped = filled.groupby(country, observed=True, sort=False)
+
+    features = pd.DataFrame(index=panel.index)
+    features['value'] = filled
+    for k in (1, 2, 3):
+        features[f'lag_{k}'] = grouped.shift(k)
+    features['rolling_mean_3'] = grouped.rolling(3, min_periods=1).mean().reset_index(level=0, drop=True)
+    features['rolling_mean_5'] = grouped.rolling(5, min_periods=1).mean().reset_index(level=0, drop=True)
+    features['rolling_std_3'] = grouped.rolling(3, min_periods=2).std().reset_index(level=0, drop=True)
+    features['yoy_change'] = filled - features['lag_1']
+    features['year_from_start'] = panel['Year'].astype('int64') - start_year
+    return features[FEATURE_COLUMNS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = read_csv(synthetic_csv(scale))
+        panel = sort_panel(df)
+
+        groupby_s, expected = timed(groupby_features, panel, repeat=args.repeat)
+        numpy_s, actual = timed(time_series_features, panel, repeat=args.repeat)
+        processed_s, processed = timed(build_processed, df, repeat=args.repeat)
+
+        matches = all(
+            np.allclose(expected[c].to_numpy(np.float64), actual[c].to_numpy(np.float64), equal_nan=True, atol=1e-5)
+            for c in FEATURE_COLUMNS
+        )
+        rows.append({
+            'scale': f'x{scale}',
+            'rows': f'{len(df):,}',
+            'groupby_ms': f'{groupby_s * 1000:.1f}',
+            'numpy_ms': f'{numpy_s * 1000:.1f}',
+            'speedup': f'{groupby_s / numpy_s:.1f}x',
+            'full_processed_ms': f'{processed_s * 1000:.1f}',
+            'features': processed.shape[1] - 5,
+            'matches': 'yes' if matches else 'NO',
+        })
+
+    print_table(rows, ['scale', 'rows', 'groupby_ms', 'numpy_ms', 'speedup', 'full_processed_ms', 'features', 'matches'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: gap filling, per-country pandas vs one vectorized pass over the grid.
+
+The bundled extract has few interior gaps (most missing cells are the years
+before 1991), so a share of the observed cells is blanked first. Each strategy
+is then timed against its pandas reference and checked for equal results:
+
+    ffill      groupby('Country').ffill()
+    linear     groupby('Country') + interpolate(limit_area='inside')
+    spline     groupby('Country') + interpolate(method='pchip', limit_area='inside')
+               (timing only: a different local cubic, so values differ slightly)
+    regional   groupby(['region', 'Year']) mean, then the all-country year mean
+
+Usage:
+    python benchmarks/bench_imputation.py [--scale 1 10 100] [--holes 0.1] [--repeat 3]
+"""
+
+import argparse
+
+import numpy as np
+
+from common import print_table, synthetic_csv, timed
+
+from src.data_store import read_csv
+from src.imputation import STRATEGIES, impute
+from src.regions import add_region_columns
+
+
+def legacy_fill(df, strategy):
+    values = df['YouthUnemployment'].astype(np.float64)
+    grouped = values.groupby(df['Country'], observed=True)
+    if strategy == 'ffill':
+        return grouped.ffill()
+    if strategy == 'linear':
+        return grouped.transform(lambda s: s.interpolate(limit_area='inside'))
+    if strategy == 'spline':
+        return grouped.transform(lambda s: s.interpolate(method='pchip', limit_area='inside')).clip(0, 100)
+
+    members = df['region'].notna() & ~df['is_aggregate']
+    member_values = values.where(members)
+    regional = member_values.groupby([df['region'].astype(object), df['Year']]).transform('mean')
+    overall = member_values.groupby(df['Year']).transform('mean')
+    filled = values.fillna(regional.where(members)).fillna(overall)
+    return filled.where(values.notna() | ~df['is_aggregate'])
+
+
+def with_holes(df, share, seed=0):
+    """Copy of ``df`` with ``share`` of the observed rates blanked"""
+    rng = np.random.default_rng(seed)
+    values = df['YouthUnemployment'].to_numpy().copy()
+    observed = np.flatnonzero(~np.isnan(values))
+    values[rng.choice(observed, size=int(len(observed) * share), replace=False)] = np.nan
+    return df.assign(YouthUnemployment=values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--holes', type=float, default=0.1, help='share of observed cells to blank')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = with_holes(add_region_columns(read_csv(synthetic_csv(scale))).sort_values(['Country', 'Year'], ignore_index=True), args.holes)
+        for strategy in STRATEGIES:
+            legacy_s, expected = timed(legacy_fill, df, strategy, repeat=args.repeat)
+            grid_s, result = timed(impute, df, strategy, repeat=args.repeat)
+            filled = result.frame['YouthUnemployment'].to_numpy(dtype=np.float64)
+            matches = np.allclose(filled, expected.to_numpy(), equal_nan=True, atol=1e-4)
+            rows.append({
+                'scale': f'x{scale}',
+                'rows': f'{len(df):,}',
+                'strategy': strategy,
+                'pandas_ms': f'{legacy_s * 1000:.1f}',
+                'grid_ms': f'{grid_s * 1000:.1f}',
+                'speedup': f'{legacy_s / grid_s:.1f}x',
+                'filled': f'{result.n_imputed:,}',
+                'bitmap_kb': f'{result.bitmap.nbytes / 1024:.1f}',
+                'match': '-' if strategy == 'spline' else ('yes' if matches else 'NO'),
+            })
+
+    print_table(rows, ['scale', 'rows', 'strategy', 'pandas_ms', 'grid_ms', 'speedup', 'filled', 'bitmap_kb', 'match'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading one indicator from stores holding 1 to dozens of indicators.
+
+Builds synthetic registries in a temporary directory where every extra
+indicator is a perturbed copy of the youth unemployment extract, then, in a
+fresh interpreter per measurement, memory-maps the long store and pivots
+either the one indicator a page needs or all of them to wide format.
+
+Usage:
+    python benchmarks/bench_indicators.py [--indicators 1 12 48] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from common import print_table, timed
+
+from src.data_store import RAW_CSV_PATH
+
+
+def make_registry(directory, count):
+    """Write ``count`` indicator extracts plus their registry; return the registry path"""
+    import numpy as np
+    import pandas as pd
+
+    base = pd.read_csv(RAW_CSV_PATH, keep_default_na=False, na_values=[''])
+    rng = np.random.default_rng(0)
+    rows = []
+    for i in range(count):
+        column = f'Indicator{i}'
+        extract = base.rename(columns={'YouthUnemployment': column})
+        extract[column] = extract[column] * rng.uniform(0.5, 1.5) + rng.normal(0, 1, len(extract))
+        extract.to_csv(os.path.join(directory, f'indicator_{i}.csv'), index=False)
+        rows.append({'indicator_id': f'indicator_{i}', 'wdi_code': f'SYN.{i}', 'name': column, 'unit': '%',
+                     'source_file': f'indicator_{i}.csv', 'value_column': column})
+    registry_path = os.path.join(directory, 'indicators.csv')
+    pd.DataFrame(rows).to_csv(registry_path, index=False)
+    return registry_path
+
+
+def run_child(mode, registry_path):
+    """Measure one load + pivot inside this (fresh) process and print JSON"""
+    from src.indicators import load_indicator_store
+
+    store_path = os.path.join(os.path.dirname(registry_path), '.store', 'indicators.feather')
+    if mode == 'build':
+        load_indicator_store(registry_path, store_path)
+        return
+
+    def load_and_pivot():
+        store = load_indicator_store(registry_path, store_path)
+        ids = store.indicators[:1] if mode == 'one' else store.indicators
+        return store, store.wide(ids, complete_grid=True)
+
+    seconds, (store, frame) = timed(load_and_pivot)
+    print(json.dumps({
+        'seconds': seconds,
+        'store_mb': store.nbytes / 1e6,
+        'frame_mb': frame.memory_usage(deep=True).sum() / 1e6,
+        'columns': frame.shape[1] - 3,
+    }))
+
+
+def measure(mode, registry_path, repeat):
+    results = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', mode, registry_path],
+            check=True, capture_output=True, text=True
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return min(results, key=lambda r: r['seconds'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--indicators', type=int, nargs='+', default=[1, 12, 48])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'REGISTRY'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    rows = []
+    for count in args.indicators:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry_path = make_registry(tmp_dir, count)
+            # Build the store in its own process so measurements only map and pivot
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--child', 'build', registry_path], check=True)
+            for mode in (['one'] if count == 1 else ['one', 'all']):
+                r = measure(mode, registry_path, args.repeat)
+                rows.append({
+                    'indicators_stored': count,
+                    'pivoted': r['columns'],
+                    'load_pivot_ms': f"{r['seconds'] * 1000:.1f}",
+                    'store_mb': f"{r['store_mb']:.2f}",
+                    'frame_mb': f"{r['frame_mb']:.2f}",
+                })
+
+    print_table(rows, ['indicators_stored', 'pivoted', 'load_pivot_ms', 'store_mb', 'frame_mb'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: table-driven region lookup vs the old per-row get_region() apply.
+
+The legacy path ran a Python substring search over a hand-written region map
+for every row, leaving most countries (e.g. "Niger", unlike "Nigeria") in
+'Other'. The new path resolves each unique CountryCode once against
+data/country_regions.csv and broadcasts the result with an integer take.
+
+Usage:
+    python benchmarks/bench_regions.py [--scale 1 10 100] [--repeat 5]
+"""
+
+import argparse
+
+from common import print_table, synthetic_csv, timed
+
+from src.data_store import read_csv
+from src.regions import classify
+
+# Verbatim copy of the mapping previously defined inside the Regional Analysis tab
+LEGACY_REGION_MAP = {
+    'Africa': ['Africa', 'Algeria', 'South Africa', 'Nigeria'],
+    'Asia': ['Asia', 'China', 'India', 'Japan'],
+    'Europe': ['Europe', 'Germany', 'France', 'United Kingdom'],
+    'North America': ['North America', 'United States', 'Canada'],
+    'South America': ['South America', 'Brazil', 'Argentina'],
+    'Other': ['Other']
+}
+
+
+def legacy_get_region(country):
+    for region, countries in LEGACY_REGION_MAP.items():
+        if any(c in country for c in countries):
+            return region
+    return 'Other'
+
+
+def legacy_apply(df):
+    # The old tab applied over an object column
+    return df['Country'].astype(object).apply(legacy_get_region)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = read_csv(synthetic_csv(scale))
+        legacy_s, legacy = timed(legacy_apply, df, repeat=args.repeat)
+        lookup_s, classes = timed(classify, df['CountryCode'], repeat=args.repeat)
+        rows.append({
+            'scale': f'x{scale}',
+            'rows': f'{len(df):,}',
+            'apply_ms': f'{legacy_s * 1000:.1f}',
+            'lookup_ms': f'{lookup_s * 1000:.2f}',
+            'speedup': f'{legacy_s / lookup_s:.0f}x',
+            'legacy_other_rows': f"{(legacy == 'Other').sum():,}",
+            'aggregate_rows': f"{classes['is_aggregate'].sum():,}",
+        })
+
+    print_table(rows, ['scale', 'rows', 'apply_ms', 'lookup_ms', 'speedup', 'legacy_other_rows', 'aggregate_rows'])
+
+
+if __name__ == '__main__':
+    main()
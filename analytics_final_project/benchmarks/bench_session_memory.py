@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory of 50 concurrent dashboard sessions, legacy vs compact data layer.
+
+Every session runs one Data Explorer rerun with its own year range and country
+selection and keeps what the script holds at that point, as concurrent
+sessions in flight do. Two data layers are compared, each in a fresh process:
+
+    legacy    the original app: ``pd.read_csv`` defaults behind st.cache_data
+              (so every rerun unpickles its own copy of the raw and processed
+              frames), boolean-mask year filter, ``df_filtered.copy()`` plus a
+              per-row region lookup for the regional tab, ``isin`` for
+              countries and groupbys per rerun
+    compact   the current app: categorical / int16 / float32 frames behind
+              st.cache_resource (one copy per process), year filter as a
+              zero-copy slice of DataIndex, summaries from the aggregate cube
+              and CountrySummaries
+
+Memory is tracemalloc (Python and NumPy) plus the pyarrow pool (pandas
+string columns):
+
+    shared_mb        held once per process (caches, loaded frames, indexes)
+    per_session_mb   extra memory per concurrent session
+    total_mb         shared + sessions * per_session
+    peak_rss_mb      peak resident set size of the measuring process
+
+The legacy layer holds about 35 MB per session at 10x, so 50 legacy sessions
+at 100x need well over 16 GB; that scale is only run when asked for.
+
+Usage:
+    python benchmarks/bench_session_memory.py [--scale 1 10] [--sessions 50]
+"""
+
+import argparse
+import gc
+import json
+import os
+import pickle
+import subprocess
+import sys
+
+from common import SYNTHETIC_DIR, peak_rss_mb, print_table, synthetic_csv
+
+from src.data_store import PROCESSED_CSV_PATH
+
+MODES = ('legacy', 'compact')
+
+# Country name -> region rules of the original Regional Analysis tab
+LEGACY_REGION_MAP = {
+    'Africa': ['Africa', 'Algeria', 'South Africa', 'Nigeria'],
+    'Asia': ['Asia', 'China', 'India', 'Japan'],
+    'Europe': ['Europe', 'Germany', 'France', 'United Kingdom'],
+    'North America': ['North America', 'United States', 'Canada'],
+    'South America': ['South America', 'Brazil', 'Argentina'],
+    'Other': ['Other']
+}
+
+
+def processed_csv(scale):
+    """Path of the processed dataset built from the ``scale``x extract"""
+    if scale == 1:
+        return PROCESSED_CSV_PATH
+    path = os.path.join(SYNTHETIC_DIR, f'youth_unemployment_processed_x{scale}.csv')
+    if not os.path.exists(path):
+        from src.data_store import read_csv
+        from src.features import build_processed
+
+        build_processed(read_csv(synthetic_csv(scale))).to_csv(path, index=False)
+    return path
+
+
+def traced_mb():
+    import tracemalloc
+
+    import pyarrow as pa
+
+    gc.collect()
+    return (tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes()) / 1e6
+
+
+def session_inputs(countries, sessions, seed=0):
+    """Deterministic (year range, countries) per session"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    inputs = []
+    for _ in range(sessions):
+        start = int(rng.integers(1960, 2015))
+        picks = rng.choice(len(countries), size=int(rng.integers(1, 11)), replace=False)
+        inputs.append(((start, int(rng.integers(start, 2025))), [countries[i] for i in picks]))
+    return inputs
+
+
+def legacy_layer(scale):
+    """(shared objects, rerun function) of the original data layer"""
+    import pandas as pd
+
+    # st.cache_data keeps the pickled return value and unpickles it on every call
+    cached = {
+        'data': pickle.dumps(pd.read_csv(synthetic_csv(scale))),
+        'processed': pickle.dumps(pd.read_csv(processed_csv(scale))),
+    }
+    countries = sorted(pickle.loads(cached['data'])['Country'].unique())
+
+    def get_region(country):
+        for region, names in LEGACY_REGION_MAP.items():
+            if any(c in country for c in names):
+                return region
+        return 'Other'
+
+    def rerun(year_range, selected):
+        df = pickle.loads(cached['data'])
+        df_processed = pickle.loads(cached['processed'])
+        df_filtered = df[(df['Year'] >= year_range[0]) & (df['Year'] <= year_range[1])]
+        regional_data = df_filtered.copy()
+        regional_data['region'] = regional_data['Country'].apply(get_region)
+        country_data = df_filtered[df_filtered['Country'].isin(selected)]
+        return {
+            'df': df,
+            'df_processed': df_processed,
+            'df_filtered': df_filtered,
+            'regional_data': regional_data,
+            'country_data': country_data,
+            'regional_stats': regional_data.groupby('region')['YouthUnemployment'].agg(['mean', 'std', 'count']),
+            'country_summary': country_data.groupby('Country')['YouthUnemployment'].agg(['mean', 'std', 'min', 'max']),
+            'yearly_stats': df_filtered.groupby('Year')['YouthUnemployment'].agg(['mean', 'std', 'count']),
+        }
+
+    return cached, countries, rerun
+
+
+def compact_layer(scale):
+    """(shared objects, rerun function) of the current data layer"""
+    from src.aggregates import AggregateCube
+    from src.data_store import read_csv
+    from src.query import DataIndex
+    from src.regions import add_region_columns, countries_only
+    from src.summaries import CountrySummaries
+
+    df = add_region_columns(read_csv(synthetic_csv(scale)))
+    shared = {
+        'data': df,
+        'cube': AggregateCube(countries_only(df)),
+        'index': DataIndex(df),
+        'summaries': CountrySummaries(df),
+    }
+    countries = list(shared['summaries'].country_options)
+
+    def rerun(year_range, selected):
+        df_filtered = shared['index'].select(year_range=year_range)
+        return {
+            'df_filtered': df_filtered,
+            'max_rate': df_filtered['YouthUnemployment'].max(),
+            'regional_stats': shared['cube'].region_stats(year_range),
+            'country_summary': shared['summaries'].stats(selected, year_range),
+            'yearly_stats': shared['cube'].yearly_stats(year_range),
+        }
+
+    return shared, countries, rerun
+
+
+def run_child(mode, scale, sessions):
+    """Measure one data layer in this (fresh) process and print JSON"""
+    import tracemalloc
+
+    tracemalloc.start()
+    base = traced_mb()
+    shared, countries, rerun = (legacy_layer if mode == 'legacy' else compact_layer)(scale)
+    loaded = traced_mb()
+
+    held = [rerun(year_range, selected) for year_range, selected in session_inputs(countries, sessions)]
+    in_flight = traced_mb()
+    print(json.dumps({
+        'shared_mb': loaded - base,
+        'per_session_mb': (in_flight - loaded) / len(held),
+        'peak_rss_mb': peak_rss_mb(),
+    }))
+
+
+def measure(mode, scale, sessions):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, str(scale), str(sessions)],
+                         cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    if out.returncode != 0:
+        sys.exit(f"{mode} at {scale}x failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--sessions', type=int, default=50)
+    parser.add_argument('--child', nargs=3, metavar=('MODE', 'SCALE', 'SESSIONS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child[0], int(args.child[1]), int(args.child[2]))
+        return
+
+    rows = []
+    for scale in args.scale:
+        results = {mode: measure(mode, scale, args.sessions) for mode in MODES}
+        for mode, r in results.items():
+            rows.append({
+                'scale': f'x{scale}',
+                'layer': mode,
+                'shared_mb': f"{r['shared_mb']:.1f}",
+                'per_session_mb': f"{r['per_session_mb']:.3f}",
+                f'total_{args.sessions}_mb': f"{r['shared_mb'] + args.sessions * r['per_session_mb']:.1f}",
+                'peak_rss_mb': f"{r['peak_rss_mb']:.0f}",
+                'per_session_ratio': '-',
+            })
+        legacy, compact = results['legacy']['per_session_mb'], results['compact']['per_session_mb']
+        rows[-1]['per_session_ratio'] = f'{legacy / compact:.0f}x smaller' if compact > 0 else '-'
+
+    print_table(rows, ['scale', 'layer', 'shared_mb', 'per_session_mb', f'total_{args.sessions}_mb',
+                       'peak_rss_mb', 'per_session_ratio'])
+
+
+if __name__ == '__main__':
+    main()
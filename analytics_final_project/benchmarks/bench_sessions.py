@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Benchmark: replayed dashboard sessions against 1x, 10x and 100x data (regression check).
+
+Drives app/app.py headlessly with Streamlit's AppTest through a fixed session:
+opening the Overview, sweeping the year range, switching to the Data Explorer
+(whose five tabs all render on every rerun and are timed through the app's
+instrumentation spans), selecting 1, 3 and 10 countries, a range before the
+series starts (nothing to chart), the linear-interpolation view with CSV and
+Parquet downloads, and visiting the remaining pages. A download runs the
+button's deferred callable, as a click does; Excel is left out (openpyxl
+takes tens of seconds at 100x).
+
+AppTest compiles the script anew on every run, which a server does once per
+process (about 40 ms per rerun at 1x, growing with app.py), so the replays
+share one compiled-script cache.
+
+Each scale runs in a fresh interpreter pointed at its own data and model
+directories (APP_DATA_DIR / APP_MODEL_DIR), after one untimed replay that
+builds the on-disk stores and trains the forecaster. Every interaction is then
+measured:
+
+    cold_ms   wall time with all st.cache_* caches cleared (median of --repeat)
+    warm_ms   wall time of the same replay straight after (median of --repeat)
+    peak_mb   peak Python/NumPy allocation during the cold interaction (tracemalloc)
+
+The session is deterministic (same widgets, values and country picks), so per
+scale totals can be compared with benchmarks/baselines/sessions.json; the
+script exits with status 1 if a total is more than ``--tolerance`` slower.
+
+Usage:
+    python benchmarks/bench_sessions.py [--scales 1 10 100] [--repeat 3] [--tolerance 0.25]
+    python benchmarks/bench_sessions.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from common import BENCH_DIR, PROJECT_ROOT, SYNTHETIC_DIR, print_table, synthetic_csv
+
+APP_PATH = os.path.join(PROJECT_ROOT, 'app', 'app.py')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baselines', 'sessions.json')
+
+# (label, widget, value); 'countries' picks that many options spread over the list,
+# 'export' switches the file format and downloads every export of the page
+SESSION = [
+    ('open overview', None, None),
+    ('year range 2010-2024', 'year_range', (2010, 2024)),
+    ('year range 1990-2024', 'year_range', (1990, 2024)),
+    ('year range 1960-2024', 'year_range', (1960, 2024)),
+    ('year range 2000-2024', 'year_range', (2000, 2024)),
+    ('data explorer', 'page', '📈 Data Explorer'),
+    ('select 1 country', 'countries', 1),
+    ('select 3 countries', 'countries', 3),
+    ('select 10 countries', 'countries', 10),
+    ('explorer 2010-2020', 'year_range', (2010, 2020)),
+    ('explorer 1960-1990', 'year_range', (1960, 1990)),
+    ('explorer 2000-2024', 'year_range', (2000, 2024)),
+    ('linear interpolation', 'view', 'Linear interpolation'),
+    ('export csv', 'export', 'csv'),
+    ('export parquet', 'export', 'parquet'),
+    ('raw values', 'view', 'Raw'),
+    ('world map', 'page', '🗺️ World Map'),
+    ('model insights', 'page', '🔍 Model Insights'),
+    ('predictions', 'page', '🎯 Predictions'),
+    ('about', 'page', '📋 About'),
+    ('back to overview', 'page', '🏠 Overview'),
+]
+
+
+def synthetic_app_dirs(scale):
+    """(data dir, model dir) for the app at ``scale``x; None for the bundled data"""
+    if scale == 1:
+        return None, None
+
+    import pandas as pd
+
+    data_dir = os.path.join(SYNTHETIC_DIR, f'app_x{scale}')
+    model_dir = os.path.join(data_dir, 'models')
+    if os.path.exists(os.path.join(data_dir, 'indicators.csv')):
+        return data_dir, model_dir
+    os.makedirs(model_dir, exist_ok=True)
+
+    # Same file names as data/, with the extract replicated under renamed countries
+    shutil.copyfile(synthetic_csv(scale), os.path.join(data_dir, 'youth_unemployment_global.csv'))
+    registry = pd.read_csv(os.path.join(PROJECT_ROOT, 'data', 'indicators.csv'), keep_default_na=False, na_values=[''])
+    registry[registry['indicator_id'] == 'youth_unemployment'].to_csv(os.path.join(data_dir, 'indicators.csv'), index=False)
+
+    # Renamed copies keep their original region / income group / aggregate flag
+    regions = pd.read_csv(os.path.join(PROJECT_ROOT, 'data', 'country_regions.csv'), keep_default_na=False, na_values=[''])
+    copies = [regions]
+    for i in range(1, scale):
+        part = regions.copy()
+        part['CountryCode'] = part['CountryCode'] + f'{i}'
+        part['ISO3'] = part['ISO3'] + f'{i}'
+        part['Country'] = part['Country'] + f' #{i}'
+        copies.append(part)
+    pd.concat(copies, ignore_index=True).to_csv(os.path.join(data_dir, 'country_regions.csv'), index=False)
+
+    results_path = os.path.join(PROJECT_ROOT, 'models', 'training_results.json')
+    if os.path.exists(results_path):
+        shutil.copyfile(results_path, os.path.join(model_dir, 'training_results.json'))
+    return data_dir, model_dir
+
+
+def pick_countries(options, count):
+    """``count`` options spread evenly over the (sorted) list"""
+    step = max(len(options) // count, 1)
+    return list(options[::step][:count])
+
+
+# Deferred download callables registered by the last rerun (see capture_downloads)
+DOWNLOADS = []
+
+
+def interact(at, widget, value):
+    if widget == 'year_range':
+        at.sidebar.slider[0].set_value(value)
+    elif widget == 'page':
+        at.sidebar.radio[0].set_value(value)
+    elif widget == 'countries':
+        multiselect = at.multiselect[0]
+        multiselect.set_value(pick_countries(multiselect.options, value))
+    elif widget == 'view':
+        at.radio(key='explorer_view').set_value(value)
+    elif widget == 'export':
+        at.radio(key='export_format').set_value(value)
+    DOWNLOADS.clear()
+    at = at.run()
+    if widget == 'export':
+        for download in DOWNLOADS:
+            download()
+    return at
+
+
+def replay(log_path, traced=False):
+    """One session in a new AppTest; returns a measurement dict per interaction"""
+    import gc
+    import time
+    import tracemalloc
+
+    from streamlit.testing.v1 import AppTest
+
+    from src.instrumentation import read_log
+
+    at = AppTest.from_file(APP_PATH, default_timeout=900)
+    results = []
+    for label, widget, value in SESSION:
+        gc.collect()
+        if traced:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        at = at.run() if widget is None else interact(at, widget, value)
+        elapsed = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f"{label}: {at.exception[0].message}")
+
+        record = read_log(log_path)[-1]
+        result = {'label': label, 'ms': elapsed * 1000, 'script_ms': record['total_ms'],
+                  'tabs': {s['name']: s['ms'] for s in record['spans'] if s['category'] == 'tab'}}
+        if traced:
+            result['peak_mb'] = (tracemalloc.get_traced_memory()[1] - base) / 1e6
+        results.append(result)
+    return results
+
+
+def share_script_cache():
+    """Make every AppTest run reuse one ScriptCache (compiled app.py), as a server does"""
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    shared = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: shared
+
+
+def capture_downloads():
+    """Collect the callables the download buttons register, so the replay can "click" them"""
+    from streamlit.runtime.media_file_manager import MediaFileManager
+
+    add_deferred = MediaFileManager.add_deferred
+
+    def capturing(self, data_callable, *args, **kwargs):
+        DOWNLOADS.append(data_callable)
+        return add_deferred(self, data_callable, *args, **kwargs)
+
+    MediaFileManager.add_deferred = capturing
+
+
+def run_child(repeat):
+    """Replay the session in this (fresh) process and print JSON"""
+    import logging
+    import tracemalloc
+
+    import streamlit as st
+
+    share_script_cache()
+    capture_downloads()
+
+    logging.disable(logging.WARNING)
+    log_path = os.environ['APP_METRICS_LOG']
+
+    replay(log_path)  # builds stores and the forecaster; also imports everything
+
+    cold, warm = [], []
+    for _ in range(repeat):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        cold.append(replay(log_path))
+        warm.append(replay(log_path))
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    tracemalloc.start()
+    traced = replay(log_path, traced=True)
+    tracemalloc.stop()
+
+    from common import peak_rss_mb
+
+    interactions = []
+    for i, (label, _, _) in enumerate(SESSION):
+        tabs = cold[0][i]['tabs']
+        interactions.append({
+            'label': label,
+            'cold_ms': statistics.median(run[i]['ms'] for run in cold),
+            'warm_ms': statistics.median(run[i]['ms'] for run in warm),
+            'script_ms': statistics.median(run[i]['script_ms'] for run in cold),
+            'peak_mb': traced[i]['peak_mb'],
+            'tabs': {name: {'cold_ms': statistics.median(run[i]['tabs'][name] for run in cold),
+                            'warm_ms': statistics.median(run[i]['tabs'][name] for run in warm)} for name in tabs},
+        })
+    print(json.dumps({'interactions': interactions, 'peak_rss_mb': peak_rss_mb()}))
+
+
+def measure(scale, repeat):
+    data_dir, model_dir = synthetic_app_dirs(scale)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Background warm-up off, so cold interactions really start from empty caches
+        env = dict(os.environ, APP_METRICS_LOG=os.path.join(tmp_dir, 'metrics.jsonl'), APP_WARMUP='0')
+        if data_dir:
+            env.update(APP_DATA_DIR=data_dir, APP_MODEL_DIR=model_dir)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', str(repeat)],
+                             cwd=BENCH_DIR, env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        sys.exit(f"Session replay at {scale}x failed:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown vs baseline (0.25 = 25%%)')
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--output', help='also write the full results as JSON')
+    parser.add_argument('--child', type=int, metavar='REPEAT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    results = {str(scale): measure(scale, args.repeat) for scale in args.scales}
+
+    rows, tab_rows, totals = [], [], {}
+    for scale, result in results.items():
+        for r in result['interactions']:
+            rows.append({
+                'scale': f'{scale}x',
+                'interaction': r['label'],
+                'cold_ms': f"{r['cold_ms']:.0f}",
+                'warm_ms': f"{r['warm_ms']:.0f}",
+                'peak_mb': f"{r['peak_mb']:.1f}",
+            })
+            for name, tab in r['tabs'].items():
+                if r['label'] == 'data explorer':
+                    tab_rows.append({'scale': f'{scale}x', 'tab': name.split(':', 1)[1],
+                                     'cold_ms': f"{tab['cold_ms']:.1f}", 'warm_ms': f"{tab['warm_ms']:.1f}"})
+        totals[scale] = {
+            'cold_ms': round(sum(r['cold_ms'] for r in result['interactions']), 1),
+            'warm_ms': round(sum(r['warm_ms'] for r in result['interactions']), 1),
+            'peak_rss_mb': round(result['peak_rss_mb'], 1),
+        }
+
+    print_table(rows, ['scale', 'interaction', 'cold_ms', 'warm_ms', 'peak_mb'])
+    print()
+    print_table(tab_rows, ['scale', 'tab', 'cold_ms', 'warm_ms'])
+    print()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump({'totals': totals, 'repeat': args.repeat, 'python': sys.version.split()[0]}, f, indent=2)
+            f.write('\n')
+        print_table([{'scale': f'{s}x', **t} for s, t in totals.items()], ['scale', 'cold_ms', 'warm_ms', 'peak_rss_mb'])
+        print("Baseline updated")
+        return
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)['totals']
+
+    summary, failures = [], []
+    for scale, total in totals.items():
+        row = {'scale': f'{scale}x', **total, 'baseline_cold_ms': '-', 'baseline_warm_ms': '-'}
+        if scale in baseline:
+            for key in ('cold_ms', 'warm_ms'):
+                row[f'baseline_{key}'] = baseline[scale][key]
+                if total[key] > baseline[scale][key] * (1 + args.tolerance):
+                    failures.append(f"{scale}x {key} {total[key]:.0f} > baseline {baseline[scale][key]:.0f}")
+        summary.append(row)
+    print_table(summary, ['scale', 'cold_ms', 'warm_ms', 'baseline_cold_ms', 'baseline_warm_ms', 'peak_rss_mb'])
+
+    if failures:
+        print(f"FAIL: more than {args.tolerance:.0%} slower than baseline: " + '; '.join(failures))
+        sys.exit(1)
+    print("OK" if baseline else "No baseline recorded (run with --update-baseline)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold start to first render of the Streamlit app (regression check).
+
+Each run starts a fresh interpreter that executes app/app.py once in Streamlit's
+bare mode, i.e. imports plus the default Overview page against the on-disk
+data store. The median wall time is compared with the recorded baseline in
+benchmarks/baselines/startup.json and the script exits with status 1 if it is
+more than ``--tolerance`` slower.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--tolerance 0.2]
+    python benchmarks/bench_startup.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from common import BENCH_DIR, PROJECT_ROOT, print_table
+
+APP_PATH = os.path.join(PROJECT_ROOT, 'app', 'app.py')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baselines', 'startup.json')
+
+
+def cold_start_seconds():
+    """Wall time of one fresh-process run of the app script"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='0')
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, APP_PATH], cwd=PROJECT_ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0 or 'Traceback' in result.stderr:
+        sys.exit(f"App run failed:\n{result.stderr[-2000:]}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown vs baseline (0.2 = 20%%)')
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    # One discarded run so .pyc files and the data store exist before timing
+    cold_start_seconds()
+    times = [cold_start_seconds() for _ in range(args.runs)]
+    median = statistics.median(times)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump({'cold_start_s': round(median, 3), 'runs': args.runs, 'python': sys.version.split()[0]}, f, indent=2)
+            f.write('\n')
+        print(f"Baseline updated: {median:.3f}s")
+        return
+
+    baseline = None
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)['cold_start_s']
+
+    limit = baseline * (1 + args.tolerance) if baseline else None
+    print_table([{
+        'runs': args.runs,
+        'min_s': f'{min(times):.3f}',
+        'median_s': f'{median:.3f}',
+        'baseline_s': f'{baseline:.3f}' if baseline else '-',
+        'limit_s': f'{limit:.3f}' if limit else '-',
+    }], ['runs', 'min_s', 'median_s', 'baseline_s', 'limit_s'])
+
+    if limit is not None and median > limit:
+        print(f"FAIL: cold start {median:.3f}s exceeds baseline {baseline:.3f}s by more than {args.tolerance:.0%}")
+        sys.exit(1)
+    print("OK" if limit is not None else "No baseline recorded (run with --update-baseline)")
+
+
+if __name__ == '__main__':
+    main()
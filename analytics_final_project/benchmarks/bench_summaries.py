@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Country Comparison summary table, groupby per rerun vs block merges.
+
+The old tab recomputed ``sorted(df_filtered['Country'].unique())`` for the
+option list and a mean/std/min/max groupby over the selected rows on every
+rerun. CountrySummaries builds the option list and per (country, 8-year block)
+partials once; each query merges the blocks a year range covers.
+
+Usage:
+    python benchmarks/bench_summaries.py [--scale 1 10 100] [--countries 10] [--repeat 20]
+"""
+
+import argparse
+
+import numpy as np
+
+from common import print_table, synthetic_csv, timed
+
+from src.data_store import read_csv
+from src.query import DataIndex
+from src.summaries import CountrySummaries
+
+YEAR_RANGES = [(2000, 2024), (1991, 2003), (1960, 2024)]
+
+
+def legacy_rerun(data_index, year_range, selected):
+    df_filtered = data_index.select(year_range=year_range)
+    options = sorted(df_filtered['Country'].unique())
+    country_data = data_index.select(year_range=year_range, countries=selected)
+    summary = country_data.groupby('Country', observed=True)['YouthUnemployment'].agg(['mean', 'std', 'min', 'max'])
+    return options, summary
+
+
+def summaries_rerun(summaries, year_range, selected):
+    return summaries.country_options, summaries.stats(selected, year_range)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--countries', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for scale in args.scale:
+        df = read_csv(synthetic_csv(scale))
+        data_index = DataIndex(df)
+        build_s, summaries = timed(CountrySummaries, df)
+        options = summaries.country_options
+        selected = options[::max(len(options) // args.countries, 1)][:args.countries]
+
+        for year_range in YEAR_RANGES:
+            legacy_s, (_, expected) = timed(legacy_rerun, data_index, year_range, selected, repeat=args.repeat)
+            merged_s, (_, result) = timed(summaries_rerun, summaries, year_range, selected, repeat=args.repeat)
+            matches = np.allclose(result.loc[expected.index].to_numpy(), expected.to_numpy(dtype=float),
+                                  equal_nan=True, atol=1e-4)
+            rows.append({
+                'scale': f'x{scale}',
+                'rows': f'{len(df):,}',
+                'years': f'{year_range[0]}-{year_range[1]}',
+                'groupby_ms': f'{legacy_s * 1000:.2f}',
+                'blocks_ms': f'{merged_s * 1000:.3f}',
+                'speedup': f'{legacy_s / merged_s:.0f}x',
+                'build_ms': f'{build_s * 1000:.1f}',
+                'table_mb': f'{summaries.nbytes / 1e6:.2f}',
+                'match': 'yes' if matches else 'NO',
+            })
+
+    print_table(rows, ['scale', 'rows', 'years', 'groupby_ms', 'blocks_ms', 'speedup', 'build_ms', 'table_mb', 'match'])
+
+
+if __name__ == '__main__':
+    main()
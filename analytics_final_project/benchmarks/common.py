@@ -0,0 +1,73 @@
+"""
+Shared helpers for the benchmark scripts in this directory.
+
+Benchmarks are plain scripts (``python benchmarks/bench_<name>.py``) that print
+a small results table. Synthetic datasets are built by replicating the bundled
+World Bank extract under renamed countries so that per-country structure and
+missing-value patterns are preserved at every scale.
+"""
+
+import os
+import resource
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+SYNTHETIC_DIR = os.path.join(BENCH_DIR, '.synthetic')
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data_store import RAW_CSV_PATH
+
+
+def synthetic_csv(scale):
+    """Return the path of a CSV holding ``scale`` copies of the bundled extract"""
+    if scale == 1:
+        return RAW_CSV_PATH
+
+    import pandas as pd
+
+    os.makedirs(SYNTHETIC_DIR, exist_ok=True)
+    path = os.path.join(SYNTHETIC_DIR, f'youth_unemployment_x{scale}.csv')
+    if os.path.exists(path):
+        return path
+
+    base = pd.read_csv(RAW_CSV_PATH, keep_default_na=False, na_values=[''])
+    copies = []
+    for i in range(scale):
+        part = base.copy()
+        if i:
+            part['Country'] = part['Country'] + f' #{i}'
+            part['CountryCode'] = part['CountryCode'] + f'{i}'
+        copies.append(part)
+    pd.concat(copies, ignore_index=True).to_csv(path, index=False)
+    return path
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """Run ``func`` and return (best wall time in seconds, last result)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(rows, columns):
+    """Print a list of dicts as an aligned text table"""
+    widths = [max(len(col), *(len(str(row[col])) for row in rows)) for col in columns]
+    print('  '.join(col.ljust(w) for col, w in zip(columns, widths)))
+    print('  '.join('-' * w for w in widths))
+    for row in rows:
+        print('  '.join(str(row[col]).ljust(w) for col, w in zip(columns, widths)))
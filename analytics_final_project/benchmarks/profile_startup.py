@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Startup profile: import-time breakdown of the app's first render.
+
+Runs app/app.py once in Streamlit's bare mode under ``python -X importtime``
+and aggregates the cumulative import time of each top-level import by root
+package (streamlit, pandas, plotly, sklearn, ...), so a heavy dependency
+that slipped onto the startup path stands out.
+
+Usage:
+    python benchmarks/profile_startup.py [--top 15] [--raw importtime.log]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from common import PROJECT_ROOT, print_table
+
+APP_PATH = os.path.join(PROJECT_ROOT, 'app', 'app.py')
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+
+def import_times(script=APP_PATH):
+    """(cumulative_us, module) for every top-level import of one run"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', script], cwd=PROJECT_ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        # Nested imports are indented by two spaces per level
+        if match and len(match.group(3)) == 1:
+            entries.append((int(match.group(2)), match.group(4)))
+    return entries, result.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--raw', help='also write the raw -X importtime log here')
+    args = parser.parse_args()
+
+    entries, log = import_times()
+    if args.raw:
+        with open(args.raw, 'w') as f:
+            f.write(log)
+
+    by_package = defaultdict(int)
+    for cumulative_us, module in entries:
+        by_package[module.split('.')[0]] += cumulative_us
+    total_us = sum(by_package.values())
+
+    rows = [
+        {'package': package, 'import_ms': f'{us / 1000:.1f}', 'share': f'{us / total_us:.0%}'}
+        for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]
+    ]
+    print_table(rows, ['package', 'import_ms', 'share'])
+    print(f"\nTotal import time: {total_us / 1000:.1f} ms across {len(entries)} top-level imports")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,15 @@
 Global Youth Unemployment Analysis - Streamlit App Launcher
 
 This script launches the interactive Streamlit web application for exploring
-the global youth unemployment analysis and predictions.
+the global youth unemployment analysis and predictions. The ``serve``
+subcommand runs several app processes behind a sticky local proxy with shared
+memory-mapped data (see src/serving.py); ``score`` runs headless batch
+forecasting instead (see src/scoring.py).
 
 Usage:
     python run_app.py
+    python run_app.py serve [--workers 4] [--port 8501]
+    python run_app.py score [--output data/forecasts.parquet] [--horizons 1 2 3 4 5]
 
 Requirements:
     - streamlit
@@ -21,6 +26,39 @@ import subprocess
 import sys
 import os
 
+def score(argv):
+    """Forecast every country for every horizon and write the results"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    from src.scoring import main as score_main
+    score_main(argv, prog='run_app.py score')
+
+def serve(argv):
+    """Run N app processes behind the sticky reverse proxy"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    from src.serving import main as serve_main
+    serve_main(argv, prog='run_app.py serve')
+
+def disk_warmup():
+    """Build the data stores and forecaster in the background"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    from src.warmup import Warmup, disk_stages
+
+    def report(warmup):
+        status = warmup.status()
+        failed = f" (failed: {', '.join(status['failed'])})" if status['failed'] else ""
+        print(f"✅ Warm-up finished in {status['elapsed_s']:.1f}s{failed}")
+
+    return Warmup(disk_stages(), name='disk-warmup', on_ready=report).start()
+
 def main():
     """Launch the Streamlit application"""
 
@@ -44,6 +82,9 @@ def main():
     print("Press Ctrl+C to stop the application.")
     print("=" * 50)
 
+    # The server accepts connections right away; the first session finds the stores built
+    disk_warmup()
+
     try:
         # Launch streamlit
         subprocess.run([
@@ -64,4 +105,9 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == 'score':
+        score(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        serve(sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,7 @@
+"""
+Data, modeling and visualization utilities for the Global Youth Unemployment
+Analysis dashboard.
+
+The Streamlit app in ``app/app.py`` and the command line tools in
+``run_app.py`` import from this package.
+"""
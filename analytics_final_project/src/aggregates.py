@@ -0,0 +1,133 @@
+"""
+Precomputed aggregate cube for the dashboard's summary charts.
+
+The cube holds the sum, count and sum of squares of the unemployment rate for
+every (Year, Country) cell. Each country belongs to exactly one region, so the
+region axis is a roll-up of the country axis rather than a third dimension.
+Cumulative sums along the year axis turn any ``year_range`` query into two
+row lookups, so slider moves cost O(years x countries) on a few hundred cells
+instead of re-scanning every row of the filtered frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _mean_std(total, count, total_sq):
+    """Mean and sample standard deviation (ddof=1, as pandas) from raw moments"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(count > 0, total / count, np.nan)
+        var = (total_sq - count * mean ** 2) / (count - 1)
+        std = np.where(count > 1, np.sqrt(np.maximum(var, 0.0)), np.nan)
+    return mean, std
+
+
+class AggregateCube:
+    """(Year x Country) moments with prefix sums over Year and a region roll-up"""
+
+    def __init__(self, df, regions=None, value_col='YouthUnemployment'):
+        """
+        Build the cube from a long (Country, Year, value) frame.
+
+        ``regions`` maps Country -> region label and defaults to the frame's
+        own ``region`` column. Countries missing from it are grouped under
+        'Other'; countries mapped to NaN are left out of the region roll-up.
+        """
+        self.value_col = value_col
+
+        country_codes, countries = pd.factorize(df['Country'], sort=True)
+        self.countries = pd.Index(countries, name='Country')
+
+        year_values = df['Year'].to_numpy(dtype=np.int64)
+        self.min_year = int(year_values.min())
+        self.max_year = int(year_values.max())
+        self.years = np.arange(self.min_year, self.max_year + 1)
+
+        values = df[value_col].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+
+        n_years, n_countries = len(self.years), len(self.countries)
+        flat = (year_values[valid] - self.min_year) * n_countries + country_codes[valid]
+        size = n_years * n_countries
+        shape = (n_years, n_countries)
+
+        self.sum = np.bincount(flat, weights=values[valid], minlength=size).reshape(shape)
+        self.count = np.bincount(flat, minlength=size).reshape(shape).astype(np.float64)
+        self.sum_sq = np.bincount(flat, weights=values[valid] ** 2, minlength=size).reshape(shape)
+
+        # prefix[k] holds the totals of the first k years, so years [i, j) are prefix[j] - prefix[i]
+        self._prefix = {}
+        for name in ('sum', 'count', 'sum_sq'):
+            prefix = np.zeros((n_years + 1, n_countries))
+            np.cumsum(getattr(self, name), axis=0, out=prefix[1:])
+            self._prefix[name] = prefix
+
+        # Region roll-up as a (country x region) indicator matrix
+        if regions is None:
+            if 'region' in df.columns:
+                regions = df.drop_duplicates('Country').set_index('Country')['region'].astype(object)
+            else:
+                regions = {}
+        country_regions = pd.Series([regions.get(c, 'Other') for c in self.countries], index=self.countries)
+        region_codes, region_labels = pd.factorize(country_regions, sort=True)
+        self.regions = pd.Index(region_labels, name='region')
+        self.country_regions = country_regions
+        self._membership = np.zeros((n_countries, len(self.regions)))
+        in_region = region_codes >= 0
+        self._membership[np.flatnonzero(in_region), region_codes[in_region]] = 1.0
+
+    def _year_bounds(self, year_range):
+        """Half-open row bounds into the year axis for an inclusive year range"""
+        if year_range is None:
+            return 0, len(self.years)
+        start = min(max(int(year_range[0]), self.min_year), self.max_year + 1)
+        stop = min(max(int(year_range[1]) + 1, self.min_year), self.max_year + 1)
+        return start - self.min_year, max(stop, start) - self.min_year
+
+    def country_totals(self, year_range=None):
+        """Per-country (sum, count, sum_sq) arrays over an inclusive year range"""
+        i, j = self._year_bounds(year_range)
+        return tuple(self._prefix[name][j] - self._prefix[name][i] for name in ('sum', 'count', 'sum_sq'))
+
+    def overall_mean(self, year_range=None):
+        """Mean of all observations within the year range"""
+        total, count, _ = self.country_totals(year_range)
+        n = count.sum()
+        return total.sum() / n if n else np.nan
+
+    def country_stats(self, year_range=None):
+        """Per-country mean, std and count (indexed by Country)"""
+        total, count, total_sq = self.country_totals(year_range)
+        mean, std = _mean_std(total, count, total_sq)
+        return pd.DataFrame({'mean': mean, 'std': std, 'count': count.astype(np.int64)}, index=self.countries)
+
+    def region_stats(self, year_range=None):
+        """Per-region mean, std and count (indexed by region)"""
+        total, count, total_sq = (x @ self._membership for x in self.country_totals(year_range))
+        mean, std = _mean_std(total, count, total_sq)
+        return pd.DataFrame({'mean': mean, 'std': std, 'count': count.astype(np.int64)}, index=self.regions)
+
+    def yearly_stats(self, year_range=None):
+        """Per-year mean, std and count across all countries"""
+        i, j = self._year_bounds(year_range)
+        total = self.sum[i:j].sum(axis=1)
+        count = self.count[i:j].sum(axis=1)
+        mean, std = _mean_std(total, count, self.sum_sq[i:j].sum(axis=1))
+        return pd.DataFrame({
+            'Year': self.years[i:j],
+            'mean': mean,
+            'std': std,
+            'count': count.astype(np.int64),
+        })
+
+    def region_yearly_means(self, year_range=None):
+        """Long (Year, region, mean) frame for the regional trend lines"""
+        i, j = self._year_bounds(year_range)
+        total = self.sum[i:j] @ self._membership
+        count = self.count[i:j] @ self._membership
+        year_idx, region_idx = np.nonzero(count)
+        return pd.DataFrame({
+            'Year': self.years[i:j][year_idx],
+            'region': self.regions[region_idx],
+            self.value_col: total[year_idx, region_idx] / count[year_idx, region_idx],
+        })
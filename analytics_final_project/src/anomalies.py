@@ -0,0 +1,268 @@
+"""
+Anomaly and structural-break detection over every country's series.
+
+The panel is laid out as one (country x year) grid (NaN where a year is not
+observed) and scanned in a single vectorized pass, one NumPy operation per
+year column at most, never a loop over countries:
+
+    spike         rolling z-score: the value against the mean and std of the
+                  trailing ``window`` observed years (std floored at
+                  ``min_std`` points so very smooth series do not flag noise)
+    level shift   two-sided CUSUM over the clipped z-scores; clipping means
+                  one outlier cannot raise an alarm on its own, a run of
+                  same-signed deviations does. The sums restart after an
+                  alarm, and the event records when the drift began.
+    change point  the single mean-shift split that best explains each series
+                  (the one-change case of PELT's penalized cost, computed
+                  from cumulative sums over all split years at once), kept
+                  if its cost reduction beats a BIC-style penalty and the
+                  means differ by at least ``min_shift`` points
+
+Detection takes a few milliseconds on the full dataset, so the app caches it
+per data version and can recompute it on every refresh.
+
+Usage:
+    python -m src.anomalies         # recent alerts on the bundled extract
+"""
+
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WINDOW = 5
+SPIKE_Z = 3.0
+MIN_STD = 0.5
+CUSUM_K = 0.5
+CUSUM_H = 4.0
+CUSUM_CLIP = 3.0
+MIN_SEGMENT = 5
+MIN_SHIFT = 2.0
+CHANGE_PENALTY = 3.0
+
+EVENT_COLUMNS = ['Country', 'Year', 'kind', 'direction', 'value', 'score', 'detail']
+
+
+def series_grid(df, value_col='YouthUnemployment'):
+    """(countries, years, grid) with grid[i, j] the value of country i in years[j]"""
+    codes, countries = pd.factorize(df['Country'], sort=True)
+    year_values = df['Year'].to_numpy(dtype=np.int64)
+    min_year, max_year = int(year_values.min()), int(year_values.max())
+    grid = np.full((len(countries), max_year - min_year + 1), np.nan)
+    grid[codes, year_values - min_year] = df[value_col].to_numpy(dtype=np.float64)
+    return pd.Index(countries, name='Country'), np.arange(min_year, max_year + 1), grid
+
+
+def rolling_zscores(grid, window=DEFAULT_WINDOW, min_std=MIN_STD, min_periods=3):
+    """Z-score of every observed value against its trailing window of observations"""
+    n_countries, n_years = grid.shape
+    observed = ~np.isnan(grid)
+    rows, cols = np.nonzero(observed)
+    # Observations packed to the left of each row, so a trailing window of observed
+    # years is a contiguous slice and its sums are differences of prefix sums
+    rank = (np.cumsum(observed, axis=1) - 1)[rows, cols]
+    values = grid[rows, cols]
+    packed = np.zeros((n_countries, n_years))
+    packed[rows, rank] = values
+    prefix = np.zeros((n_countries, n_years + 1))
+    prefix_sq = np.zeros((n_countries, n_years + 1))
+    np.cumsum(packed, axis=1, out=prefix[:, 1:])
+    np.cumsum(packed ** 2, axis=1, out=prefix_sq[:, 1:])
+
+    count = np.minimum(rank, window)
+    total = prefix[rows, rank] - prefix[rows, rank - count]
+    total_sq = prefix_sq[rows, rank] - prefix_sq[rows, rank - count]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        var = np.maximum(total_sq - total * mean, 0.0) / (count - 1)
+        std = np.maximum(np.sqrt(var), min_std)
+        scores = np.where(count >= min_periods, (values - mean) / std, np.nan)
+    z = np.full(grid.shape, np.nan)
+    z[rows, cols] = scores
+    return z
+
+
+def cusum_alarms(z, k=CUSUM_K, h=CUSUM_H, clip=CUSUM_CLIP):
+    """
+    Two-sided CUSUM over each row of z-scores.
+
+    Returns (alarm, onset, level): ``alarm`` is +1 / -1 where an upward /
+    downward shift is signalled, 0 elsewhere, ``onset`` is the column where
+    the signalling run started (-1 where there is no alarm) and ``level`` the
+    cumulative sum that crossed ``h``.
+    """
+    n_countries, n_years = z.shape
+    z = np.clip(np.nan_to_num(z, nan=0.0), -clip, clip)
+    upper = np.zeros(n_countries)
+    lower = np.zeros(n_countries)
+    upper_start = np.zeros(n_countries, dtype=np.int64)
+    lower_start = np.zeros(n_countries, dtype=np.int64)
+    alarm = np.zeros((n_countries, n_years), dtype=np.int8)
+    onset = np.full((n_countries, n_years), -1, dtype=np.int64)
+    level = np.zeros((n_countries, n_years))
+
+    for j in range(n_years):
+        upper_start = np.where(upper == 0, j, upper_start)
+        lower_start = np.where(lower == 0, j, lower_start)
+        upper = np.maximum(0.0, upper + z[:, j] - k)
+        lower = np.maximum(0.0, lower - z[:, j] - k)
+        up, down = upper > h, lower > h
+        alarm[up, j], alarm[down, j] = 1, -1
+        onset[up, j], onset[down, j] = upper_start[up], lower_start[down]
+        level[up, j], level[down, j] = upper[up], lower[down]
+        # Restart both sums after a signal
+        fired = up | down
+        upper[fired] = 0.0
+        lower[fired] = 0.0
+    return alarm, onset, level
+
+
+def best_change_points(grid, min_segment=MIN_SEGMENT, penalty=CHANGE_PENALTY):
+    """
+    Best single mean-shift split of every row.
+
+    Returns (split, statistic, mean_before, mean_after, sigma): ``split`` is
+    the first column of the second segment (-1 if the series is too short),
+    ``statistic`` the cost reduction over the noise variance divided by the
+    penalty ``penalty * log(n)`` (values above 1 are significant) and
+    ``sigma`` the noise standard deviation of the row.
+    """
+    observed = ~np.isnan(grid)
+    values = np.where(observed, grid, 0.0)
+    count = np.cumsum(observed, axis=1)
+    total = np.cumsum(values, axis=1)
+    n = count[:, -1:]
+    sum_all = total[:, -1:]
+
+    # Left segment = columns [0, j], right = (j, end]
+    n_left, n_right = count[:, :-1], n - count[:, :-1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_left = total[:, :-1] / n_left
+        mean_right = (sum_all - total[:, :-1]) / n_right
+        reduction = n_left * n_right / n * (mean_left - mean_right) ** 2
+    # Only split right after an observed year, with enough points on both sides
+    allowed = (n_left >= min_segment) & (n_right >= min_segment) & observed[:, :-1]
+    reduction = np.where(allowed, reduction, -np.inf)
+
+    best = np.argmax(reduction, axis=1)
+    rows = np.arange(len(grid))
+    has_split = np.isfinite(reduction[rows, best])
+
+    # Noise variance from first differences of observed values (robust to the shift itself)
+    diffs = np.diff(np.where(observed, grid, np.nan), axis=1)
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        # Rows without two consecutive observations have no noise estimate
+        warnings.simplefilter('ignore', RuntimeWarning)
+        sigma = np.nanmedian(np.abs(diffs), axis=1) / (0.6745 * np.sqrt(2))
+        sigma = np.maximum(np.nan_to_num(sigma, nan=MIN_STD), MIN_STD / 2)
+        statistic = reduction[rows, best] / sigma ** 2 / (penalty * np.log(np.maximum(n[:, 0], 2)))
+
+    split = np.where(has_split, best + 1, -1)
+    statistic = np.where(has_split, statistic, np.nan)
+    mean_before = np.where(has_split, mean_left[rows, best], np.nan)
+    mean_after = np.where(has_split, mean_right[rows, best], np.nan)
+    return split, statistic, mean_before, mean_after, sigma
+
+
+class AnomalyReport:
+    """
+    Spikes, level shifts and change points of every series, as one event table.
+
+    ``score`` is in noise standard deviations for every kind (the |z| of a
+    spike, the CUSUM level of a shift, the mean difference over the series'
+    noise for a change point), so alerts of different kinds rank together.
+    """
+
+    def __init__(self, df, value_col='YouthUnemployment', window=DEFAULT_WINDOW, spike_z=SPIKE_Z,
+                 min_shift=MIN_SHIFT):
+        start = time.perf_counter()
+        self.countries, self.years, grid = series_grid(df, value_col)
+        self.last_year = int(self.years[np.flatnonzero((~np.isnan(grid)).any(axis=0))[-1]]) \
+            if np.isfinite(grid).any() else int(self.years[-1])
+
+        z = rolling_zscores(grid, window)
+        frames = []
+
+        # Spikes
+        rows, cols = np.nonzero(np.abs(np.nan_to_num(z)) >= spike_z)
+        frames.append(pd.DataFrame({
+            'Country': self.countries[rows],
+            'Year': self.years[cols],
+            'kind': 'spike',
+            'direction': np.where(z[rows, cols] > 0, 'up', 'down'),
+            'value': grid[rows, cols],
+            'score': np.abs(z[rows, cols]),
+            'detail': [f'z = {v:+.1f} vs trailing {window} years' for v in z[rows, cols]],
+        }))
+
+        # Level shifts
+        alarm, onset, level = cusum_alarms(z)
+        rows, cols = np.nonzero(alarm)
+        frames.append(pd.DataFrame({
+            'Country': self.countries[rows],
+            'Year': self.years[cols],
+            'kind': 'level shift',
+            'direction': np.where(alarm[rows, cols] > 0, 'up', 'down'),
+            'value': grid[rows, cols],
+            'score': level[rows, cols],
+            'detail': [f'sustained drift since {y}' for y in self.years[onset[rows, cols]]],
+        }))
+
+        # Change points
+        split, statistic, before, after, sigma = best_change_points(grid)
+        keep = (statistic > 1) & (np.abs(after - before) >= min_shift)
+        rows = np.flatnonzero(keep)
+        # Dated at the first observed year of the new segment (the split may land in a gap)
+        observed_cols = np.where(~np.isnan(grid), np.arange(grid.shape[1]), grid.shape[1])
+        next_observed = np.minimum.accumulate(observed_cols[:, ::-1], axis=1)[:, ::-1]
+        cols = next_observed[rows, split[rows]]
+        frames.append(pd.DataFrame({
+            'Country': self.countries[rows],
+            'Year': self.years[cols],
+            'kind': 'change point',
+            'direction': np.where(after[rows] > before[rows], 'up', 'down'),
+            'value': grid[rows, cols],
+            'score': np.abs(after[rows] - before[rows]) / sigma[rows],
+            'detail': [f'mean {b:.1f}% -> {a:.1f}%' for b, a in zip(before[rows], after[rows])],
+        }))
+
+        events = pd.concat(frames, ignore_index=True)
+        self.events = events.sort_values(['Country', 'Year', 'kind'], kind='stable').reset_index(drop=True)[EVENT_COLUMNS]
+        self.seconds = time.perf_counter() - start
+
+    def counts(self):
+        return self.events['kind'].value_counts().reindex(['spike', 'level shift', 'change point'], fill_value=0)
+
+    def in_range(self, year_range=None):
+        """Events within an inclusive year range"""
+        if year_range is None:
+            return self.events
+        years = self.events['Year']
+        return self.events[(years >= year_range[0]) & (years <= year_range[1])]
+
+    def alerts(self, recent_years=5, limit=None):
+        """Events of the latest ``recent_years`` of data, strongest first"""
+        recent = self.events[self.events['Year'] > self.last_year - recent_years]
+        recent = recent.sort_values(['score', 'Year'], ascending=[False, False], kind='stable')
+        return recent.head(limit) if limit else recent
+
+    def country_events(self, country):
+        return self.events[self.events['Country'] == country]
+
+
+def detect_anomalies(df, **kwargs):
+    """Run every detector over the panel (see AnomalyReport)"""
+    return AnomalyReport(df, **kwargs)
+
+
+if __name__ == '__main__':
+    from src.indicators import YOUTH_UNEMPLOYMENT, load_indicator_store
+    from src.regions import add_region_columns, countries_only
+
+    panel = countries_only(add_region_columns(load_indicator_store().wide([YOUTH_UNEMPLOYMENT], complete_grid=True)))
+    report = detect_anomalies(panel)
+    print(f"{len(report.events):,} events in {len(report.countries)} series, {report.seconds * 1000:.1f} ms")
+    print(report.counts().to_string())
+    print(f"\nAlerts since {report.last_year - 4}:")
+    print(report.alerts(limit=20).to_string(index=False))
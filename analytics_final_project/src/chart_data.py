@@ -0,0 +1,124 @@
+"""
+Chart data preparation: keep what is shipped to the browser small.
+
+Plotly figures are serialized to JSON and sent over the Streamlit websocket on
+every rerun, so the raw rows behind a chart cost bandwidth and client render
+time. This module prepares compact inputs instead:
+
+    histogram_frame   pre-bins values with np.histogram (nbins bars, not N points)
+    lttb_indices      Largest-Triangle-Three-Buckets downsampling of a line
+    downsample_lines  applies LTTB per series under a per-figure point budget
+
+``PayloadMeter`` measures the serialized size of each figure so the effect
+can be checked from the app's sidebar.
+"""
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Maximum number of points per line figure (all series combined)
+CHART_POINT_BUDGET = int(os.environ.get('CHART_POINT_BUDGET', 2000))
+
+
+def histogram_frame(values, nbins=50):
+    """Bin values server-side; returns bin_start, bin_end, bin_mid and count"""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return pd.DataFrame({'bin_start': [], 'bin_end': [], 'bin_mid': [], 'count': []})
+    counts, edges = np.histogram(values, bins=nbins)
+    return pd.DataFrame({
+        'bin_start': edges[:-1],
+        'bin_end': edges[1:],
+        'bin_mid': (edges[:-1] + edges[1:]) / 2,
+        'count': counts,
+    })
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    Always keeps the first and last point; each bucket in between keeps the
+    point forming the largest triangle with the previous pick and the next
+    bucket's centroid. Returns all indices when no reduction is needed.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[edges[i + 1]:edges[i + 2]].mean()
+            next_y = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_lines(df, x, y, color=None, max_points=CHART_POINT_BUDGET):
+    """
+    Reduce a long-format line frame to at most ``max_points`` points.
+
+    The budget is split evenly across the series in ``color``. Frames already
+    within budget are returned unchanged, gaps (NaN) included.
+    """
+    if len(df) <= max_points:
+        return df
+
+    df = df.dropna(subset=[y])
+    if color is None:
+        groups = [np.arange(len(df))]
+    else:
+        codes = pd.factorize(df[color])[0]
+        order = np.argsort(codes, kind='stable')
+        groups = np.split(order, np.flatnonzero(np.diff(codes[order])) + 1)
+
+    per_series = max(max_points // max(len(groups), 1), 3)
+    xs, ys = df[x].to_numpy(), df[y].to_numpy()
+    keep = [rows[lttb_indices(xs[rows], ys[rows], per_series)] for rows in groups]
+    return df.iloc[np.sort(np.concatenate(keep))]
+
+
+def figure_payload_bytes(fig):
+    """Size of the figure's JSON payload as sent to the browser"""
+    return len(fig.to_json().encode('utf-8'))
+
+
+class PayloadMeter:
+    """Bytes shipped per chart id during one script run"""
+
+    def __init__(self):
+        self.charts = OrderedDict()
+
+    def record(self, chart_id, fig):
+        """Record a figure, its serialized JSON or its payload size in bytes under ``chart_id``"""
+        if isinstance(fig, int):
+            size = fig
+        else:
+            size = len(fig.encode('utf-8')) if isinstance(fig, str) else figure_payload_bytes(fig)
+        self.charts[chart_id] = size
+        return size
+
+    @property
+    def total_bytes(self):
+        return sum(self.charts.values())
+
+    def to_frame(self):
+        return pd.DataFrame({'chart': list(self.charts), 'KB': [b / 1024 for b in self.charts.values()]})
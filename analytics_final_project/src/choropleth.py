@@ -0,0 +1,152 @@
+"""
+Per-year choropleth frames for the World Map page.
+
+A Plotly animation built with ``px.choropleth(animation_frame='Year')``
+serializes every year of every country (with names, hover templates and a
+full trace per frame) on each rerun. ChoroplethFrames instead keeps, once per
+data version, one float32 (year x country) grid over countries with an ISO3
+code (WDI aggregates excluded) and the observed (ISO3, value) pairs of every
+year.
+
+``window_figure`` ships the country list once and, per year, only a float32
+array of values, for a window of years: the visible year plus ``radius``
+neighbours on each side, as Plotly frames that the map's own
+slider / play button steps through in the browser without a rerun. Moving
+further (the page's year slider) sends the next window, which the figure
+cache serves after its first build, so the initial payload stays a few
+frames whatever the number of years.
+
+Usage:
+    python -m src.choropleth        # payload of a window vs all years
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_RADIUS = 2
+COLOR_SCALE = 'Reds'
+VALUE_DECIMALS = 2
+
+
+class ChoroplethFrames:
+    """Observed (ISO3, value) pairs per year over countries, from one (year x country) grid"""
+
+    def __init__(self, df, value_col='YouthUnemployment'):
+        countries = df[~df['is_aggregate'].to_numpy(dtype=bool) & df['ISO3'].notna().to_numpy()]
+        codes, iso3 = pd.factorize(countries['ISO3'].astype(object), sort=True)
+        names = countries.groupby(codes)['Country'].first()
+
+        years = countries['Year'].to_numpy(dtype=np.int64)
+        self.min_year = int(years.min())
+        self.max_year = int(years.max())
+        self.iso3 = np.asarray(iso3, dtype=object)
+        self.names = names.astype(object).to_numpy()
+
+        grid = np.full((self.max_year - self.min_year + 1, len(iso3)), np.nan, dtype=np.float32)
+        grid[years - self.min_year, codes] = countries[value_col].to_numpy(dtype=np.float32)
+        self.grid = np.round(grid, VALUE_DECIMALS)
+        self.observed = ~np.isnan(self.grid)
+
+        # One colour scale for every year so frames are comparable
+        values = self.grid[self.observed]
+        self.zmin = float(values.min()) if len(values) else 0.0
+        self.zmax = float(np.percentile(values, 99)) if len(values) else 1.0
+
+    @property
+    def nbytes(self):
+        return self.grid.nbytes + self.observed.nbytes
+
+    @property
+    def years_with_data(self):
+        return np.flatnonzero(self.observed.any(axis=1)) + self.min_year
+
+    def latest_year(self, year_range=None):
+        """Latest year with data (within ``year_range`` if given)"""
+        years = self.years_with_data
+        if year_range is not None:
+            years = years[(years >= year_range[0]) & (years <= year_range[1])]
+        return int(years[-1]) if len(years) else None
+
+    def frame(self, year):
+        """(ISO3, Country, value) of the countries observed in ``year``"""
+        row = int(year) - self.min_year
+        if not 0 <= row < len(self.grid):
+            return pd.DataFrame({'ISO3': [], 'Country': [], 'value': []})
+        columns = np.flatnonzero(self.observed[row])
+        return pd.DataFrame({'ISO3': self.iso3[columns], 'Country': self.names[columns],
+                             'value': self.grid[row, columns]})
+
+    def window(self, year, radius=DEFAULT_RADIUS, year_range=None):
+        """The visible year and up to ``radius`` neighbours on each side that have data"""
+        years = self.years_with_data
+        if year_range is not None:
+            years = years[(years >= year_range[0]) & (years <= year_range[1])]
+        position = int(np.searchsorted(years, year))
+        return [int(y) for y in years[max(position - radius, 0):position + radius + 1]]
+
+
+def _values(frames, year):
+    return frames.grid[int(year) - frames.min_year]
+
+
+def _base_trace(frames, year):
+    import plotly.graph_objects as go
+
+    # Every country is listed once; frames only carry ``z`` (NaN where a year has no data)
+    return go.Choropleth(
+        locations=frames.iso3.tolist(),
+        z=_values(frames, year),
+        text=frames.names.tolist(),
+        zmin=frames.zmin,
+        zmax=frames.zmax,
+        colorscale=COLOR_SCALE,
+        colorbar=dict(title='Rate (%)'),
+        hovertemplate='%{text}<br>%{z:.2f}%<extra></extra>',
+    )
+
+
+def window_figure(frames, year, radius=DEFAULT_RADIUS, year_range=None, value_label='Youth Unemployment'):
+    """Choropleth of ``year`` with the neighbouring years as animation frames"""
+    import plotly.graph_objects as go
+
+    years = frames.window(year, radius, year_range)
+    fig = go.Figure(data=[_base_trace(frames, year)],
+                    frames=[go.Frame(name=str(y), data=[go.Choropleth(z=_values(frames, y))]) for y in years])
+    step_args = dict(mode='immediate', frame=dict(duration=300, redraw=True), transition=dict(duration=0))
+    fig.update_layout(
+        title=f"{value_label} by Country, {year}",
+        height=550,
+        margin=dict(l=0, r=0, t=50, b=0),
+        geo=dict(showframe=False, projection_type='natural earth'),
+        sliders=[dict(
+            active=years.index(year) if year in years else 0,
+            currentvalue=dict(prefix='Year: '),
+            steps=[dict(label=str(y), method='animate', args=[[str(y)], step_args]) for y in years],
+        )],
+        updatemenus=[dict(
+            type='buttons',
+            showactive=False,
+            x=0, y=0, xanchor='right', yanchor='top',
+            buttons=[dict(label='▶', method='animate', args=[None, dict(step_args, fromcurrent=True)])],
+        )],
+    )
+    return fig
+
+
+if __name__ == '__main__':
+    import plotly.express as px
+
+    from src.chart_data import figure_payload_bytes
+    from src.indicators import YOUTH_UNEMPLOYMENT, load_indicator_store
+    from src.regions import add_region_columns, countries_only
+
+    df = add_region_columns(load_indicator_store().wide([YOUTH_UNEMPLOYMENT], complete_grid=True))
+    frames = ChoroplethFrames(df)
+    year = frames.latest_year()
+    window = figure_payload_bytes(window_figure(frames, year))
+    full = countries_only(df).dropna(subset=['YouthUnemployment', 'ISO3'])
+    all_years = figure_payload_bytes(px.choropleth(full.astype({'ISO3': object}), locations='ISO3',
+                                                   color='YouthUnemployment', animation_frame='Year'))
+    print(f"{len(frames.iso3)} countries, {len(frames.years_with_data)} years with data, "
+          f"grid {frames.nbytes / 1024:.0f} KB")
+    print(f"Window of {len(frames.window(year))} years: {window / 1024:.0f} KB; all years: {all_years / 1024:.0f} KB")
@@ -0,0 +1,292 @@
+"""
+Columnar data store for the World Bank extracts used by the dashboard.
+
+Each source CSV is parsed once and written next to it as an uncompressed
+Arrow IPC (Feather v2) file with compact dtypes:
+
+    Country, CountryCode, region  -> categorical
+    other repeated strings        -> categorical
+    Year                          -> int16
+    small integer features        -> int8 / int16
+    rates / engineered features   -> float32
+
+Later loads memory-map the Feather file instead of re-parsing CSV text. A small
+JSON manifest records the source file's mtime, size and SHA-256; the store is
+rebuilt only when the source content actually changes.
+
+New rows can be appended as additional Feather parts (see ``append_store``),
+so a yearly data refresh does not rewrite the existing file. Parts are
+memory-mapped and concatenated on load, and compacted once there are many.
+
+The data directory can be pointed elsewhere with the APP_DATA_DIR environment
+variable (e.g. the synthetic datasets used by benchmarks/bench_sessions.py).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.environ.get('APP_DATA_DIR') or os.path.join(PROJECT_ROOT, 'data')
+RAW_CSV_PATH = os.path.join(DATA_DIR, 'youth_unemployment_global.csv')
+PROCESSED_CSV_PATH = os.path.join(DATA_DIR, 'youth_unemployment_processed.csv')
+
+# Bump when the on-disk layout changes so stale stores are rebuilt
+STORE_FORMAT_VERSION = 3
+
+# Appended parts are merged back into a single file beyond this many
+MAX_STORE_PARTS = 8
+
+CATEGORICAL_COLUMNS = ['Country', 'CountryCode', 'region', 'income_group']
+
+# Other string columns become categorical when values repeat at least this often on average
+MIN_REPEATS_FOR_CATEGORY = 2
+
+
+# Permissions a plain open() would give a new file (mkstemp creates it owner-only)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def replacing(path):
+    """
+    Yield a unique temporary path next to ``path``, moved over it once the block succeeds.
+
+    Every writer gets its own file (the launcher's disk warm-up and the Streamlit
+    process may rebuild the same store at once), so none can rename or truncate
+    another's half-written file; the temporary file is removed if the block fails.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Return the hex SHA-256 digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def optimize_dtypes(df):
+    """Downcast a loaded frame to the store's compact dtypes (in place)"""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    if 'Year' in df.columns:
+        df['Year'] = df['Year'].astype(np.int16)
+    for col in df.columns:
+        dtype = df[col].dtype
+        if dtype == np.float64:
+            df[col] = df[col].astype(np.float32)
+        elif dtype == np.int64 and len(df):
+            low, high = df[col].min(), df[col].max()
+            for small in (np.int8, np.int16):
+                if np.iinfo(small).min <= low and high <= np.iinfo(small).max:
+                    df[col] = df[col].astype(small)
+                    break
+        elif pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype):
+            if len(df) >= MIN_REPEATS_FOR_CATEGORY * max(df[col].nunique(), 1):
+                df[col] = df[col].astype('category')
+    return df
+
+
+def read_csv(csv_path):
+    """Parse a World Bank CSV extract into a frame with compact dtypes"""
+    # Only empty cells are missing: the default NA list would turn Namibia's
+    # country code "NA" into NaN
+    df = pd.read_csv(csv_path, keep_default_na=False, na_values=[''])
+    return optimize_dtypes(df)
+
+
+def store_paths(csv_path):
+    """Return the (base feather, manifest) paths backing a source CSV"""
+    name = os.path.splitext(os.path.basename(csv_path))[0]
+    store_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), '.store')
+    return (os.path.join(store_dir, f'{name}.feather'),
+            os.path.join(store_dir, f'{name}.manifest.json'))
+
+
+def _part_paths(csv_path, manifest):
+    store_dir = os.path.dirname(store_paths(csv_path)[0])
+    return [os.path.join(store_dir, part) for part in manifest['parts']]
+
+
+def read_manifest(csv_path):
+    """Return the stored manifest for a source CSV, or None"""
+    _, manifest_path = store_paths(csv_path)
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest_path, manifest):
+    with replacing(manifest_path) as tmp_path, open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def is_store_current(csv_path):
+    """
+    Check whether the columnar store still matches its source CSV.
+
+    An unchanged mtime and size is trusted without reading the source. If
+    either changed, the SHA-256 decides; a touched-but-identical file only
+    refreshes the manifest.
+    """
+    _, manifest_path = store_paths(csv_path)
+    manifest = read_manifest(csv_path)
+    if manifest is None or manifest.get('format_version') != STORE_FORMAT_VERSION:
+        return False
+    if not all(os.path.exists(path) for path in _part_paths(csv_path, manifest)):
+        return False
+
+    stat = os.stat(csv_path)
+    if manifest['source_mtime_ns'] == stat.st_mtime_ns and manifest['source_size'] == stat.st_size:
+        return True
+
+    if file_sha256(csv_path) != manifest['source_sha256']:
+        return False
+
+    manifest['source_mtime_ns'] = stat.st_mtime_ns
+    manifest['source_size'] = stat.st_size
+    try:
+        _write_manifest(manifest_path, manifest)
+    except OSError:
+        pass
+    return True
+
+
+def _write_part(df, path):
+    # Uncompressed so the file can be memory-mapped without a decode step
+    with replacing(path) as tmp_path:
+        feather.write_feather(df, tmp_path, compression='uncompressed')
+
+
+def _source_fields(csv_path, source_sha256):
+    stat = os.stat(csv_path)
+    return {
+        'source': os.path.basename(csv_path),
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_size': stat.st_size,
+        'source_sha256': source_sha256 or file_sha256(csv_path),
+    }
+
+
+def write_store(df, csv_path, source_sha256=None, extra=None):
+    """
+    Write a frame as the columnar store for ``csv_path`` and return its manifest.
+
+    ``extra`` holds additional manifest fields, e.g. the raw data version a
+    derived dataset was built from.
+    """
+    feather_path, manifest_path = store_paths(csv_path)
+    os.makedirs(os.path.dirname(feather_path), exist_ok=True)
+
+    old_manifest = read_manifest(csv_path)
+    _write_part(df, feather_path)
+
+    manifest = {
+        'format_version': STORE_FORMAT_VERSION,
+        **_source_fields(csv_path, source_sha256),
+        'rows': int(len(df)),
+        'columns': list(df.columns),
+        'parts': [os.path.basename(feather_path)],
+        **(extra or {}),
+    }
+    _write_manifest(manifest_path, manifest)
+
+    # Drop parts left over from earlier appends
+    if old_manifest and 'parts' in old_manifest:
+        for path in _part_paths(csv_path, old_manifest)[1:]:
+            if os.path.exists(path):
+                os.remove(path)
+    return manifest
+
+
+def append_store(df, csv_path, source_sha256=None, extra=None):
+    """
+    Append rows to an existing store as a new Feather part.
+
+    The manifest is re-pointed at the (already updated) source file, so the
+    store stays current without a rebuild. Falls back to a full write when
+    there is no usable store, and compacts once MAX_STORE_PARTS is reached.
+    """
+    manifest = read_manifest(csv_path)
+    if manifest is None or manifest.get('format_version') != STORE_FORMAT_VERSION:
+        return write_store(df, csv_path, source_sha256, extra)
+    if len(manifest['parts']) >= MAX_STORE_PARTS:
+        combined = pd.concat([_read_parts(csv_path, manifest), df], ignore_index=True)
+        return write_store(combined, csv_path, source_sha256, extra)
+
+    df = optimize_dtypes(df[manifest['columns']].copy())
+    feather_path, manifest_path = store_paths(csv_path)
+    name = os.path.splitext(os.path.basename(feather_path))[0]
+    part = f'{name}.part{len(manifest["parts"])}.feather'
+    _write_part(df, os.path.join(os.path.dirname(feather_path), part))
+
+    manifest.update(_source_fields(csv_path, source_sha256))
+    manifest['rows'] += int(len(df))
+    manifest['parts'].append(part)
+    manifest.update(extra or {})
+    _write_manifest(manifest_path, manifest)
+    return manifest
+
+
+def _read_parts(csv_path, manifest):
+    tables = [feather.read_table(path, memory_map=True) for path in _part_paths(csv_path, manifest)]
+    if len(tables) == 1:
+        return tables[0].to_pandas()
+    # Parts may differ in pandas metadata or in all-null categorical columns
+    schema = tables[0].schema
+    return pa.concat_tables([t.cast(schema) for t in tables]).to_pandas()
+
+
+def build_store(csv_path=RAW_CSV_PATH):
+    """Parse the source CSV and (re)write its columnar store"""
+    df = read_csv(csv_path)
+    return write_store(df, csv_path)
+
+
+def load_store(csv_path=RAW_CSV_PATH):
+    """
+    Load a dataset through its columnar store.
+
+    Builds the store on first use or when the source changed. If the data
+    directory is read-only the CSV is parsed directly instead.
+    """
+    if not is_store_current(csv_path):
+        try:
+            build_store(csv_path)
+        except OSError:
+            return read_csv(csv_path)
+
+    return _read_parts(csv_path, read_manifest(csv_path))
+
+
+def data_version(csv_path=RAW_CSV_PATH):
+    """Short content hash identifying the current version of a dataset"""
+    manifest = read_manifest(csv_path) if is_store_current(csv_path) else None
+    sha = manifest['source_sha256'] if manifest else file_sha256(csv_path)
+    return sha[:12]
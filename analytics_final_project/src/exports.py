@@ -0,0 +1,150 @@
+"""
+File exports of the Data Explorer tables: CSV, Parquet and Excel.
+
+``st.download_button(df.to_csv())`` renders the whole file into memory on
+every rerun, downloaded or not. The app instead hands the button a callable,
+so a file is only produced when it is clicked, and that callable goes through
+``ExportCache``: the bytes are kept for
+
+    (table, year_range, selected countries, data version, format)
+
+so downloading the same file again (from any session) costs nothing.
+
+Files are written chunk by chunk: the filtered rows are a zero-copy slice of
+the indexed store (DataIndex), cut into ``chunk_rows`` slices that are
+formatted one at a time (CSV text, one Parquet row group, rows appended to a
+write-only Excel sheet), so no full-size intermediate (one CSV string, an
+object copy of the frame) is ever built.
+
+Usage:
+    python -m src.exports           # size and time per format on the bundled extract
+"""
+
+import io
+
+import numpy as np
+
+from src.figure_cache import FigureCache
+
+FORMATS = {
+    'csv': 'CSV',
+    'parquet': 'Parquet',
+    'xlsx': 'Excel',
+}
+
+MIME_TYPES = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+EXPORT_CHUNK_ROWS = 100_000
+EXCEL_MAX_ROWS = 1_048_576  # per sheet, header included
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def iter_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Consecutive row slices of ``df`` (views, not copies)"""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def write_csv(chunks, out, sheet_name=None):
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(out, header=i == 0, index=False, encoding='utf-8')
+
+
+def write_parquet(chunks, out, sheet_name=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(out, table.schema)
+        writer.write_table(table)
+    writer.close()
+
+
+def _excel_rows(chunk):
+    """Rows of ``chunk`` as Python values, with None for missing cells (openpyxl writes NaN as text)"""
+    columns = []
+    for name in chunk.columns:
+        values = chunk[name].to_numpy(dtype=object)
+        columns.append(np.where(chunk[name].isna().to_numpy(), None, values))
+    return zip(*columns)
+
+
+def write_xlsx(chunks, out, sheet_name='data'):
+    from openpyxl import Workbook
+
+    # Write-only workbook: rows are streamed to the file instead of kept as cell objects
+    workbook = Workbook(write_only=True)
+    sheet, rows_in_sheet, header = None, 0, None
+    for chunk in chunks:
+        header = [str(c) for c in chunk.columns]
+        for row in _excel_rows(chunk):
+            if sheet is None or rows_in_sheet == EXCEL_MAX_ROWS:
+                # Continue on a new sheet past Excel's row limit
+                sheet = workbook.create_sheet(sheet_name if sheet is None else f'{sheet_name} ({len(workbook.worksheets) + 1})')
+                sheet.append(header)
+                rows_in_sheet = 1
+            sheet.append(row)
+            rows_in_sheet += 1
+    if sheet is None:
+        workbook.create_sheet(sheet_name).append(header or [])
+    workbook.save(out)
+
+
+WRITERS = {
+    'csv': write_csv,
+    'parquet': write_parquet,
+    'xlsx': write_xlsx,
+}
+
+
+def export_bytes(df, fmt, chunk_rows=EXPORT_CHUNK_ROWS, sheet_name='data'):
+    """``df`` as a CSV, Parquet or Excel file, written ``chunk_rows`` rows at a time"""
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format {fmt!r} (expected one of {', '.join(WRITERS)})")
+    out = io.BytesIO()
+    WRITERS[fmt](iter_chunks(df, chunk_rows), out, sheet_name=sheet_name)
+    return out.getvalue()
+
+
+def export_file_name(table, fmt, year_range=None, view=None):
+    """e.g. youth_unemployment_regions_2000-2024.csv (``view``: imputation strategy, if any)"""
+    years = f'_{year_range[0]}-{year_range[1]}' if year_range is not None else ''
+    view = f'_{view}' if view is not None else ''
+    return f'youth_unemployment_{table}{view}{years}.{fmt}'
+
+
+class ExportCache(FigureCache):
+    """LRU of generated export files, bounded by entry count and bytes; files over the cap are not kept"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        super().__init__(max_entries, max_bytes)
+
+    def get_or_build(self, key, build):
+        """Cached bytes for ``key``, calling ``build()`` (which returns the file's bytes) on a miss"""
+        data = self.get(key)
+        if data is None:
+            data = build()
+            self.put(key, data)
+        return data
+
+
+if __name__ == '__main__':
+    import time
+
+    from src.indicators import YOUTH_UNEMPLOYMENT, load_indicator_store
+    from src.query import DataIndex
+    from src.regions import add_region_columns
+
+    rows = DataIndex(add_region_columns(load_indicator_store().wide([YOUTH_UNEMPLOYMENT], complete_grid=True))).select()
+    for fmt, label in FORMATS.items():
+        start = time.perf_counter()
+        data = export_bytes(rows, fmt)
+        print(f"{label:<8} {len(rows):,} rows -> {len(data) / 1024:,.0f} KB in {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,273 @@
+"""
+Feature engineering pipeline for the youth unemployment panel.
+
+Implements the 25 engineered features described in reports/final_report.md
+(section 4) and writes ``data/youth_unemployment_processed.csv``:
+
+    Rate         value (rate forward-filled within country)
+    Temporal     year_from_start, decade, is_recent
+    Lags         lag_1, lag_2, lag_3
+    Rolling      rolling_mean_3, rolling_std_3, rolling_mean_5, rolling_std_5
+    Change       yoy_change, yoy_pct_change, acceleration, trend_deviation_5
+    Categorical  region, income_group, is_developed, region_* dummies (7)
+
+All features are computed over (Country, Year) sorted NumPy arrays:
+forward-fill, lags and rolling windows use per-country segment offsets
+instead of per-country Python loops or groupby-apply.
+
+``build_processed_tail`` recomputes only the rows affected by new or revised
+years (see src/refresh.py), reading just FEATURE_LOOKBACK years of history.
+
+Usage:
+    python -m src.features          # (re)write the processed dataset
+"""
+
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from src.data_store import (PROCESSED_CSV_PATH, RAW_CSV_PATH, data_version, load_store,
+                            optimize_dtypes, read_manifest, replacing, write_store)
+from src.regions import add_region_columns, load_region_table
+
+VALUE_COLUMN = 'YouthUnemployment'
+RECENT_YEAR = 2010
+
+# Years of history a feature row depends on (rolling_mean_5 reads t-4..t)
+FEATURE_LOOKBACK = 4
+
+# Inputs of the forecasting model (see src/forecasting.py)
+FEATURE_COLUMNS = [
+    'value',
+    'lag_1',
+    'lag_2',
+    'lag_3',
+    'rolling_mean_3',
+    'rolling_mean_5',
+    'rolling_std_3',
+    'yoy_change',
+    'year_from_start',
+]
+
+NUMERIC_FEATURES = [
+    'value',
+    'year_from_start',
+    'decade',
+    'is_recent',
+    'lag_1',
+    'lag_2',
+    'lag_3',
+    'rolling_mean_3',
+    'rolling_std_3',
+    'rolling_mean_5',
+    'rolling_std_5',
+    'yoy_change',
+    'yoy_pct_change',
+    'acceleration',
+    'trend_deviation_5',
+]
+
+
+def sort_panel(df):
+    """Return the frame sorted by (Country, Year) with a fresh RangeIndex"""
+    return df.sort_values(['Country', 'Year'], kind='stable').reset_index(drop=True)
+
+
+class Segments:
+    """Row offsets of each country's contiguous block in a sorted panel"""
+
+    def __init__(self, group_keys):
+        keys = np.asarray(group_keys)
+        n = len(keys)
+        is_start = np.ones(n, dtype=bool)
+        if n:
+            is_start[1:] = keys[1:] != keys[:-1]
+        self.starts = np.flatnonzero(is_start)
+        self.group = np.cumsum(is_start) - 1
+        # Position of every row within its own country block
+        self.position = np.arange(n) - self.starts[self.group] if n else np.empty(0, dtype=np.int64)
+
+    def ffill(self, x):
+        """Forward-fill NaNs without crossing block boundaries"""
+        n = len(x)
+        idx = np.where(~np.isnan(x), np.arange(n), -1)
+        np.maximum.accumulate(idx, out=idx)
+        # A last-valid index from an earlier block means "nothing observed yet"
+        idx[idx < self.starts[self.group]] = -1
+        out = np.where(idx >= 0, x[np.maximum(idx, 0)], np.nan)
+        return out
+
+    def shift(self, x, k):
+        """Value k rows earlier in the same block (NaN where unavailable)"""
+        out = np.full(len(x), np.nan)
+        if k < len(x):
+            out[k:] = x[:len(x) - k]
+        out[self.position < k] = np.nan
+        return out
+
+    def rolling(self, x, window, min_periods=1):
+        """Trailing-window mean and sample std (ddof=1) that ignore NaNs"""
+        # Windows are a handful of rows, so stacking shifted copies is cheap and
+        # avoids the cancellation error of cumulative-sum differences
+        stacked = np.vstack([self.shift(x, k) if k else x for k in range(window)])
+        valid = ~np.isnan(stacked)
+        count = valid.sum(axis=0)
+        total = np.where(valid, stacked, 0.0).sum(axis=0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count >= min_periods, total / count, np.nan)
+            squares = np.where(valid, (stacked - mean) ** 2, 0.0).sum(axis=0)
+            std = np.where(count >= max(min_periods, 2), np.sqrt(squares / (count - 1)), np.nan)
+        return mean, std
+
+
+def time_series_features(panel, value_col=VALUE_COLUMN, start_year=None):
+    """
+    Numeric features for a (Country, Year) sorted panel.
+
+    Each country is expected to have one row per year, as in the WDI
+    extract, so lags and windows are taken by row. Returns a frame aligned
+    with ``panel`` holding NUMERIC_FEATURES.
+    """
+    years = panel['Year'].to_numpy(dtype=np.int64)
+    if start_year is None:
+        start_year = int(years.min()) if len(years) else 0
+
+    countries = panel['Country']
+    keys = countries.cat.codes.to_numpy() if isinstance(countries.dtype, pd.CategoricalDtype) else pd.factorize(countries)[0]
+    segments = Segments(keys)
+
+    value = segments.ffill(panel[value_col].to_numpy(dtype=np.float64))
+    lag_1 = segments.shift(value, 1)
+    rolling_mean_3, rolling_std_3 = segments.rolling(value, 3)
+    rolling_mean_5, rolling_std_5 = segments.rolling(value, 5)
+    yoy_change = value - lag_1
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        yoy_pct_change = np.where(lag_1 != 0, yoy_change / lag_1 * 100, np.nan)
+
+    return pd.DataFrame({
+        'value': value,
+        'year_from_start': years - start_year,
+        'decade': years // 10 * 10,
+        'is_recent': (years >= RECENT_YEAR).astype(np.int8),
+        'lag_1': lag_1,
+        'lag_2': segments.shift(value, 2),
+        'lag_3': segments.shift(value, 3),
+        'rolling_mean_3': rolling_mean_3,
+        'rolling_std_3': rolling_std_3,
+        'rolling_mean_5': rolling_mean_5,
+        'rolling_std_5': rolling_std_5,
+        'yoy_change': yoy_change,
+        'yoy_pct_change': yoy_pct_change,
+        'acceleration': yoy_change - segments.shift(yoy_change, 1),
+        'trend_deviation_5': value - rolling_mean_5,
+    }, index=panel.index)
+
+
+def region_dummy_name(region):
+    """Column name of a region's one-hot indicator, e.g. 'region_south_asia'"""
+    return 'region_' + re.sub(r'[^a-z0-9]+', '_', region.lower()).strip('_')
+
+
+def categorical_features(panel):
+    """Region, income group, development status and one-hot region indicators"""
+    if 'region' not in panel.columns:
+        panel = add_region_columns(panel.copy())
+
+    features = pd.DataFrame({
+        'region': panel['region'].values,
+        'income_group': panel['income_group'].values,
+        'is_developed': (panel['income_group'] == 'High income').to_numpy(dtype=np.int8),
+    }, index=panel.index)
+
+    # One column per region in the lookup table, so the schema is stable
+    region_codes = pd.Categorical(panel['region'].astype(object), categories=sorted(load_region_table()['region'].dropna().unique()))
+    dummies = np.zeros((len(panel), len(region_codes.categories)), dtype=np.int8)
+    has_region = region_codes.codes >= 0
+    dummies[np.flatnonzero(has_region), region_codes.codes[has_region]] = 1
+    for i, region in enumerate(region_codes.categories):
+        features[region_dummy_name(region)] = dummies[:, i]
+    return features
+
+
+def build_processed(df, value_col=VALUE_COLUMN, start_year=None):
+    """
+    Build the processed modelling dataset from the raw long frame.
+
+    Features use the full yearly grid; the result keeps only rows with an
+    observed rate (the report's "complete observations").
+    """
+    panel = sort_panel(df)
+    if 'region' not in panel.columns:
+        panel = add_region_columns(panel)
+
+    processed = pd.concat([
+        panel[['Country', 'CountryCode', 'Year', value_col, 'is_aggregate']],
+        time_series_features(panel, value_col, start_year),
+        categorical_features(panel),
+    ], axis=1)
+    return processed[processed[value_col].notna()].reset_index(drop=True)
+
+
+def build_processed_tail(df, first_years, value_col=VALUE_COLUMN, start_year=None):
+    """
+    Processed rows from each affected country's first changed year onward.
+
+    ``first_years`` maps Country -> first new or revised year. Only the
+    FEATURE_LOOKBACK years before it are used, with the last earlier
+    observation seeding the within-country forward fill.
+    """
+    if start_year is None:
+        start_year = int(df['Year'].min())
+    first = df['Country'].astype(object).map(first_years).to_numpy(dtype=np.float64)
+    years = df['Year'].to_numpy()
+    affected = ~np.isnan(first)
+
+    window = df[affected & (years >= first - FEATURE_LOOKBACK)]
+    earlier = df[affected & (years < first - FEATURE_LOOKBACK) & df[value_col].notna().to_numpy()]
+    seeds = earlier.sort_values('Year').groupby('Country', observed=True)[value_col].last()
+
+    panel = sort_panel(window)
+    starts = Segments(panel['Country'].astype(object).to_numpy()).starts
+    seed_values = panel['Country'].iloc[starts].astype(object).map(seeds).to_numpy(dtype=np.float64)
+    values = panel[value_col].to_numpy(dtype=np.float64, copy=True)
+    values[starts] = np.where(np.isnan(values[starts]), seed_values, values[starts])
+    panel[value_col] = values
+
+    tail = build_processed(panel, value_col, start_year)
+    keep = tail['Year'].to_numpy() >= tail['Country'].astype(object).map(first_years).to_numpy(dtype=np.float64)
+    return tail[keep].reset_index(drop=True)
+
+
+def write_processed(df=None, path=PROCESSED_CSV_PATH, raw_version=None):
+    """
+    Write the processed dataset and its columnar store.
+
+    The store manifest records the raw data version it was built from so
+    ``load_processed`` can tell when it is stale.
+    """
+    if df is None:
+        df = load_store(RAW_CSV_PATH)
+    if raw_version is None:
+        raw_version = data_version(RAW_CSV_PATH)
+    processed = build_processed(df)
+    with replacing(path) as tmp_path:
+        processed.to_csv(tmp_path, index=False)
+    write_store(optimize_dtypes(processed), path, extra={'raw_version': raw_version})
+    return processed
+
+
+def load_processed(raw_version, path=PROCESSED_CSV_PATH):
+    """Load the processed dataset, rebuilding it if it predates ``raw_version``"""
+    manifest = read_manifest(path)
+    if not os.path.exists(path) or manifest is None or manifest.get('raw_version') != raw_version:
+        write_processed(load_store(RAW_CSV_PATH), path, raw_version)
+    return load_store(path)
+
+
+if __name__ == '__main__':
+    processed = write_processed()
+    print(f"Wrote {len(processed):,} rows x {processed.shape[1]} columns to {PROCESSED_CSV_PATH}")
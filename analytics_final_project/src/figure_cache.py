@@ -0,0 +1,121 @@
+"""
+Cache of built Plotly figures keyed on the filter state they were built for.
+
+Streamlit reruns the whole script on every widget change, so without a cache
+each chart's aggregation and Plotly construction are repeated even when its
+inputs did not change (e.g. switching back to a page). ``FigureCache`` keeps
+the ``go.Figure`` for
+
+    (chart id, year_range, selected countries, data version, extra params)
+
+with LRU eviction bounded by both an entry count and a total size in bytes
+(each figure's JSON payload, measured once when it is built).
+
+Figures rather than their JSON are kept because ``st.plotly_chart`` rebuilds
+and validates a ``go.Figure`` from a plain dict on every call, about as costly
+as building the chart; a cached figure is only copied to a dict. Cached
+figures are never modified after they are built, so one cache is safely
+shared by all sessions.
+"""
+
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def figure_key(chart_id, year_range=None, countries=None, data_version=None, params=()):
+    """Hashable cache key; country order is kept since it sets trace colours"""
+    return (
+        chart_id,
+        tuple(int(y) for y in year_range) if year_range is not None else None,
+        tuple(countries) if countries is not None else None,
+        data_version,
+        tuple(params),
+    )
+
+
+class FigureCache:
+    """Thread-safe LRU of figures with an entry and memory cap"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Cached value for ``key`` or None; counts a hit or a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def entry_bytes(self, key):
+        """Size recorded for ``key`` (0 if not cached); not counted as a lookup"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else 0
+
+    def put(self, key, value, size=None):
+        """Store ``value`` under ``key``; ``size`` defaults to ``len(value)``"""
+        size = len(value) if size is None else size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_build(self, key, build):
+        """
+        Return the figure for ``key``, calling ``build()`` on a miss.
+
+        ``build`` returns a Plotly figure; it is serialized once to record its
+        payload size and stored as is.
+        """
+        fig = self.get(key)
+        if fig is None:
+            fig = build()
+            self.put(key, fig, len(fig.to_json().encode('utf-8')))
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Counters for monitoring: hits, misses, evictions, entries, bytes, hit_rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
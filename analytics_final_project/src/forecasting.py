@@ -0,0 +1,222 @@
+"""
+Forecasting engine behind the Predictions page.
+
+A single gradient-boosted model is trained on the pooled country panel with
+the forecast horizon (1-5 years) as an input feature, predicting the change
+from the last observed rate. Prediction intervals come from the absolute
+errors of a time-based holdout (origins whose target year is 2015 or later),
+kept per horizon so any confidence level can be served.
+
+The trained model, holdout errors and each country's forecast-origin features
+are serialized together with joblib and tagged with the data version they
+were trained on. Artifacts live in models/ unless APP_MODEL_DIR points elsewhere.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingRegressor
+
+from src.data_store import PROJECT_ROOT, replacing
+from src.features import FEATURE_COLUMNS, VALUE_COLUMN, sort_panel, time_series_features
+
+MODEL_DIR = os.environ.get('APP_MODEL_DIR') or os.path.join(PROJECT_ROOT, 'models')
+FORECASTER_PATH = os.path.join(MODEL_DIR, 'forecaster.joblib')
+
+# Bump when features or the model change so stale artifacts are retrained
+FORECASTER_FORMAT_VERSION = 1
+
+HORIZONS = (1, 2, 3, 4, 5)
+VALIDATION_START_YEAR = 2015
+MODEL_COLUMNS = FEATURE_COLUMNS + ['horizon']
+
+
+def make_model():
+    """Default regressor; handles the missing lags of short series natively"""
+    return HistGradientBoostingRegressor(max_iter=300, learning_rate=0.05, random_state=0)
+
+
+def supervised_frame(panel, features, horizons=HORIZONS, value_col=VALUE_COLUMN):
+    """
+    Stack (features at year t, horizon h) -> rate at t + h for every horizon.
+
+    Only origins with a forward-filled value and observed targets are kept.
+    """
+    country = panel['Country']
+    frames = []
+    for h in horizons:
+        target = panel[value_col].groupby(country, observed=True, sort=False).shift(-h)
+        keep = target.notna() & features['value'].notna()
+        frame = features[keep].copy()
+        frame['horizon'] = h
+        frame['target_year'] = panel.loc[keep, 'Year'].astype('int64') + h
+        frame['target'] = target[keep] - frame['value']
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def origin_features(panel, features, value_col=VALUE_COLUMN):
+    """Features at each country's last observed year, indexed by Country"""
+    observed = panel[value_col].notna()
+    last = panel[observed].groupby('Country', observed=True, sort=False).tail(1).index
+    origins = features.loc[last].copy()
+    origins['origin_year'] = panel.loc[last, 'Year'].astype('int64').to_numpy()
+    origins.index = pd.Index(panel.loc[last, 'Country'].astype(str), name='Country')
+    return origins.sort_index()
+
+
+class Forecaster:
+    """Trained multi-horizon model plus a keyed cache of served forecasts"""
+
+    def __init__(self, model, abs_errors, origins, data_version, cache_size=2048):
+        self.model = model
+        self.abs_errors = abs_errors
+        self.origins = origins
+        self.data_version = data_version
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._points = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def fit(cls, df, data_version, validation_start=VALIDATION_START_YEAR):
+        """Train on a long (Country, Year, rate) frame"""
+        panel = sort_panel(df)
+        features = time_series_features(panel)
+        data = supervised_frame(panel, features)
+
+        # Holdout errors for the intervals: train on targets before the cut-off
+        holdout = data['target_year'] >= validation_start
+        validation_model = make_model().fit(data.loc[~holdout, MODEL_COLUMNS], data.loc[~holdout, 'target'])
+        errors = np.abs(data.loc[holdout, 'target'] - validation_model.predict(data.loc[holdout, MODEL_COLUMNS]))
+        abs_errors = {h: np.sort(errors[data.loc[holdout, 'horizon'] == h].to_numpy()) for h in HORIZONS}
+
+        model = make_model().fit(data[MODEL_COLUMNS], data['target'])
+        return cls(model, abs_errors, origin_features(panel, features), data_version)
+
+    def save(self, path=FORECASTER_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # A reader (another worker, the scorer) never sees a half-written artifact
+        with replacing(path) as tmp_path:
+            joblib.dump({
+                'format_version': FORECASTER_FORMAT_VERSION,
+                'data_version': self.data_version,
+                'model': self.model,
+                'abs_errors': self.abs_errors,
+                'origins': self.origins,
+            }, tmp_path)
+
+    @classmethod
+    def load(cls, path=FORECASTER_PATH):
+        artifact = joblib.load(path)
+        if artifact.get('format_version') != FORECASTER_FORMAT_VERSION:
+            raise ValueError(f"Unsupported forecaster artifact: {path}")
+        return cls(artifact['model'], artifact['abs_errors'], artifact['origins'], artifact['data_version'])
+
+    @property
+    def countries(self):
+        """Countries with at least one observation, sorted"""
+        return list(self.origins.index)
+
+    def predict_points(self, countries=None, horizons=HORIZONS):
+        """
+        Point forecasts for every (country, horizon) pair in one model call.
+
+        Returns a long frame of Country, horizon, Year and forecast.
+        """
+        untrained = sorted(set(horizons) - set(self.abs_errors))
+        if untrained:
+            raise ValueError(f"Horizons {untrained} were not trained (use {sorted(self.abs_errors)})")
+        origins = self.origins if countries is None else self.origins.loc[list(countries)]
+        n = len(origins)
+        horizons = np.asarray(horizons)
+
+        X = pd.DataFrame(np.repeat(origins[FEATURE_COLUMNS].to_numpy(), len(horizons), axis=0), columns=FEATURE_COLUMNS)
+        X['horizon'] = np.tile(horizons, n)
+        delta = self.model.predict(X[MODEL_COLUMNS])
+
+        return pd.DataFrame({
+            'Country': np.repeat(origins.index.to_numpy(), len(horizons)),
+            'horizon': X['horizon'].to_numpy(),
+            'Year': np.repeat(origins['origin_year'].to_numpy(), len(horizons)) + X['horizon'].to_numpy(),
+            'forecast': X['value'].to_numpy() + delta,
+        })
+
+    def predict_frame(self, countries=None, horizons=HORIZONS, confidences=(0.8, 0.9, 0.95)):
+        """
+        Point forecasts plus lower/upper bounds for each confidence level.
+
+        Intervals are looked up from a (horizon x confidence) table of
+        half-widths, so the whole frame costs one model call.
+        """
+        points = self.predict_points(countries, horizons)
+        for confidence in confidences:
+            widths = pd.Series([self.interval_halfwidth(h, confidence) for h in horizons], index=list(horizons))
+            halfwidth = widths.reindex(points['horizon']).to_numpy()
+            label = f'{confidence * 100:g}'
+            points[f'lower_{label}'] = np.maximum(points['forecast'].to_numpy() - halfwidth, 0.0)
+            points[f'upper_{label}'] = points['forecast'].to_numpy() + halfwidth
+        return points
+
+    def interval_halfwidth(self, horizon, confidence):
+        """Empirical |error| quantile for a horizon at the given confidence level"""
+        errors = self.abs_errors.get(horizon)
+        if errors is None or len(errors) == 0:
+            errors = np.concatenate([e for e in self.abs_errors.values() if len(e)])
+        return float(np.quantile(errors, confidence))
+
+    def forecast(self, country, horizon, confidence):
+        """
+        Forecast ``country`` for the next 1..``horizon`` years with intervals.
+
+        Results are cached on (country, horizon, confidence, data version);
+        a miss predicts all horizons for the country in a single call.
+        """
+        key = (country, horizon, confidence, self.data_version)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            points = self._points.get(country)
+
+        if points is None:
+            points = self.predict_points([country])
+            with self._lock:
+                self._points[country] = points
+
+        points = points[points['horizon'] <= horizon]
+        halfwidth = np.array([self.interval_halfwidth(h, confidence) for h in points['horizon']])
+        result = points.drop(columns='Country').assign(
+            lower=np.maximum(points['forecast'] - halfwidth, 0.0),
+            upper=points['forecast'] + halfwidth,
+        )
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+
+def load_or_train(df, data_version, path=FORECASTER_PATH, save=True):
+    """Load the saved forecaster for this data version, training it if needed (saved unless ``save`` is False)"""
+    if os.path.exists(path):
+        try:
+            forecaster = Forecaster.load(path)
+            if forecaster.data_version == data_version:
+                return forecaster
+        except (OSError, ValueError, KeyError):
+            pass
+
+    forecaster = Forecaster.fit(df, data_version)
+    if not save:
+        return forecaster
+    try:
+        forecaster.save(path)
+    except OSError:
+        pass
+    return forecaster
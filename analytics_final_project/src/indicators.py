@@ -0,0 +1,251 @@
+"""
+Long-format multi-indicator store: (country, year, indicator, value).
+
+Indicators are registered in ``data/indicators.csv`` (id, WDI code, name,
+unit, source file, wide column name). Each source is a WDI extract shaped
+like the youth unemployment one (Country, CountryCode, Year, <value column>)
+and is read through its own columnar store (src/data_store.py).
+
+All available sources are combined into one uncompressed Feather file of
+integer-coded dimensions:
+
+    country_id    int16   index into the country dimension (sorted by name)
+    year          int16
+    indicator_id  int16   index into the manifest's indicator list
+    value         float32 observed values only
+
+Rows are sorted by (indicator, country, year), and the manifest records each
+indicator's row range. The file is memory-mapped, so a page that pivots one
+indicator to wide format reads only that indicator's rows. Adding dozens of
+indicators grows the file, not the cost of loading one of them.
+
+Usage:
+    python -m src.indicators        # (re)build the store and list indicators
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from src.data_store import DATA_DIR, data_version, load_store, replacing
+
+INDICATOR_REGISTRY_PATH = os.path.join(DATA_DIR, 'indicators.csv')
+INDICATOR_STORE_PATH = os.path.join(DATA_DIR, '.store', 'indicators.feather')
+
+# Bump when the on-disk layout changes so stale stores are rebuilt
+INDICATOR_STORE_FORMAT_VERSION = 1
+
+YOUTH_UNEMPLOYMENT = 'youth_unemployment'
+
+
+def load_registry(path=INDICATOR_REGISTRY_PATH):
+    """Registered indicators indexed by indicator_id, with absolute source paths"""
+    registry = pd.read_csv(path, keep_default_na=False, na_values=['']).set_index('indicator_id')
+    base_dir = os.path.dirname(os.path.abspath(path))
+    registry['source_path'] = [os.path.join(base_dir, f) for f in registry['source_file']]
+    return registry
+
+
+def available_indicators(registry=None):
+    """Registry rows whose source extract exists on disk"""
+    registry = load_registry() if registry is None else registry
+    return registry[[os.path.exists(p) for p in registry['source_path']]]
+
+
+def _manifest_path(store_path):
+    return os.path.splitext(store_path)[0] + '.manifest.json'
+
+
+def _read_manifest(store_path):
+    try:
+        with open(_manifest_path(store_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _source_versions(registry):
+    return {indicator_id: data_version(path) for indicator_id, path in registry['source_path'].items()}
+
+
+def _combined_version(sources):
+    digest = hashlib.sha256(json.dumps(sources, sort_keys=True).encode())
+    return digest.hexdigest()[:12]
+
+
+def indicator_version(registry_path=INDICATOR_REGISTRY_PATH):
+    """Combined data version of the available sources (the store manifest's ``version``)"""
+    return _combined_version(_source_versions(available_indicators(load_registry(registry_path))))
+
+
+def build_indicator_table(registry):
+    """
+    Combine the registered sources into the long integer-coded table.
+
+    Returns (pyarrow Table, manifest dict).
+    """
+    frames = {
+        indicator_id: load_store(row['source_path'])[['Country', 'CountryCode', 'Year', row['value_column']]]
+        for indicator_id, row in registry.iterrows()
+    }
+
+    # Country dimension over every source row, including never-observed entities
+    names = pd.concat([f[['CountryCode', 'Country']].astype(object) for f in frames.values()])
+    names = names.drop_duplicates('CountryCode').sort_values('Country', kind='stable')
+    country_index = pd.Index(names['CountryCode'])
+    years = np.concatenate([f['Year'].to_numpy() for f in frames.values()])
+
+    parts, offsets, start = [], {}, 0
+    for code, (indicator_id, frame) in enumerate(frames.items()):
+        value = frame[registry.loc[indicator_id, 'value_column']].to_numpy(dtype=np.float32)
+        observed = ~np.isnan(value)
+        part = pd.DataFrame({
+            'country_id': country_index.get_indexer(frame['CountryCode'].astype(object)[observed]).astype(np.int16),
+            'year': frame['Year'].to_numpy()[observed].astype(np.int16),
+            'indicator_id': np.full(observed.sum(), code, dtype=np.int16),
+            'value': value[observed],
+        }).sort_values(['country_id', 'year'], kind='stable')
+        parts.append(part)
+        offsets[indicator_id] = [start, start + len(part)]
+        start += len(part)
+
+    long = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(
+        {'country_id': [], 'year': [], 'indicator_id': [], 'value': []})
+    sources = _source_versions(registry)
+    manifest = {
+        'format_version': INDICATOR_STORE_FORMAT_VERSION,
+        'version': _combined_version(sources),
+        'sources': sources,
+        'indicators': list(frames),
+        'value_columns': {i: registry.loc[i, 'value_column'] for i in frames},
+        'offsets': offsets,
+        'country_codes': names['CountryCode'].tolist(),
+        'country_names': names['Country'].tolist(),
+        'min_year': int(years.min()) if len(years) else 0,
+        'max_year': int(years.max()) if len(years) else 0,
+        'rows': int(len(long)),
+    }
+    return pa.Table.from_pandas(long, preserve_index=False), manifest
+
+
+def write_indicator_store(table, manifest, store_path=INDICATOR_STORE_PATH):
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    # Uncompressed so the file can be memory-mapped without a decode step
+    with replacing(store_path) as tmp_path:
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+
+    with replacing(_manifest_path(store_path)) as tmp_path, open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+class IndicatorStore:
+    """Memory-mapped long indicator table with on-demand pivots to wide"""
+
+    def __init__(self, table, manifest):
+        self.table = table
+        self.manifest = manifest
+        self.version = manifest['version']
+        self.indicators = list(manifest['indicators'])
+        self.value_columns = manifest['value_columns']
+        self.min_year = manifest['min_year']
+        self.max_year = manifest['max_year']
+
+        names = np.asarray(manifest['country_names'], dtype=object)
+        codes = np.asarray(manifest['country_codes'], dtype=object)
+        self.countries = pd.Index(names, name='Country')
+        # CountryCode categories sorted by code, as astype('category') would give
+        self._code_categories = np.sort(codes)
+        self._code_rank = np.argsort(np.argsort(codes, kind='stable'), kind='stable')
+
+    @property
+    def nbytes(self):
+        """Size of the long table (memory-mapped, so mostly not resident)"""
+        return self.table.nbytes
+
+    def series(self, indicator_id):
+        """(country_id, year, value) arrays of one indicator's observed values"""
+        start, stop = self.manifest['offsets'][indicator_id]
+        rows = self.table.slice(start, stop - start)
+        return (rows.column('country_id').to_numpy(), rows.column('year').to_numpy(),
+                rows.column('value').to_numpy())
+
+    def wide(self, indicator_ids, complete_grid=False):
+        """
+        Pivot the requested indicators to one column each (named by the registry).
+
+        Rows are the (country, year) pairs observed in any requested indicator,
+        or the full country x year grid with ``complete_grid``. Columns:
+        Country, CountryCode, Year, then one float32 column per indicator.
+        """
+        if isinstance(indicator_ids, str):
+            indicator_ids = [indicator_ids]
+        missing = [i for i in indicator_ids if i not in self.manifest['offsets']]
+        if missing:
+            raise KeyError(f"Indicators not in the store: {', '.join(missing)}")
+
+        span = self.max_year - self.min_year + 1
+        series = []
+        for indicator_id in indicator_ids:
+            country_id, year, value = self.series(indicator_id)
+            series.append((country_id.astype(np.int64) * span + (year.astype(np.int64) - self.min_year), value))
+
+        if complete_grid:
+            keys = np.arange(len(self.countries) * span, dtype=np.int64)
+        else:
+            keys = np.unique(np.concatenate([k for k, _ in series])) if series else np.empty(0, dtype=np.int64)
+
+        country_id = keys // span
+        frame = pd.DataFrame({
+            'Country': pd.Categorical.from_codes(country_id, categories=self.countries),
+            'CountryCode': pd.Categorical.from_codes(self._code_rank[country_id], categories=self._code_categories),
+            'Year': (keys % span + self.min_year).astype(np.int16),
+        })
+        for indicator_id, (indicator_keys, value) in zip(indicator_ids, series):
+            column = np.full(len(keys), np.nan, dtype=np.float32)
+            column[np.searchsorted(keys, indicator_keys)] = value
+            frame[self.value_columns[indicator_id]] = column
+        return frame
+
+
+def is_indicator_store_current(registry, store_path=INDICATOR_STORE_PATH):
+    """True if the store exists and was built from the current sources"""
+    manifest = _read_manifest(store_path)
+    if manifest is None or manifest.get('format_version') != INDICATOR_STORE_FORMAT_VERSION:
+        return False
+    if not os.path.exists(store_path):
+        return False
+    return manifest['sources'] == _source_versions(registry)
+
+
+def load_indicator_store(registry_path=INDICATOR_REGISTRY_PATH, store_path=INDICATOR_STORE_PATH):
+    """
+    Memory-map the indicator store, rebuilding it when a source changed.
+
+    If the data directory is read-only the table is built in memory instead.
+    """
+    registry = available_indicators(load_registry(registry_path))
+    if not is_indicator_store_current(registry, store_path):
+        table, manifest = build_indicator_table(registry)
+        try:
+            write_indicator_store(table, manifest, store_path)
+        except OSError:
+            return IndicatorStore(table, manifest)
+    return IndicatorStore(feather.read_table(store_path, memory_map=True), _read_manifest(store_path))
+
+
+if __name__ == '__main__':
+    store = load_indicator_store()
+    registry = load_registry()
+    print(f"Indicator store {store.version}: {store.manifest['rows']:,} observations, "
+          f"{len(store.countries)} countries/aggregates, {store.min_year}-{store.max_year}")
+    for indicator_id, row in registry.iterrows():
+        if indicator_id in store.manifest['offsets']:
+            start, stop = store.manifest['offsets'][indicator_id]
+            print(f"  {indicator_id:<22} {row['wdi_code']:<18} {stop - start:>8,} values")
+        else:
+            print(f"  {indicator_id:<22} {row['wdi_code']:<18} (no source at data/{row['source_file']})")
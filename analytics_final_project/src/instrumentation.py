@@ -0,0 +1,183 @@
+"""
+Per-rerun instrumentation for the Streamlit app.
+
+Every script run gets a ``RerunTrace`` that records:
+
+    spans    wall time of data loading, filtering, aggregation and each chart
+             (nested spans keep their depth, e.g. region lookup inside load_data)
+    cache    hit / miss of each st.cache_* loader and of the figure cache
+    sizes    memory footprint of df / df_filtered in bytes
+
+At the end of the run the trace is appended as one JSON line to
+``logs/metrics.jsonl`` (override with the APP_METRICS_LOG environment
+variable, set it empty to disable), and the app can show it in a debug
+sidebar panel. Latency percentiles across sessions come from ``summarize``.
+
+Streamlit runs each session's script in its own thread, so the active trace
+is thread-local: code inside a cached loader reaches it through
+``current_trace()`` without it being passed around.
+
+Usage:
+    python -m src.instrumentation [logs/metrics.jsonl]    # p50/p95/p99 per span
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from src.data_store import PROJECT_ROOT
+
+METRICS_LOG_PATH = os.environ.get('APP_METRICS_LOG', os.path.join(PROJECT_ROOT, 'logs', 'metrics.jsonl'))
+
+_local = threading.local()
+_write_lock = threading.Lock()
+
+
+class RerunTrace:
+    """Timing spans, cache outcomes and frame sizes of one script run"""
+
+    def __init__(self, session_id=None, page=None):
+        self.session_id = session_id
+        self.page = page
+        self.timestamp = time.time()
+        self._start = time.perf_counter()
+        self.spans = []
+        self.cache = {}
+        self.sizes = {}
+        self._depth = 0
+        self._misses = []
+
+    @contextmanager
+    def span(self, name, category='other'):
+        """Time the enclosed block as ``name``"""
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans.append({
+                'name': name,
+                'category': category,
+                'ms': (time.perf_counter() - start) * 1000,
+                'depth': self._depth,
+            })
+
+    def mark_miss(self, name):
+        """Called from inside a cached loader's body, which only runs on a miss"""
+        self._misses.append(name)
+
+    def cached_call(self, name, func, *args, category='load', **kwargs):
+        """Call a cached loader under a span and record whether it hit the cache"""
+        seen = len(self._misses)
+        with self.span(name, category):
+            result = func(*args, **kwargs)
+        self.record_cache(name, hit=name not in self._misses[seen:])
+        return result
+
+    def record_cache(self, name, hit):
+        outcome = self.cache.setdefault(name, {'hits': 0, 'misses': 0})
+        outcome['hits' if hit else 'misses'] += 1
+
+    def record_size(self, name, df):
+        self.sizes[name] = int(df.memory_usage(deep=True).sum())
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self._start) * 1000
+
+    def to_record(self):
+        return {
+            'ts': round(self.timestamp, 3),
+            'session': self.session_id,
+            'page': self.page,
+            'total_ms': round(self.total_ms, 3),
+            'spans': [dict(span, ms=round(span['ms'], 3)) for span in self.spans],
+            'cache': self.cache,
+            'sizes': self.sizes,
+        }
+
+    def spans_frame(self):
+        """Spans in completion order, indented by nesting depth"""
+        return pd.DataFrame({
+            'span': ['  ' * s['depth'] + s['name'] for s in self.spans],
+            'ms': [round(s['ms'], 1) for s in self.spans],
+        })
+
+    def emit(self, path=METRICS_LOG_PATH):
+        """Append this run as one JSON line (no-op if logging is disabled)"""
+        if not path:
+            return
+        line = json.dumps(self.to_record(), ensure_ascii=False) + '\n'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with _write_lock, open(path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except OSError:
+            pass
+
+
+def start_trace(session_id=None, page=None):
+    """Begin a new trace for the current script run (thread)"""
+    _local.trace = RerunTrace(session_id, page)
+    return _local.trace
+
+
+def current_trace():
+    return getattr(_local, 'trace', None)
+
+
+def mark_miss(name):
+    trace = current_trace()
+    if trace is not None:
+        trace.mark_miss(name)
+
+
+@contextmanager
+def span(name, category='other'):
+    """Span on the current trace, or a no-op outside a traced run"""
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+    with trace.span(name, category):
+        yield
+
+
+def read_log(path=METRICS_LOG_PATH):
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def summarize(records, percentiles=(50, 95, 99)):
+    """Latency percentiles per span name (plus whole reruns per page) in ms"""
+    rows = [{'name': f"rerun:{r.get('page')}", 'ms': r['total_ms']} for r in records]
+    rows += [{'name': s['name'], 'ms': s['ms']} for r in records for s in r['spans']]
+    samples = pd.DataFrame(rows, columns=['name', 'ms'])
+    grouped = samples.groupby('name')['ms']
+    summary = grouped.agg(['count', 'mean'])
+    for p in percentiles:
+        summary[f'p{p}'] = grouped.quantile(p / 100)
+    return summary.sort_values(f'p{percentiles[-1]}', ascending=False)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else METRICS_LOG_PATH
+    records = read_log(path)
+    print(f"{len(records):,} reruns from {path}\n")
+    print(summarize(records).round(1).to_string())
+
+
+if __name__ == '__main__':
+    main()
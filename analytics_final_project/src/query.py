@@ -0,0 +1,89 @@
+"""
+Sorted, indexed layouts of the dataset and the query API used by the app pages.
+
+Two row orders are kept:
+
+    by (Year, Country)   a year range is one contiguous block -> zero-copy slice
+    by (Country, Year)   each country is one contiguous block; a composite
+                         (country code, year) key resolves any set of
+                         countries and years with ``np.searchsorted``
+
+Both are answered without boolean masks over the full frame, so the cost of
+a query depends on the size of its result rather than the dataset.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def ranges_to_positions(starts, stops):
+    """Concatenate the half-open ranges [starts[i], stops[i]) into one position array"""
+    lengths = stops - starts
+    if len(lengths) == 0 or lengths.sum() == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+
+class DataIndex:
+    """Year-range and country-subset queries over a long (Country, Year, ...) frame"""
+
+    def __init__(self, df):
+        if not isinstance(df['Country'].dtype, pd.CategoricalDtype):
+            df = df.assign(Country=df['Country'].astype('category'))
+
+        self.by_year = df.sort_values(['Year', 'Country'], kind='stable').reset_index(drop=True)
+        self.by_country = df.sort_values(['Country', 'Year'], kind='stable').reset_index(drop=True)
+
+        self._years = self.by_year['Year'].to_numpy()
+        self.min_year = int(self._years[0]) if len(self._years) else 0
+        self.max_year = int(self._years[-1]) if len(self._years) else 0
+
+        # Composite sort key of the (Country, Year) layout: code * span + year offset
+        self.categories = self.by_country['Country'].cat.categories
+        self._span = self.max_year - self.min_year + 1
+        codes = self.by_country['Country'].cat.codes.to_numpy().astype(np.int64)
+        years = self.by_country['Year'].to_numpy().astype(np.int64)
+        self._keys = codes * self._span + (years - self.min_year)
+
+    def _year_offsets(self, year_range):
+        """Clamp an inclusive year range to key offsets (lo, hi)"""
+        if year_range is None:
+            return 0, self._span - 1
+        lo = max(int(year_range[0]), self.min_year) - self.min_year
+        hi = min(int(year_range[1]), self.max_year) - self.min_year
+        return lo, hi
+
+    def year_slice(self, year_range):
+        """All rows with Year in the inclusive range, as a zero-copy slice"""
+        if year_range is None:
+            return self.by_year
+        start = np.searchsorted(self._years, year_range[0], side='left')
+        stop = np.searchsorted(self._years, year_range[1], side='right')
+        return self.by_year.iloc[start:stop]
+
+    def country_bounds(self, countries, year_range=None):
+        """Row bounds in the (Country, Year) layout for each requested country"""
+        codes = self.categories.get_indexer(pd.Index(countries))
+        codes = codes[codes >= 0].astype(np.int64)
+        lo, hi = self._year_offsets(year_range)
+        if hi < lo:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        starts = np.searchsorted(self._keys, codes * self._span + lo, side='left')
+        stops = np.searchsorted(self._keys, codes * self._span + hi, side='right')
+        return starts, stops
+
+    def select(self, year_range=None, countries=None):
+        """
+        Rows matching a year range and/or a list of countries.
+
+        A year range alone is a zero-copy slice of the (Year, Country) layout;
+        with countries the result is gathered from their contiguous blocks in
+        the (Country, Year) layout, in the order the countries were given.
+        """
+        if countries is None:
+            return self.year_slice(year_range)
+        starts, stops = self.country_bounds(countries, year_range)
+        if len(starts) == 1:
+            return self.by_country.iloc[starts[0]:stops[0]]
+        return self.by_country.take(ranges_to_positions(starts, stops))
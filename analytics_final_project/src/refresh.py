@@ -0,0 +1,144 @@
+"""
+Incremental refresh of the raw and processed datasets from a new WDI extract.
+
+The new extract is diffed against the stored one by (CountryCode, Year):
+
+    added     keys only in the new extract (typically a new year)
+    changed   keys in both whose rate was revised
+    removed   keys no longer in the extract
+
+Pure additions are appended to the columnar stores as new parts; revisions or
+removals rewrite the raw store. Either way, features are recomputed only for
+each affected country from its first changed year onward, and the processed
+rows before that point are kept as they are.
+
+The new extract replaces ``data/youth_unemployment_global.csv``, so the data
+version changes and the app's version-keyed caches pick it up on the next
+rerun.
+
+Usage:
+    python -m src.refresh path/to/new_extract.csv
+"""
+
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+from src.data_store import (PROCESSED_CSV_PATH, RAW_CSV_PATH, append_store, data_version, file_sha256,
+                            load_store, optimize_dtypes, read_csv, read_manifest, replacing, write_store)
+from src.features import VALUE_COLUMN, build_processed_tail, sort_panel, write_processed
+
+KEY = ['CountryCode', 'Year']
+
+
+def diff_extracts(old, new, value_col=VALUE_COLUMN):
+    """Return (added, changed, removed) key frames between two extracts"""
+    old_keys = old[KEY + [value_col]].astype({'CountryCode': object})
+    new_keys = new[KEY + [value_col]].astype({'CountryCode': object})
+    merged = old_keys.merge(new_keys, on=KEY, how='outer', suffixes=('_old', '_new'), indicator=True)
+
+    before, after = merged[f'{value_col}_old'], merged[f'{value_col}_new']
+    both = merged['_merge'] == 'both'
+    revised = both & ~((before == after) | (before.isna() & after.isna()))
+
+    added = merged.loc[merged['_merge'] == 'right_only', KEY]
+    changed = merged.loc[revised, KEY]
+    removed = merged.loc[merged['_merge'] == 'left_only', KEY]
+    return added.reset_index(drop=True), changed.reset_index(drop=True), removed.reset_index(drop=True)
+
+
+def _install_source(new_csv_path, csv_path):
+    """Atomically replace the source CSV with the new extract"""
+    if os.path.abspath(new_csv_path) == os.path.abspath(csv_path):
+        return
+    with replacing(csv_path) as tmp_path:
+        shutil.copyfile(new_csv_path, tmp_path)
+
+
+def refresh_dataset(new_csv_path, csv_path=RAW_CSV_PATH, processed_path=PROCESSED_CSV_PATH):
+    """
+    Bring the stored datasets up to date with ``new_csv_path``.
+
+    Returns a summary dict with the diff sizes, the store update mode and
+    the number of processed rows recomputed.
+    """
+    old_version = data_version(csv_path)
+    old = load_store(csv_path)
+    new = read_csv(new_csv_path)
+
+    added, changed, removed = diff_extracts(old, new)
+    summary = {
+        'added': len(added),
+        'changed': len(changed),
+        'removed': len(removed),
+        'mode': 'unchanged',
+        'recomputed_rows': 0,
+        'data_version': old_version,
+    }
+    if not (len(added) or len(changed) or len(removed)):
+        return summary
+
+    _install_source(new_csv_path, csv_path)
+    sha = file_sha256(csv_path)
+    summary['data_version'] = version = sha[:12]
+
+    if len(changed) or len(removed):
+        write_store(new, csv_path, sha)
+        combined = new
+        summary['mode'] = 'rewrite'
+    else:
+        added_rows = new.astype({'CountryCode': object}).merge(added, on=KEY)[new.columns]
+        append_store(added_rows, csv_path, sha)
+        combined = optimize_dtypes(pd.concat([old, added_rows], ignore_index=True))
+        summary['mode'] = 'append'
+
+    # First affected year per country (by name, which the feature panel is keyed on)
+    affected = pd.concat([added, changed, removed], ignore_index=True)
+    names = pd.concat([old, new])[['CountryCode', 'Country']].astype(object).drop_duplicates('CountryCode')
+    affected = affected.merge(names, on='CountryCode')
+    first_years = affected.groupby('Country')['Year'].min()
+
+    manifest = read_manifest(processed_path)
+    if not os.path.exists(processed_path) or manifest is None or manifest.get('raw_version') != old_version:
+        # No processed dataset matching the previous extract to update
+        summary['recomputed_rows'] = len(write_processed(combined, processed_path, version))
+        return summary
+
+    start_year = int(combined['Year'].min())
+    tail = build_processed_tail(combined, first_years, start_year=start_year)
+    summary['recomputed_rows'] = len(tail)
+
+    processed = load_store(processed_path)
+    first = processed['Country'].astype(object).map(first_years)
+    stale = (processed['Year'] >= first).to_numpy()
+
+    if not stale.any():
+        # New years only: append to both the CSV (on a copy, so readers never see a partial row)
+        # and the columnar store
+        with replacing(processed_path) as tmp_path:
+            shutil.copyfile(processed_path, tmp_path)
+            tail.to_csv(tmp_path, mode='a', header=False, index=False)
+        append_store(tail, processed_path, extra={'raw_version': version})
+    else:
+        processed = sort_panel(optimize_dtypes(pd.concat([processed[~stale], tail], ignore_index=True)))
+        with replacing(processed_path) as tmp_path:
+            processed.to_csv(tmp_path, index=False)
+        write_store(optimize_dtypes(processed), processed_path, extra={'raw_version': version})
+    return summary
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m src.refresh path/to/new_extract.csv")
+        sys.exit(2)
+    summary = refresh_dataset(argv[0])
+    print(f"Refresh {summary['mode']}: {summary['added']:,} added, {summary['changed']:,} revised, "
+          f"{summary['removed']:,} removed; {summary['recomputed_rows']:,} processed rows recomputed "
+          f"(data version {summary['data_version']})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Country -> region / income group classification.
+
+Regions and income groups come from the versioned lookup table in
+``data/country_regions.csv``, keyed by the World Bank country code used in the
+WDI extract (the 2-character ``CountryCode`` column; the ISO3 code is kept
+alongside for mapping). Rows for WDI aggregates such as "World" or
+"Africa Eastern and Southern" are flagged with ``is_aggregate`` so that they can
+be left out of country-level statistics.
+
+Codes are resolved once per unique code and broadcast back to the rows with an
+array take, so classification cost does not grow with the number of years.
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+from src.data_store import DATA_DIR
+
+REGION_TABLE_PATH = os.path.join(DATA_DIR, 'country_regions.csv')
+
+# World Bank FY2025 regions and income groups (July 2024 classification).
+# Bump when data/country_regions.csv is updated so cached aggregates rebuild.
+REGION_TABLE_VERSION = 'wb-fy2025'
+
+UNCLASSIFIED = 'Other'
+
+
+@lru_cache(maxsize=None)
+def load_region_table(path=REGION_TABLE_PATH):
+    """Load the lookup table indexed by CountryCode"""
+    # Namibia's code is "NA"; only empty cells are missing
+    table = pd.read_csv(path, keep_default_na=False, na_values=[''])
+    table['is_aggregate'] = table['is_aggregate'].astype(bool)
+    return table.set_index('CountryCode')
+
+
+def classify(codes, table=None):
+    """
+    Look up region, income group, ISO3 and aggregate flag for each code.
+
+    Returns a frame aligned with ``codes``. Codes missing from the table are
+    treated as countries in the 'Other' region.
+    """
+    if table is None:
+        table = load_region_table()
+    codes = pd.Series(codes)
+
+    # One table lookup per unique code, then an integer take back to the rows
+    row_codes, uniques = pd.factorize(codes, use_na_sentinel=False)
+    lookup = table.reindex(pd.Index(uniques, dtype=object))
+    lookup['is_aggregate'] = lookup['is_aggregate'].fillna(False).astype(bool)
+    lookup['region'] = lookup['region'].where(lookup['is_aggregate'], lookup['region'].fillna(UNCLASSIFIED))
+    lookup['income_group'] = lookup['income_group'].where(
+        lookup['is_aggregate'], lookup['income_group'].fillna(UNCLASSIFIED)
+    )
+
+    result = {}
+    for col in ('region', 'income_group', 'ISO3'):
+        cat = pd.Categorical(lookup[col])
+        result[col] = pd.Categorical.from_codes(cat.codes[row_codes], cat.categories)
+    result['is_aggregate'] = lookup['is_aggregate'].to_numpy()[row_codes]
+    return pd.DataFrame(result, index=codes.index)
+
+
+def add_region_columns(df, table=None):
+    """Add categorical region/income_group/ISO3 columns and the is_aggregate flag"""
+    classes = classify(df['CountryCode'], table)
+    for col in classes.columns:
+        df[col] = classes[col].values
+    return df
+
+
+def countries_only(df):
+    """Drop WDI aggregate rows (regions, income groups, World)"""
+    if 'is_aggregate' not in df.columns:
+        df = add_region_columns(df.copy())
+    return df[~df['is_aggregate'].to_numpy(dtype=bool)]
@@ -0,0 +1,134 @@
+"""
+Headless batch scoring: forecast every country and aggregate for every horizon.
+
+The forecaster is loaded once (trained first if the artifact is missing or
+was built on another data version). A model trained for another extract than
+the app's own (``--data``) is only saved with an explicit ``--model`` path, so
+scoring never replaces the dashboard's models/forecaster.joblib. Forecast-origin features for all
+entities are stacked into one matrix and scored with a single vectorized
+predict call; intervals for every confidence level come from the per-horizon
+holdout errors. Results are written to Parquet or CSV in row chunks.
+
+Usage:
+    python run_app.py score [--output forecasts.parquet] [--horizons 1 2 3 4 5]
+    python -m src.scoring --output forecasts.csv
+"""
+
+import argparse
+import os
+import time
+
+from src.data_store import DATA_DIR, RAW_CSV_PATH, data_version, load_store, replacing
+from src.forecasting import FORECASTER_PATH, HORIZONS, load_or_train
+
+DEFAULT_OUTPUT_PATH = os.path.join(DATA_DIR, 'forecasts.parquet')
+DEFAULT_CONFIDENCES = (0.8, 0.9, 0.95)
+CHUNK_ROWS = 100_000
+OUTPUT_FORMATS = ('.parquet', '.csv')
+
+
+def score_frame(forecaster, df, horizons=HORIZONS, confidences=DEFAULT_CONFIDENCES):
+    """Forecasts for every entity in the forecaster, with codes and origin year"""
+    scores = forecaster.predict_frame(horizons=horizons, confidences=confidences)
+    codes = df[['Country', 'CountryCode']].astype(object).drop_duplicates('Country').set_index('Country')['CountryCode']
+    origins = forecaster.origins
+    countries = scores['Country']
+    scores.insert(1, 'CountryCode', countries.map(codes).to_numpy())
+    scores.insert(3, 'origin_year', countries.map(origins['origin_year']).to_numpy())
+    scores.insert(4, 'last_value', countries.map(origins['value']).to_numpy())
+    scores['data_version'] = forecaster.data_version
+    return scores
+
+
+def write_chunks(frame, path, chunk_rows=CHUNK_ROWS):
+    """Stream ``frame`` to .parquet (row groups) or .csv (appended blocks)"""
+    if not path.endswith(OUTPUT_FORMATS):
+        raise ValueError(f"Unsupported output format (use .parquet or .csv): {path}")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    with replacing(path) as tmp_path:
+        if path.endswith('.parquet'):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = pa.Schema.from_pandas(frame.iloc[:0], preserve_index=False)
+            with pq.ParquetWriter(tmp_path, schema) as writer:
+                for start in range(0, len(frame), chunk_rows):
+                    chunk = frame.iloc[start:start + chunk_rows]
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        else:
+            for start in range(0, len(frame), chunk_rows):
+                frame.iloc[start:start + chunk_rows].to_csv(tmp_path, mode='w' if start == 0 else 'a',
+                                                             header=start == 0, index=False)
+
+
+def run_scoring(output_path=DEFAULT_OUTPUT_PATH, csv_path=RAW_CSV_PATH, model_path=FORECASTER_PATH,
+                horizons=HORIZONS, confidences=DEFAULT_CONFIDENCES):
+    """Score everything and write it out; returns a summary dict with timings"""
+    timings = {}
+
+    start = time.perf_counter()
+    df = load_store(csv_path)
+    version = data_version(csv_path)
+    timings['load_data_s'] = time.perf_counter() - start
+
+    # The dashboard's artifact only ever holds a model of the dashboard's data
+    own_data = os.path.abspath(csv_path) == os.path.abspath(RAW_CSV_PATH)
+    save = own_data or os.path.abspath(model_path) != os.path.abspath(FORECASTER_PATH)
+
+    start = time.perf_counter()
+    forecaster = load_or_train(df, version, model_path, save=save)
+    timings['load_model_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = score_frame(forecaster, df, horizons, confidences)
+    timings['predict_s'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_chunks(scores, output_path)
+    timings['write_s'] = time.perf_counter() - start
+
+    rows = len(scores)
+    return {
+        'rows': rows,
+        'entities': scores['Country'].nunique(),
+        'output': output_path,
+        'data_version': version,
+        'rows_per_s': rows / timings['predict_s'] if timings['predict_s'] else float('inf'),
+        'end_to_end_rows_per_s': rows / sum(timings.values()),
+        **timings,
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='.parquet or .csv file to write')
+    parser.add_argument('--data', default=RAW_CSV_PATH, help='raw extract to score')
+    parser.add_argument('--model', default=FORECASTER_PATH, help='forecaster artifact (trained if stale; with --data, only saved when given)')
+    parser.add_argument('--horizons', type=int, nargs='+', choices=HORIZONS, default=list(HORIZONS))
+    parser.add_argument('--confidence', type=float, nargs='+', default=list(DEFAULT_CONFIDENCES))
+
+
+def run(args):
+    summary = run_scoring(args.output, args.data, args.model, tuple(args.horizons), tuple(args.confidence))
+    print(f"Scored {summary['entities']:,} countries/aggregates x {len(args.horizons)} horizons "
+          f"= {summary['rows']:,} rows -> {summary['output']}")
+    print(f"  load data {summary['load_data_s'] * 1000:.0f} ms, load model {summary['load_model_s'] * 1000:.0f} ms, "
+          f"predict {summary['predict_s'] * 1000:.0f} ms, write {summary['write_s'] * 1000:.0f} ms")
+    print(f"  throughput: {summary['rows_per_s']:,.0f} rows/s (predict), "
+          f"{summary['end_to_end_rows_per_s']:,.0f} rows/s (end to end)")
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description='Score every country and horizon with the forecaster')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    # Checked up front: both are only used after loading, training and predicting everything
+    if not args.output.endswith(OUTPUT_FORMATS):
+        parser.error(f"--output must end in {' or '.join(OUTPUT_FORMATS)}: {args.output}")
+    if not all(0 < c < 1 for c in args.confidence):
+        parser.error(f"--confidence levels must be between 0 and 1 (e.g. 0.9): {args.confidence}")
+    run(args)
+
+
+if __name__ == '__main__':
+    main()
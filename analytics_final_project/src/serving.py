@@ -0,0 +1,340 @@
+"""
+Multi-process serving: N Streamlit workers behind a sticky reverse proxy.
+
+A single ``streamlit run`` process serves every session from one interpreter,
+so concurrent users queue behind each other's pandas work on the GIL. This
+mode starts ``--workers`` Streamlit processes on consecutive local ports and
+a small asyncio reverse proxy on the public port:
+
+    sticky sessions   the first response of a browser gets a cookie naming its
+                      worker; every later request and the session's websocket
+                      go to the same one (a Streamlit session lives in one
+                      process). Without a usable cookie the healthy worker
+                      with the fewest open connections is picked.
+    health checks     every worker's /_stcore/health is polled; unhealthy
+                      workers get no new sessions, and exited ones are
+                      restarted. GET /_serve/health on the proxy reports the
+                      pool as JSON (200 if any worker is healthy, else 503).
+    shared data       before the workers start, the frame and aggregates are
+                      published once (src/shared.py) and every worker
+                      memory-maps that copy.
+    readiness         the on-disk stores and forecaster are warmed in the
+                      background (src/warmup.py) while the pool starts;
+                      GET /_serve/ready returns 200 once that is done and
+                      every worker is healthy, else 503.
+
+The proxy only parses the request head of each new client connection and
+then relays bytes both ways, so keep-alive requests and websocket upgrades
+pass through unchanged.
+
+Usage:
+    python run_app.py serve [--workers 4] [--port 8501] [--address localhost]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from src.data_store import PROJECT_ROOT
+
+APP_PATH = os.path.join(PROJECT_ROOT, 'app', 'app.py')
+
+DEFAULT_WORKERS = int(os.environ.get('APP_WORKERS', os.cpu_count() or 1))
+WORKER_BASE_PORT = 8600
+STICKY_COOKIE = 'app_worker'
+WORKER_HEALTH_PATH = '/_stcore/health'
+PROXY_HEALTH_PATH = '/_serve/health'
+PROXY_READY_PATH = '/_serve/ready'
+HEALTH_INTERVAL_S = 5.0
+HEALTH_TIMEOUT_S = 2.0
+MAX_HEAD_BYTES = 64 * 1024
+RELAY_CHUNK_BYTES = 64 * 1024
+
+
+class Worker:
+    """One Streamlit process on a local port"""
+
+    def __init__(self, index, port, env, app_path=APP_PATH):
+        self.index = index
+        self.port = port
+        self.env = env
+        self.app_path = app_path
+        self.process = None
+        self.healthy = False
+        self.connections = 0
+        self.restarts = 0
+        self.last_check = None
+
+    def start(self):
+        self.process = subprocess.Popen([
+            sys.executable, '-m', 'streamlit', 'run', self.app_path,
+            '--server.headless', 'true',
+            '--server.address', '127.0.0.1',
+            '--server.port', str(self.port),
+            '--server.fileWatcherType', 'none',
+            '--browser.gatherUsageStats', 'false',
+        ], cwd=PROJECT_ROOT, env=self.env, stdout=subprocess.DEVNULL)
+        self.healthy = False
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.alive:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    def status(self):
+        return {
+            'worker': self.index,
+            'port': self.port,
+            'pid': self.process.pid if self.process else None,
+            'alive': self.alive,
+            'healthy': self.healthy,
+            'connections': self.connections,
+            'restarts': self.restarts,
+            'last_check': self.last_check,
+        }
+
+
+class Balancer:
+    """Sticky worker choice: the cookie's worker if healthy, else the least busy"""
+
+    def __init__(self, workers):
+        self.workers = workers
+
+    def choose(self, cookie_value):
+        """Return (worker or None, whether the client needs a new cookie)"""
+        try:
+            index = int(cookie_value)
+        except (TypeError, ValueError):
+            index = None
+        # Only a valid worker index pins the client (a negative one would wrap around)
+        if index is not None and 0 <= index < len(self.workers) and self.workers[index].healthy:
+            return self.workers[index], False
+        healthy = [w for w in self.workers if w.healthy]
+        if not healthy:
+            return None, True
+        return min(healthy, key=lambda w: (w.connections, w.index)), True
+
+
+def parse_head(head):
+    """(method, path, {lower-case header: value}) of an HTTP request head"""
+    lines = head.decode('latin-1').split('\r\n')
+    method, path = (lines[0].split(' ') + ['', ''])[:2]
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return method, path, headers
+
+
+def cookie_value(headers, name=STICKY_COOKIE):
+    for part in headers.get('cookie', '').split(';'):
+        key, _, value = part.strip().partition('=')
+        if key == name:
+            return value
+    return None
+
+
+def http_response(status, body, content_type='application/json'):
+    body = body.encode()
+    return (f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n'
+            f'Cache-Control: no-store\r\nConnection: close\r\n\r\n').encode() + body
+
+
+async def relay(reader, writer):
+    try:
+        while True:
+            chunk = await reader.read(RELAY_CHUNK_BYTES)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        try:
+            writer.close()
+        except Exception:
+            pass
+
+
+class Proxy:
+    """Reverse proxy and health checker in front of a worker pool"""
+
+    def __init__(self, workers, health_interval=HEALTH_INTERVAL_S, warmup=None):
+        self.workers = workers
+        self.balancer = Balancer(workers)
+        self.health_interval = health_interval
+        self.warmup = warmup
+        self.started = time.time()
+
+    def health(self):
+        statuses = [w.status() for w in self.workers]
+        healthy = sum(s['healthy'] for s in statuses)
+        warmup = self.warmup.status() if self.warmup is not None else None
+        return {
+            'ready': healthy == len(statuses) and (warmup is None or warmup['ready']),
+            'healthy_workers': healthy,
+            'workers': statuses,
+            'warmup': warmup,
+            'uptime_s': round(time.time() - self.started, 1),
+        }
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            head = await client_reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+
+        _, path, headers = parse_head(head)
+        path = path.split('?')[0]
+        if path in (PROXY_HEALTH_PATH, PROXY_READY_PATH):
+            health = self.health()
+            ok = health['ready'] if path == PROXY_READY_PATH else health['healthy_workers'] > 0
+            status = '200 OK' if ok else '503 Service Unavailable'
+            client_writer.write(http_response(status, json.dumps(health)))
+            await client_writer.drain()
+            client_writer.close()
+            return
+
+        worker, new_cookie = self.balancer.choose(cookie_value(headers))
+        if worker is None:
+            client_writer.write(http_response('503 Service Unavailable', '{"error": "no healthy workers"}'))
+            await client_writer.drain()
+            client_writer.close()
+            return
+
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', worker.port)
+        except OSError:
+            worker.healthy = False
+            client_writer.write(http_response('502 Bad Gateway', '{"error": "worker unavailable"}'))
+            await client_writer.drain()
+            client_writer.close()
+            return
+
+        worker.connections += 1
+        try:
+            upstream_writer.write(head)
+            await upstream_writer.drain()
+            if new_cookie:
+                # Pin the browser to this worker on the first response of the connection
+                response_head = await upstream_reader.readuntil(b'\r\n\r\n')
+                status_line, rest = response_head.split(b'\r\n', 1)
+                cookie = f'Set-Cookie: {STICKY_COOKIE}={worker.index}; Path=/; HttpOnly; SameSite=Lax\r\n'
+                client_writer.write(status_line + b'\r\n' + cookie.encode() + rest)
+            await asyncio.gather(relay(client_reader, upstream_writer), relay(upstream_reader, client_writer))
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            upstream_writer.close()
+        finally:
+            worker.connections -= 1
+
+    async def check(self, worker):
+        """GET the worker's health endpoint; restart the process if it exited"""
+        if not worker.alive:
+            worker.restarts += 1
+            worker.start()
+            return
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', worker.port),
+                                                    HEALTH_TIMEOUT_S)
+            writer.write(f'GET {WORKER_HEALTH_PATH} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n'.encode())
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), HEALTH_TIMEOUT_S)
+            writer.close()
+            worker.healthy = response.startswith(b'HTTP/1.1 200')
+        except (OSError, asyncio.TimeoutError):
+            worker.healthy = False
+        worker.last_check = round(time.time(), 1)
+
+    async def health_loop(self):
+        while True:
+            await asyncio.gather(*(self.check(w) for w in self.workers))
+            # Poll quickly until the whole pool is up, then at the normal interval
+            ready = all(w.healthy for w in self.workers)
+            await asyncio.sleep(self.health_interval if ready else 0.5)
+
+    async def serve(self, address, port):
+        server = await asyncio.start_server(self.handle, address, port, limit=MAX_HEAD_BYTES)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.health_loop())
+
+
+def start_workers(count, base_port=WORKER_BASE_PORT, shared_root=None):
+    env = dict(os.environ, APP_WORKERS=str(count))
+    if shared_root:
+        env['APP_SHARED_DIR'] = shared_root
+    workers = [Worker(i, base_port + i, env) for i in range(count)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(workers=DEFAULT_WORKERS, port=8501, address='localhost', base_port=WORKER_BASE_PORT, share=True):
+    """Publish the shared data, start the pool and run the proxy until interrupted"""
+    from src.warmup import Warmup, disk_stages
+
+    shared_root = None
+    if share:
+        from src.shared import SHARED_ROOT, publish
+
+        start = time.perf_counter()
+        version = publish()
+        shared_root = SHARED_ROOT
+        print(f"Shared data {version} published in {time.perf_counter() - start:.1f}s -> {SHARED_ROOT}")
+
+    warmup = Warmup(disk_stages(), name='disk-warmup',
+                    on_ready=lambda w: print(f"Warm-up finished in {w.status()['elapsed_s']:.1f}s")).start()
+    pool = start_workers(workers, base_port, shared_root)
+    print(f"{workers} worker(s) on ports {base_port}-{base_port + workers - 1}; "
+          f"proxy on http://{address}:{port} (health: {PROXY_HEALTH_PATH}, readiness: {PROXY_READY_PATH})")
+
+    # SIGTERM (e.g. from a process manager) shuts down like Ctrl+C
+    signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        asyncio.run(Proxy(pool, warmup=warmup).serve(address, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in pool:
+            worker.stop()
+
+
+def add_arguments(parser):
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help='number of Streamlit processes (default: APP_WORKERS or the CPU count)')
+    parser.add_argument('--port', type=int, default=8501, help='public port of the proxy')
+    parser.add_argument('--address', default='localhost', help='address the proxy binds to')
+    parser.add_argument('--base-port', type=int, default=WORKER_BASE_PORT, help='port of the first worker')
+    parser.add_argument('--no-share', action='store_true', help='let every worker build its own data')
+
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description='Serve the dashboard from several worker processes')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    serve(args.workers, args.port, args.address, args.base_port, share=not args.no_share)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Read-only app data shared by the worker processes of ``run_app.py serve``.
+
+The launcher builds what the pages query once per data version:
+
+    data        wide youth unemployment frame with region columns
+    cube        AggregateCube over countries (aggregates excluded)
+    index       DataIndex (Year, Country) / (Country, Year) layouts
+    summaries   CountrySummaries block partials and country option list
+
+and dumps each object with joblib. Workers load them with ``mmap_mode='r'``,
+so the NumPy arrays inside stay memory-mapped and every worker reads the same
+pages of the OS cache instead of building its own copy (the same mechanism
+src/training.py uses to share arrays with its joblib workers).
+
+Artifacts live in ``data/.store/shared/<data version>-<region table version>/``.
+Workers find them through the APP_SHARED_DIR environment variable set by the
+launcher; without it (plain ``streamlit run``), or when the data changed
+after the launch, the app builds everything in-process as before.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from src.data_store import DATA_DIR, RAW_CSV_PATH, data_version
+
+SHARED_ROOT = os.path.join(DATA_DIR, '.store', 'shared')
+SHARED_NAMES = ('data', 'cube', 'index', 'summaries')
+
+
+def shared_dir(version, region_version, root=SHARED_ROOT):
+    return os.path.join(root, f'{version}-{region_version}')
+
+
+def build_app_data():
+    """The frame and derived structures, built exactly as the app's loaders do"""
+    from src.aggregates import AggregateCube
+    from src.indicators import YOUTH_UNEMPLOYMENT, load_indicator_store
+    from src.query import DataIndex
+    from src.regions import add_region_columns, countries_only
+    from src.summaries import CountrySummaries
+
+    df = add_region_columns(load_indicator_store().wide([YOUTH_UNEMPLOYMENT], complete_grid=True))
+    return {
+        'data': df,
+        'cube': AggregateCube(countries_only(df)),
+        'index': DataIndex(df),
+        'summaries': CountrySummaries(df),
+    }
+
+
+def publish(root=SHARED_ROOT):
+    """
+    Build and dump the shared objects for the current data version.
+
+    Returns the version; an existing complete publication is reused.
+    """
+    import joblib
+
+    from src.regions import REGION_TABLE_VERSION
+
+    version = data_version(RAW_CSV_PATH)
+    directory = shared_dir(version, REGION_TABLE_VERSION, root)
+    manifest_path = os.path.join(directory, 'manifest.json')
+    if os.path.exists(manifest_path):
+        return version
+
+    # A unique directory per publisher, renamed into place once complete
+    os.makedirs(root, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=root, prefix=os.path.basename(directory) + '.', suffix='.tmp')
+    sizes = {}
+    for name, obj in build_app_data().items():
+        path = os.path.join(tmp_dir, f'{name}.joblib')
+        joblib.dump(obj, path)
+        sizes[name] = os.path.getsize(path)
+    with open(os.path.join(tmp_dir, 'manifest.json'), 'w') as f:
+        json.dump({'version': version, 'region_version': REGION_TABLE_VERSION, 'bytes': sizes}, f, indent=2)
+
+    if os.path.exists(manifest_path):
+        # Published meanwhile by another process
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return version
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+
+    # Older publications are no longer attached by new workers (other publishers' directories are left alone)
+    for entry in os.listdir(root):
+        if entry != os.path.basename(directory) and not entry.endswith('.tmp'):
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    return version
+
+
+def attach(name, version, region_version, root=None):
+    """Memory-map a published object, or None if there is none for this version"""
+    root = root or os.environ.get('APP_SHARED_DIR')
+    if not root:
+        return None
+    path = os.path.join(shared_dir(version, region_version, root), f'{name}.joblib')
+    if not os.path.exists(path):
+        return None
+
+    import joblib
+
+    return joblib.load(path, mmap_mode='r')
@@ -0,0 +1,157 @@
+"""
+Per-country summary statistics for the Country Comparison tab.
+
+The (Year x Country) grid is cut into blocks of ``block_years`` consecutive
+years, and each (block, country) cell keeps a mergeable partial aggregate:
+
+    count, mean, m2   Welford moments (m2 = sum of squared deviations)
+    min, max          plus sparse tables over the block axis
+
+A year range is answered by merging the full blocks it covers with the two
+partial blocks at its edges, which are summarized directly from the grid.
+Moments are combined with Chan et al.'s parallel form of Welford's update,
+so no raw sums of squares are subtracted, and range min/max over the full
+blocks are two sparse table lookups. The cost of a query depends on the
+number of selected countries and blocks, not on the rows in the range.
+
+The sorted country option list is computed once with the table.
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BLOCK_YEARS = 8
+
+
+def _moments(values, axis=0):
+    """Count, mean and m2 along ``axis``, ignoring NaN"""
+    count = (~np.isnan(values)).sum(axis=axis).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(count > 0, np.nansum(values, axis=axis) / count, np.nan)
+    m2 = np.nansum((values - np.expand_dims(mean, axis)) ** 2, axis=axis)
+    return count, mean, m2
+
+
+def merge_moments(a, b):
+    """Combine two (count, mean, m2) partials (elementwise over countries)"""
+    count_a, mean_a, m2_a = a
+    count_b, mean_b, m2_b = b
+    count = count_a + count_b
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = mean_b - mean_a
+        mean = np.where(count_b == 0, mean_a, np.where(count_a == 0, mean_b, mean_a + delta * count_b / count))
+        m2 = np.where(count_a == 0, m2_b, np.where(count_b == 0, m2_a,
+                                                  m2_a + m2_b + delta ** 2 * count_a * count_b / count))
+    return count, mean, m2
+
+
+def _sparse_table(values, reduce):
+    """levels[k][i] = reduce over values[i:i + 2**k] along axis 0"""
+    levels = [values]
+    width = 1
+    while 2 * width <= len(values):
+        prev = levels[-1]
+        levels.append(reduce(prev[:-width], prev[width:]))
+        width *= 2
+    return levels
+
+
+def _range_query(levels, lo, hi, reduce):
+    """Reduce rows [lo, hi) with two overlapping power-of-two windows"""
+    k = int(np.log2(hi - lo))
+    return reduce(levels[k][lo], levels[k][hi - (1 << k)])
+
+
+class CountrySummaries:
+    """Block partial aggregates per (country, year block) for range summaries"""
+
+    def __init__(self, df, value_col='YouthUnemployment', block_years=DEFAULT_BLOCK_YEARS):
+        country = df['Country']
+        if isinstance(country.dtype, pd.CategoricalDtype) and country.cat.categories.is_monotonic_increasing:
+            # Codes of the store's name-sorted categories can be used as they are
+            country = country.cat.remove_unused_categories()
+            codes, countries = country.cat.codes.to_numpy().astype(np.int64), country.cat.categories
+        else:
+            codes, countries = pd.factorize(country, sort=True)
+        self.countries = pd.Index(countries, name='Country')
+        # Option list for the multiselect: every entity in the data, sorted by name
+        self.country_options = self.countries.tolist()
+
+        years = df['Year'].to_numpy(dtype=np.int64)
+        self.min_year = int(years.min())
+        self.max_year = int(years.max())
+        self.block_years = block_years
+
+        n_years, n_countries = self.max_year - self.min_year + 1, len(self.countries)
+        n_blocks = -(-n_years // block_years)
+        grid = np.full((n_blocks * block_years, n_countries), np.nan)
+        grid[years - self.min_year, codes] = df[value_col].to_numpy(dtype=np.float64)
+        self.grid = grid[:n_years]
+
+        blocks = grid.reshape(n_blocks, block_years, n_countries)
+        self.count, self.mean, self.m2 = _moments(blocks, axis=1)
+
+        self._min_levels = _sparse_table(np.fmin.reduce(blocks, axis=1), np.fmin)
+        self._max_levels = _sparse_table(np.fmax.reduce(blocks, axis=1), np.fmax)
+
+    @property
+    def nbytes(self):
+        tables = sum(level.nbytes for level in self._min_levels + self._max_levels)
+        return self.grid.nbytes + self.count.nbytes + self.mean.nbytes + self.m2.nbytes + tables
+
+    def _year_bounds(self, year_range):
+        """Half-open row bounds into the year axis for an inclusive year range"""
+        n_years = len(self.grid)
+        if year_range is None:
+            return 0, n_years
+        lo = min(max(int(year_range[0]) - self.min_year, 0), n_years)
+        hi = min(max(int(year_range[1]) + 1 - self.min_year, 0), n_years)
+        return lo, max(hi, lo)
+
+    def stats(self, countries=None, year_range=None):
+        """
+        Mean, std (ddof=1), min and max per country over an inclusive year range.
+
+        Rows follow the country order of the data (sorted by name), like a
+        ``groupby('Country')``; unknown names are ignored.
+        """
+        if countries is None:
+            codes = np.arange(len(self.countries))
+        else:
+            codes = self.countries.get_indexer(pd.Index(list(countries), dtype=object))
+            codes = np.unique(codes[codes >= 0])
+
+        lo, hi = self._year_bounds(year_range)
+        b = self.block_years
+        first_block, last_block = -(-lo // b), hi // b
+
+        if first_block >= last_block:
+            # Range inside one block (or empty): summarize the grid rows directly
+            head, tail = self.grid[lo:hi, codes], None
+            moments = _moments(head)
+            low = high = np.full(len(codes), np.nan)
+        else:
+            head = self.grid[lo:first_block * b, codes]
+            tail = self.grid[last_block * b:hi, codes]
+            moments = _moments(head)
+            for k in range(first_block, last_block):
+                moments = merge_moments(moments, (self.count[k, codes], self.mean[k, codes], self.m2[k, codes]))
+            moments = merge_moments(moments, _moments(tail))
+            low = _range_query(self._min_levels, first_block, last_block, np.fmin)[codes]
+            high = _range_query(self._max_levels, first_block, last_block, np.fmax)[codes]
+
+        # Edge years come straight from the grid (fmin/fmax skip missing values)
+        for edge in (head, tail):
+            if edge is not None:
+                low = np.fmin(low, np.fmin.reduce(edge, axis=0, initial=np.nan))
+                high = np.fmax(high, np.fmax.reduce(edge, axis=0, initial=np.nan))
+
+        count, mean, m2 = moments
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.where(count > 1, np.sqrt(np.maximum(m2, 0.0) / (count - 1)), np.nan)
+        return pd.DataFrame({
+            'mean': np.where(count > 0, mean, np.nan),
+            'std': std,
+            'min': low,
+            'max': high,
+        }, index=self.countries[codes])
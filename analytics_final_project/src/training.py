@@ -0,0 +1,341 @@
+"""
+Model comparison runner behind the Model Insights page.
+
+Trains every model family from the report (section 5) over its hyperparameter
+grid and evaluates it the way the report describes:
+
+    CV        5-fold time-series split over the pre-2015 training years
+    Holdout   best grid point per family refit on pre-2015, scored on 2015+
+
+The task is one-year-ahead: features of a country at year t (lags, rolling
+windows, regional indicators from the processed dataset) predict its rate at
+t + 1. WDI aggregate rows are excluded.
+
+Every (family, grid point, fold) fit is an independent joblib task run on a
+process pool. The feature matrix and target are dumped once to a temporary
+folder and opened memory-mapped, so workers share the pages instead of each
+receiving a pickled copy.
+
+Results, fold scores and permutation importances are written to
+``models/training_results.json`` together with the data version, and the
+app's Model Insights page reads that file.
+
+Usage:
+    python -m src.training [--n-jobs -1] [--folds 5]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from src.data_store import RAW_CSV_PATH, data_version, replacing
+from src.features import NUMERIC_FEATURES, VALUE_COLUMN, load_processed, region_dummy_name
+from src.forecasting import MODEL_DIR, VALIDATION_START_YEAR
+from src.regions import load_region_table
+
+TRAINING_RESULTS_PATH = os.path.join(MODEL_DIR, 'training_results.json')
+
+# Bump when the task, features or metrics change so stale results are flagged
+TRAINING_FORMAT_VERSION = 1
+
+CV_FOLDS = 5
+
+
+def _linear():
+    from sklearn.linear_model import LinearRegression
+    return LinearRegression()
+
+
+def _ridge(alpha):
+    from sklearn.linear_model import Ridge
+    return Ridge(alpha=alpha)
+
+
+def _lasso(alpha):
+    from sklearn.linear_model import Lasso
+    return Lasso(alpha=alpha, max_iter=10000)
+
+
+def _random_forest(n_estimators, max_depth, min_samples_leaf):
+    from sklearn.ensemble import RandomForestRegressor
+    return RandomForestRegressor(n_estimators=n_estimators, max_depth=max_depth,
+                                 min_samples_leaf=min_samples_leaf, random_state=0, n_jobs=1)
+
+
+def _gradient_boosting(learning_rate, max_depth):
+    from sklearn.ensemble import GradientBoostingRegressor
+    return GradientBoostingRegressor(n_estimators=300, learning_rate=learning_rate, max_depth=max_depth,
+                                     subsample=0.8, random_state=0)
+
+
+def _xgboost(learning_rate, max_depth):
+    from xgboost import XGBRegressor
+    return XGBRegressor(n_estimators=400, learning_rate=learning_rate, max_depth=max_depth,
+                        subsample=0.8, colsample_bytree=0.8, random_state=0, n_jobs=1)
+
+
+def _neural_network(alpha):
+    from sklearn.neural_network import MLPRegressor
+    return MLPRegressor(hidden_layer_sizes=(50, 25), alpha=alpha, early_stopping=True,
+                        max_iter=1000, random_state=0)
+
+
+# Model family -> (factory, hyperparameter grid, needs scaling)
+MODEL_GRIDS = {
+    'Linear Regression': (_linear, {}, True),
+    'Ridge Regression': (_ridge, {'alpha': [0.1, 1.0, 10.0]}, True),
+    'Lasso Regression': (_lasso, {'alpha': [0.01, 0.1, 1.0]}, True),
+    'Random Forest': (_random_forest, {'n_estimators': [200], 'max_depth': [None, 12],
+                                       'min_samples_leaf': [1, 5]}, False),
+    'Gradient Boosting': (_gradient_boosting, {'learning_rate': [0.05, 0.1], 'max_depth': [3, 5]}, False),
+    'XGBoost': (_xgboost, {'learning_rate': [0.05, 0.1], 'max_depth': [4, 6]}, False),
+    'Neural Network': (_neural_network, {'alpha': [1e-4, 1e-3]}, True),
+}
+
+
+def available_families():
+    """Families whose libraries are installed (XGBoost is optional)"""
+    families = list(MODEL_GRIDS)
+    try:
+        import xgboost  # noqa: F401
+    except ImportError:
+        families.remove('XGBoost')
+    return families
+
+
+def grid_points(grid):
+    """Every combination of a {param: [values]} grid, as dicts"""
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def make_estimator(family, params):
+    """Pipeline of median imputation, optional scaling and the family's model"""
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    factory, _, scale = MODEL_GRIDS[family]
+    steps = [SimpleImputer(strategy='median')]
+    if scale:
+        steps.append(StandardScaler())
+    return make_pipeline(*steps, factory(**params))
+
+
+def model_features():
+    """Numeric, development and region indicator columns used as inputs"""
+    regions = sorted(load_region_table()['region'].dropna().unique())
+    return NUMERIC_FEATURES + ['is_developed'] + [region_dummy_name(r) for r in regions]
+
+
+def supervised_dataset(processed, value_col=VALUE_COLUMN):
+    """
+    One-year-ahead (features at t, rate at t + 1) rows for countries.
+
+    Returns (X, y, target_year) with X as float64 over ``model_features()``.
+    """
+    panel = processed[~processed['is_aggregate'].astype(bool)]
+    panel = panel.sort_values(['Country', 'Year'], kind='stable')
+    country = panel['Country'].astype(object).to_numpy()
+    years = panel['Year'].to_numpy(dtype=np.int64)
+    values = panel[value_col].to_numpy(dtype=np.float64)
+
+    # Next row is the same country's following year
+    has_next = np.zeros(len(panel), dtype=bool)
+    has_next[:-1] = (country[1:] == country[:-1]) & (years[1:] == years[:-1] + 1)
+    target = np.full(len(panel), np.nan)
+    target[:-1] = values[1:]
+
+    X = panel.loc[has_next, model_features()].to_numpy(dtype=np.float64)
+    return X, target[has_next], years[has_next] + 1
+
+
+def time_series_folds(target_years, n_splits=CV_FOLDS):
+    """
+    Expanding-window folds over whole years (sklearn TimeSeriesSplit on the
+    sorted unique years), so no year is split between train and validation.
+    """
+    from sklearn.model_selection import TimeSeriesSplit
+
+    unique_years = np.unique(target_years)
+    folds = []
+    for train_years, valid_years in TimeSeriesSplit(n_splits=n_splits).split(unique_years):
+        folds.append((
+            np.flatnonzero(np.isin(target_years, unique_years[train_years])),
+            np.flatnonzero(np.isin(target_years, unique_years[valid_years])),
+        ))
+    return folds
+
+
+def regression_metrics(y_true, y_pred):
+    """RMSE, MAE, R² and MAPE (over non-zero targets)"""
+    error = y_pred - y_true
+    nonzero = y_true != 0
+    total = np.sum((y_true - y_true.mean()) ** 2)
+    return {
+        'RMSE': float(np.sqrt(np.mean(error ** 2))),
+        'MAE': float(np.mean(np.abs(error))),
+        'R²': float(1 - np.sum(error ** 2) / total) if total else float('nan'),
+        'MAPE': float(np.mean(np.abs(error[nonzero] / y_true[nonzero])) * 100),
+    }
+
+
+def _fit_fold(family, params, X, y, train_idx, valid_idx):
+    """Worker: fit one grid point on one fold and return its validation RMSE"""
+    model = make_estimator(family, params).fit(X[train_idx], y[train_idx])
+    error = model.predict(X[valid_idx]) - y[valid_idx]
+    return float(np.sqrt(np.mean(error ** 2)))
+
+
+def _fit_holdout(family, params, X, y, train_idx, test_idx, feature_names):
+    """Worker: refit the selected grid point, score the holdout and rank features"""
+    from sklearn.inspection import permutation_importance
+
+    model = make_estimator(family, params).fit(X[train_idx], y[train_idx])
+    metrics = regression_metrics(y[test_idx], model.predict(X[test_idx]))
+    metrics['Train RMSE'] = regression_metrics(y[train_idx], model.predict(X[train_idx]))['RMSE']
+
+    importance = permutation_importance(model, X[test_idx], y[test_idx], n_repeats=5, random_state=0,
+                                        scoring='neg_root_mean_squared_error')
+    return metrics, dict(zip(feature_names, importance.importances_mean.tolist()))
+
+
+def _shared_arrays(arrays, folder):
+    """Dump arrays once and reopen them memory-mapped for the worker pool"""
+    shared = []
+    for i, array in enumerate(arrays):
+        path = os.path.join(folder, f'array_{i}.mmap')
+        joblib.dump(np.ascontiguousarray(array), path)
+        shared.append(joblib.load(path, mmap_mode='r'))
+    return shared
+
+
+def run_training(processed=None, version=None, n_jobs=-1, n_splits=CV_FOLDS,
+                 validation_start=VALIDATION_START_YEAR, families=None, verbose=0):
+    """
+    Cross-validate every grid point of every family, refit the best per
+    family and return the results dict written by ``save_results``.
+    """
+    if version is None:
+        version = data_version(RAW_CSV_PATH)
+    if processed is None:
+        processed = load_processed(version)
+    families = families or available_families()
+    feature_names = model_features()
+
+    X, y, target_years = supervised_dataset(processed)
+    train_idx = np.flatnonzero(target_years < validation_start)
+    test_idx = np.flatnonzero(target_years >= validation_start)
+    folds = time_series_folds(target_years[train_idx], n_splits)
+    folds = [(train_idx[fit], train_idx[valid]) for fit, valid in folds]
+
+    candidates = [(family, params) for family in families for params in grid_points(MODEL_GRIDS[family][1])]
+    start = time.perf_counter()
+
+    folder = tempfile.mkdtemp(prefix='training_')
+    try:
+        X_shared, y_shared = _shared_arrays([X, y], folder)
+        with Parallel(n_jobs=n_jobs, verbose=verbose) as parallel:
+            scores = parallel(
+                delayed(_fit_fold)(family, params, X_shared, y_shared, fit, valid)
+                for family, params in candidates
+                for fit, valid in folds
+            )
+            scores = np.asarray(scores).reshape(len(candidates), len(folds))
+
+            best = {}
+            for (family, params), fold_scores in zip(candidates, scores):
+                if family not in best or fold_scores.mean() < best[family][1].mean():
+                    best[family] = (params, fold_scores)
+
+            holdout = parallel(
+                delayed(_fit_holdout)(family, best[family][0], X_shared, y_shared, train_idx, test_idx, feature_names)
+                for family in families
+            )
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    results = []
+    for family, (metrics, importances) in zip(families, holdout):
+        params, fold_scores = best[family]
+        results.append({
+            'Model': family,
+            **metrics,
+            'CV RMSE': float(fold_scores.mean()),
+            'CV folds': fold_scores.tolist(),
+            'params': params,
+            'importances': importances,
+        })
+    results.sort(key=lambda r: r['RMSE'])
+
+    return {
+        'format_version': TRAINING_FORMAT_VERSION,
+        'data_version': version,
+        'task': 'one-year-ahead youth unemployment rate',
+        'validation_start_year': validation_start,
+        'cv_folds': n_splits,
+        'n_train': int(len(train_idx)),
+        'n_test': int(len(test_idx)),
+        'features': feature_names,
+        'grid': {family: [p for f, p in candidates if f == family] for family in families},
+        'fits': len(candidates) * len(folds) + len(families),
+        'elapsed_s': round(time.perf_counter() - start, 2),
+        'results': results,
+    }
+
+
+def save_results(results, path=TRAINING_RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with replacing(path) as tmp_path, open(tmp_path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+
+def load_results(path=TRAINING_RESULTS_PATH):
+    """Saved results, or None if missing or in an older format"""
+    try:
+        with open(path) as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if results.get('format_version') != TRAINING_FORMAT_VERSION:
+        return None
+    return results
+
+
+def results_frame(results):
+    """Model comparison table (Model, RMSE, MAE, R², MAPE, CV RMSE, Train RMSE)"""
+    columns = ['Model', 'RMSE', 'MAE', 'R²', 'MAPE', 'CV RMSE', 'Train RMSE']
+    return pd.DataFrame(results['results'])[columns]
+
+
+def importance_frame(results, model=None):
+    """Permutation importances of ``model`` (default: the best), sorted descending"""
+    entry = results['results'][0] if model is None else next(r for r in results['results'] if r['Model'] == model)
+    importances = pd.Series(entry['importances'], name='Importance')
+    return importances.rename_axis('Feature').reset_index().sort_values('Importance', ascending=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train and cross-validate the model families')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='worker processes (-1 = all cores)')
+    parser.add_argument('--folds', type=int, default=CV_FOLDS)
+    args = parser.parse_args()
+
+    results = run_training(n_jobs=args.n_jobs, n_splits=args.folds, verbose=5)
+    save_results(results)
+    print(results_frame(results).round(3).to_string(index=False))
+    print(f"\n{results['fits']} fits in {results['elapsed_s']:.1f}s; results written to {TRAINING_RESULTS_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Background cache warm-up with a readiness signal.
+
+Work is given as stages of named tasks. Each stage runs on a thread pool and
+the next one starts when it has finished, so later stages can use what
+earlier ones loaded. ``start`` returns immediately (the server keeps
+accepting connections, the first page keeps rendering) and ``ready`` /
+``status()`` report progress. A failed task is recorded, not raised; the
+code that needs its result simply computes it on demand as before.
+
+Two warm-ups use it:
+
+    run_app.py    on-disk artifacts, while Streamlit starts: the columnar
+                  and indicator stores and the forecaster (``disk_stages``)
+    app/app.py    the per-process st.cache_* loaders and the default figures
+                  of the Overview and Data Explorer, started by the first
+                  script run in a server process
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+DEFAULT_WARMUP_THREADS = 4
+
+
+class Warmup:
+    """Stages of (name, func) tasks run in the background on a thread pool"""
+
+    def __init__(self, stages, max_workers=DEFAULT_WARMUP_THREADS, name='warmup', on_ready=None):
+        self.stages = [list(stage) for stage in stages]
+        self.max_workers = max_workers
+        self.name = name
+        self.on_ready = on_ready
+        self.tasks = {task: {'stage': i, 'state': 'pending', 'ms': None, 'error': None}
+                      for i, stage in enumerate(self.stages) for task, _ in stage}
+        self.started = None
+        self.finished = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        self.started = time.time()
+        threading.Thread(target=self._run, name=self.name, daemon=True).start()
+        return self
+
+    def _task(self, task, func):
+        with self._lock:
+            self.tasks[task]['state'] = 'running'
+        start = time.perf_counter()
+        try:
+            func()
+            state, error = 'done', None
+        except Exception as e:
+            state, error = 'failed', f'{type(e).__name__}: {e}'
+        with self._lock:
+            self.tasks[task].update(state=state, error=error, ms=round((time.perf_counter() - start) * 1000, 1))
+
+    def _run(self):
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as pool:
+                for stage in self.stages:
+                    for future in [pool.submit(self._task, task, func) for task, func in stage]:
+                        future.result()
+        except RuntimeError:
+            # The interpreter is shutting down; remaining tasks stay pending
+            pass
+        finally:
+            self.finished = time.time()
+            self._done.set()
+        if self.on_ready is not None:
+            self.on_ready(self)
+
+    @property
+    def ready(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until every stage has run (or the timeout passes); returns ``ready``"""
+        return self._done.wait(timeout)
+
+    @property
+    def progress(self):
+        """(tasks finished, total tasks)"""
+        with self._lock:
+            finished = sum(t['state'] in ('done', 'failed') for t in self.tasks.values())
+        return finished, len(self.tasks)
+
+    def status(self):
+        with self._lock:
+            tasks = {name: dict(task) for name, task in self.tasks.items()}
+        end = self.finished or time.time()
+        return {
+            'ready': self.ready,
+            'done': sum(t['state'] in ('done', 'failed') for t in tasks.values()),
+            'total': len(tasks),
+            'failed': sorted(name for name, t in tasks.items() if t['state'] == 'failed'),
+            'elapsed_s': round(end - self.started, 2) if self.started else None,
+            'tasks': tasks,
+        }
+
+    def status_frame(self):
+        """One row per task (for the debug panel)"""
+        rows = [{'task': name, 'stage': t['stage'], 'state': t['state'], 'ms': t['ms']}
+                for name, t in self.status()['tasks'].items()]
+        return pd.DataFrame(rows, columns=['task', 'stage', 'state', 'ms'])
+
+
+def disk_stages():
+    """On-disk artifacts every server process reads: stores, forecaster"""
+    from src.data_store import RAW_CSV_PATH, data_version
+
+    version = data_version(RAW_CSV_PATH)
+
+    def indicator_store():
+        from src.indicators import load_indicator_store
+        load_indicator_store()
+
+    def forecaster():
+        from src.forecasting import load_or_train
+        from src.indicators import YOUTH_UNEMPLOYMENT, load_indicator_store
+        from src.regions import add_region_columns
+
+        # Same frame the app trains on, so the artifact matches its data version
+        df = add_region_columns(load_indicator_store().wide([YOUTH_UNEMPLOYMENT], complete_grid=True))
+        load_or_train(df, version)
+
+    return [
+        [('indicator store', indicator_store)],
+        [('forecaster', forecaster)],
+    ]